@@ -0,0 +1,114 @@
+"""
+Synthetic load for the asyncio adapter: many concurrent clients humanizing durations.
+
+Every client sleeps for a random fraction of a millisecond, standing in for I/O,
+then humanizes a duration. Reports the event loop CPU time per call, over a run
+that only sleeps, and the latency of the humanize call itself.
+
+Run with ``python benchmarks/bench_aio.py [clients] [calls per client]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from readabledelta2 import Style, from_timedelta
+from readabledelta2.aio import DeltaBatcher, ahumanize
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+CLIENTS = 1000
+CALLS = 50
+
+
+def datasets(count: int) -> dict[str, list[timedelta]]:
+    """Request latencies in whole milliseconds, and unique microsecond values."""
+    rng = random.Random(0)
+    return {
+        "repeated": [
+            timedelta(milliseconds=int(rng.lognormvariate(5, 1.5)))
+            for _ in range(count)
+        ],
+        "distinct": [
+            timedelta(microseconds=rng.randrange(10**12)) for _ in range(count)
+        ],
+    }
+
+
+async def inline(delta: timedelta) -> str:
+    """Calling from_timedelta from the coroutine, the code being replaced."""
+    return from_timedelta(delta, Style.SHORT)
+
+
+async def load(
+    humanize: Callable[[timedelta], Awaitable[str]] | None,
+    deltas: list[timedelta],
+    clients: int,
+) -> tuple[float, list[int]]:
+    """Event loop CPU seconds, and the latency of every call in nanoseconds."""
+    latencies: list[int] = []
+    calls = len(deltas) // clients
+
+    async def client(offset: int) -> None:
+        rng = random.Random(offset)
+        for delta in deltas[offset : offset + calls]:
+            await asyncio.sleep(rng.random() / 1000)
+            if humanize is not None:
+                start = time.perf_counter_ns()
+                await humanize(delta)
+                latencies.append(time.perf_counter_ns() - start)
+
+    start = time.thread_time()
+    await asyncio.gather(*(client(i * calls) for i in range(clients)))
+    return time.thread_time() - start, latencies
+
+
+def main() -> None:
+    """Print the loop time per call and the call latency for each adapter."""
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTS
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else CALLS  # noqa: PLR2004
+    count = clients * calls
+    executor = ThreadPoolExecutor(1)
+    # a new adapter for every run, so none starts with the strings of the last.
+    adapters: dict[str, Callable[[], Callable[[timedelta], Awaitable[str]]]] = {
+        "from_timedelta": lambda: inline,
+        "ahumanize": lambda: lambda delta: ahumanize(delta, Style.SHORT),
+        "DeltaBatcher": lambda: DeltaBatcher(Style.SHORT).humanize,
+        "ahumanize(executor)": lambda: lambda delta: ahumanize(
+            delta, Style.SHORT, executor=executor
+        ),
+        "DeltaBatcher(window=1ms)": lambda: DeltaBatcher(
+            Style.SHORT, window=0.001
+        ).humanize,
+        "DeltaBatcher(executor)": lambda: DeltaBatcher(
+            Style.SHORT, executor=executor
+        ).humanize,
+    }
+
+    print(f"{clients} clients, {count} calls")
+    print(f"{'case':<36} {'loop/call':>10} {'p50':>9} {'p99':>9} {'max':>9}")
+    for data_name, deltas in datasets(count).items():
+        idle = min(asyncio.run(load(None, deltas, clients))[0] for _ in range(3))
+        for name, adapter in adapters.items():
+            runs = [asyncio.run(load(adapter(), deltas, clients)) for _ in range(3)]
+            cpu, latencies = min(runs, key=lambda run: run[0])
+            per_call = (cpu - idle) / count * 1e6
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{data_name + ', ' + name:<36} {per_call:>7.2f} µs"
+                f" {quantiles[49] / 1e3:>6.1f} µs {quantiles[98] / 1e3:>6.1f} µs"
+                f" {max(latencies) / 1e3:>6.0f} µs"
+            )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare what logging a duration costs when the level is disabled, and enabled.
+
+``eager`` renders the string before the call, ``lazy`` defers it to a `lazy`
+wrapper and ``filter``/``formatter`` pass the bare timedelta and let a
+`DeltaLogFilter` or `DeltaLogFormatter` render it. ``bare`` logs the timedelta
+without humanizing it, the floor for the others.
+
+Run with ``python benchmarks/bench_logging.py``.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import timeit
+from datetime import timedelta
+
+from readabledelta2 import Style, from_timedelta
+from readabledelta2.logging import DeltaLogFilter, DeltaLogFormatter, lazy
+
+NUMBER = 20000
+
+TD = timedelta(weeks=53, hours=1, minutes=1, microseconds=15)
+CASES = {
+    "bare": 'bare.{level}("took %s", TD)',
+    "eager": 'bare.{level}("took %s", from_timedelta(TD, Style.SHORT))',
+    "lazy": 'bare.{level}("took %s", lazy(TD, Style.SHORT))',
+    "filter": 'filtered.{level}("took %s", TD)',
+    "formatter": 'formatted.{level}("took %s", TD)',
+}
+
+
+def per_call(stmt: str, namespace: dict) -> float:
+    """Best of 5 runs, in nanoseconds per call."""
+    runs = timeit.repeat(stmt, globals=namespace, number=NUMBER, repeat=5)
+    return min(runs) / NUMBER * 1e9
+
+
+def logger(name: str, formatter: logging.Formatter) -> logging.Logger:
+    """An INFO logger writing to a throwaway stream."""
+    log = logging.getLogger(f"bench_logging.{name}")
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(formatter)
+    log.addHandler(handler)
+    return log
+
+
+def main() -> None:
+    """Print the per-call timings of every case, for DEBUG and INFO calls."""
+    plain = logging.Formatter("%(message)s")
+    filtered = logger("filtered", plain)
+    filtered.addFilter(DeltaLogFilter(style=Style.SHORT))
+    namespace = {
+        "TD": TD,
+        "Style": Style,
+        "from_timedelta": from_timedelta,
+        "lazy": lazy,
+        "bare": logger("bare", plain),
+        "filtered": filtered,
+        "formatted": logger(
+            "formatted", DeltaLogFormatter("%(message)s", delta_style=Style.SHORT)
+        ),
+    }
+
+    print(f"{'case':<12} {'disabled':>12} {'enabled':>12}")
+    for name, stmt in CASES.items():
+        disabled = per_call(stmt.format(level="debug"), namespace)
+        enabled = per_call(stmt.format(level="info"), namespace)
+        print(f"{name:<12} {disabled:>9.0f} ns {enabled:>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compare humanize_parallel against a from_microseconds loop as workers are added.
+
+Run with ``python benchmarks/bench_parallel.py [count]``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+from array import array
+
+from readabledelta2 import Style, from_microseconds
+from readabledelta2.parallel import humanize_parallel
+
+COUNT = 2_000_000
+
+
+def main() -> None:
+    """Print the wall time for each number of workers."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    rng = random.Random(0)
+    values = array("q", (rng.randint(-(10**12), 10**12) for _ in range(count)))
+
+    start = time.perf_counter()
+    [from_microseconds(value, Style.SHORT) for value in values]
+    serial = time.perf_counter() - start
+    print(f"{'loop':>10} {serial:>8.2f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        humanize_parallel(values, Style.SHORT, workers=workers)
+        took = time.perf_counter() - start
+        print(f"{workers:>3} worker {took:>8.2f}s {serial / took:>6.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare keeping split results as dicts against DeltaParts, in memory and speed.
+
+Run with ``python benchmarks/bench_parts.py [count]``.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2.readabledelta import (
+    split_relativedelta_units,
+    split_timedelta_units,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+COUNT = 200_000
+
+
+def measure(
+    split: Callable[..., object], deltas: list[Any], **kwargs: bool
+) -> tuple[float, float]:
+    """Bytes per kept result, and microseconds per call."""
+    start = time.perf_counter()
+    for delta in deltas:
+        split(delta, **kwargs)
+    took = time.perf_counter() - start
+
+    tracemalloc.start()
+    kept = [split(delta, **kwargs) for delta in deltas]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / len(deltas), took / len(deltas) * 1e6
+
+
+def main() -> None:
+    """Print memory and time per record for each split."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    rng = random.Random(0)
+    td = [timedelta(microseconds=rng.randrange(10**13)) for _ in range(count)]
+    rd = [
+        relativedelta(
+            years=rng.randrange(5), months=rng.randrange(12), days=rng.randrange(31)
+        )
+        for _ in range(count)
+    ]
+    cases: list[tuple[Callable[..., object], list[Any]]] = [
+        (split_timedelta_units, td),
+        (split_relativedelta_units, rd),
+    ]
+
+    print(f"{'case':<42} {'bytes':>7} {'time':>10}")
+    for split, deltas in cases:
+        for label, as_parts in (("dict", False), ("as_parts", True)):
+            size, took = measure(split, deltas, as_parts=as_parts)
+            name = f"{split.__name__}, {label}"
+            print(f"{name:<42} {size:>7.0f} {took:>7.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare humanize_threaded against a from_microseconds loop as threads are added.
+
+On free-threaded builds (python3.13t and later) the throughput should grow close
+to linearly with the threads, with the GIL the default of one thread should be
+no slower than the loop. The ``from_* in threads`` rows call the public functions
+from every thread, through the caches they share.
+
+Run with ``python benchmarks/bench_threads.py [count]``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import sysconfig
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from readabledelta2 import Style, from_microseconds
+from readabledelta2.parallel import humanize_threaded
+
+COUNT = 1_000_000
+
+
+def loop(values: array[int]) -> list[str]:
+    """The loop humanize_threaded replaces."""
+    return [from_microseconds(value, Style.SHORT) for value in values]
+
+
+def main() -> None:
+    """Print the throughput for each number of threads."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    rng = random.Random(0)
+    values = array("q", (rng.randint(-(10**12), 10**12) for _ in range(count)))
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    build = "free-threaded" if sysconfig.get_config_var("Py_GIL_DISABLED") else "GIL"
+    print(f"Python {sys.version.split()[0]}, {build} build, GIL enabled: {gil}")
+
+    start = time.perf_counter()
+    loop(values)
+    serial = time.perf_counter() - start
+    print(f"{'loop':<24} {count / serial / 1e6:>6.2f} M/s")
+
+    start = time.perf_counter()
+    humanize_threaded(values, Style.SHORT)
+    took = time.perf_counter() - start
+    print(f"{'default':<24} {count / took / 1e6:>6.2f} M/s {serial / took:>6.2f}x")
+
+    threads = 1
+    while threads <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        humanize_threaded(values, Style.SHORT, max_workers=threads)
+        took = time.perf_counter() - start
+        name = f"{threads} threads"
+        print(f"{name:<24} {count / took / 1e6:>6.2f} M/s {serial / took:>6.2f}x")
+
+        size = -(-count // threads)
+        chunks = [values[i : i + size] for i in range(0, count, size)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(loop, chunks))
+        took = time.perf_counter() - start
+        name = f"from_* in {threads} threads"
+        print(f"{name:<24} {count / took / 1e6:>6.2f} M/s {serial / took:>6.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
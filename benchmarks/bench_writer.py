@@ -0,0 +1,84 @@
+"""
+Compare the output rate of write_many against writing from_timedelta per record.
+
+Run with ``python benchmarks/bench_writer.py``.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import time
+from datetime import timedelta
+from typing import IO, TYPE_CHECKING, Any
+
+from readabledelta2 import Style, from_timedelta
+from readabledelta2.writer import write_many
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+RECORDS = 200_000
+REPEAT = 3
+
+
+def datasets() -> dict[str, list[timedelta]]:
+    """Request latencies in whole milliseconds, and unique microsecond values."""
+    rng = random.Random(0)
+    return {
+        "repeated": [
+            timedelta(milliseconds=int(rng.lognormvariate(5, 1.5)))
+            for _ in range(RECORDS)
+        ],
+        "distinct": [
+            timedelta(microseconds=rng.randrange(10**12)) for _ in range(RECORDS)
+        ],
+    }
+
+
+def per_record(stream: IO[Any], deltas: list[timedelta], style: Style) -> int:
+    """The loop write_many replaces."""
+    written = 0
+    if isinstance(stream, io.BytesIO):
+        for delta in deltas:
+            written += stream.write((from_timedelta(delta, style) + "\n").encode())
+    else:
+        for delta in deltas:
+            written += stream.write(from_timedelta(delta, style) + "\n")
+    return written
+
+
+def rate(
+    func: Callable[[IO[Any], list[timedelta], Style], int],
+    stream_type: type[IO[Any]],
+    deltas: list[timedelta],
+    style: Style,
+) -> float:
+    """Best of REPEAT runs, in MB per second."""
+    best = float("inf")
+    written = 0
+    for _ in range(REPEAT):
+        stream = stream_type()
+        start = time.perf_counter()
+        written = func(stream, deltas, style)
+        best = min(best, time.perf_counter() - start)
+    return written / best / 1e6
+
+
+def main() -> None:
+    """Print MB/s for every dataset, stream type and style."""
+    print(f"{'case':<34} {'per record':>12} {'write_many':>12} {'speedup':>8}")
+    for data_name, deltas in datasets().items():
+        for stream_type in (io.StringIO, io.BytesIO):
+            for style in (Style.NORMAL, Style.ABBREV):
+                name = f"{data_name}, {stream_type.__name__}, {style.value}"
+                loop = rate(per_record, stream_type, deltas, style)
+                many = rate(write_many, stream_type, deltas, style)
+                print(
+                    f"{name:<34} {loop:>7.1f} MB/s {many:>7.1f} MB/s"
+                    f" {many / loop:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Benchmark the public entry points and check them against a JSON baseline.
+
+Run ``make bench`` to compare against ``benchmarks/baseline.json``. It fails when
+any case is slower than the baseline by more than ``BENCH_THRESHOLD`` percent
+(10 by default). Run ``make bench-baseline`` to record a new baseline.
+
+Timings depend on the machine and the Python version. Record the baseline on the
+machine that runs the comparison::
+
+    python benchmarks/suite.py --save
+    python benchmarks/suite.py --threshold 15 --filter from_timedelta
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import (
+    RDUnit,
+    Style,
+    TDUnit,
+    from_datetimes,
+    from_relativedelta,
+    from_template,
+    from_timedelta,
+    to_relativedelta,
+    to_timedelta,
+)
+from readabledelta2.readabledelta import (
+    extract_units,
+    sort_units,
+    split_relativedelta_units,
+    split_timedelta_units,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BASELINE = Path(__file__).with_name("baseline.json")
+NUMBER = 1000
+REPEAT = 9
+
+TD_DELTAS = {
+    "zero": timedelta(0),
+    "small": timedelta(seconds=42, microseconds=17),
+    "large": timedelta(days=3660, hours=5, minutes=6, seconds=7, microseconds=8),
+    "negative": -timedelta(days=9, hours=3, minutes=2, milliseconds=1),
+}
+RD_DELTAS = {
+    "zero": relativedelta(),
+    "small": relativedelta(seconds=42, microseconds=17),
+    "large": relativedelta(years=10, months=2, days=20, hours=5, minutes=6, seconds=7),
+    "negative": relativedelta(months=-2, days=-9, hours=-3, minutes=-2),
+}
+# start and end, the end is the start moved by the matching RD_DELTAS entry.
+START = datetime(2021, 1, 31, 10, 5)
+DT_PAIRS = {name: (START, START + delta) for name, delta in RD_DELTAS.items()}
+TD_UNITS = {
+    "default": None,
+    "custom": (TDUnit.DAYS, TDUnit.HOURS, TDUnit.MINUTES),
+}
+RD_UNITS = {
+    "default": None,
+    "custom": (RDUnit.MONTHS, RDUnit.DAYS, RDUnit.HOURS),
+}
+TEMPLATES = {
+    "clock": "{h}:{m:02}:{s:02}",
+    "labels": "[{D} {D!n} ]{h}h{m:02}m",
+}
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Every benchmark case, keyed on a stable name."""
+    found: dict[str, Callable[[], object]] = {}
+    formatters: list[tuple[Callable[..., str], dict[str, Any], dict[str, Any]]] = [
+        (from_timedelta, TD_DELTAS, TD_UNITS),
+        (from_relativedelta, RD_DELTAS, RD_UNITS),
+    ]
+    for func, deltas, units in formatters:
+        for style in Style:
+            for delta_name, delta in deltas.items():
+                for units_name, unit_set in units.items():
+                    for showzero in (False, True):
+                        name = (
+                            f"{func.__name__}[{style.value}-{delta_name}-{units_name}"
+                        )
+                        name += "-showzero]" if showzero else "]"
+                        found[name] = functools.partial(
+                            func, delta, style, unit_set, showzero=showzero
+                        )
+
+    for func, deltas, _ in formatters:
+        for style in Style:
+            for delta_name in ("large", "negative"):
+                name = f"{func.__name__}[{style.value}-{delta_name}-max_units2]"
+                found[name] = functools.partial(
+                    func, deltas[delta_name], style, max_units=2
+                )
+
+    for style in Style:
+        for pair_name, (start, end) in DT_PAIRS.items():
+            for units_name, unit_set in RD_UNITS.items():
+                name = f"from_datetimes[{style.value}-{pair_name}-{units_name}]"
+                found[name] = functools.partial(
+                    from_datetimes, start, end, style, unit_set
+                )
+
+    for delta_name, delta in TD_DELTAS.items():
+        for template_name, template in TEMPLATES.items():
+            name = f"from_template[{template_name}-{delta_name}]"
+            found[name] = functools.partial(from_template, delta, template)
+
+    parsers: list[tuple[Callable[..., object], Callable[..., str], dict[str, Any]]] = [
+        (to_timedelta, from_timedelta, TD_DELTAS),
+        (to_relativedelta, from_relativedelta, RD_DELTAS),
+    ]
+    for parse, render, deltas in parsers:
+        for style in Style:
+            for delta_name, delta in deltas.items():
+                name = f"{parse.__name__}[{style.value}-{delta_name}]"
+                found[name] = functools.partial(parse, render(delta, style))
+
+    splitters: list[tuple[Callable[..., object], dict[str, Any], dict[str, Any]]] = [
+        (split_timedelta_units, TD_DELTAS, TD_UNITS),
+        (split_relativedelta_units, RD_DELTAS, RD_UNITS),
+        (extract_units, TD_DELTAS, TD_UNITS),
+    ]
+    for split, deltas, units in splitters:
+        for delta_name, delta in deltas.items():
+            for units_name, unit_set in units.items():
+                name = f"{split.__name__}[{delta_name}-{units_name}]"
+                if unit_set is None:
+                    found[name] = functools.partial(split, delta)
+                else:
+                    found[name] = functools.partial(split, delta, unit_set)
+
+    for split, deltas, units in splitters[:2]:
+        for delta_name, delta in deltas.items():
+            for units_name, unit_set in units.items():
+                name = f"{split.__name__}[{delta_name}-{units_name}-as_parts]"
+                if unit_set is None:
+                    found[name] = functools.partial(split, delta, as_parts=True)
+                else:
+                    found[name] = functools.partial(
+                        split, delta, unit_set, as_parts=True
+                    )
+
+    unsorted: dict[str, tuple[str, ...]] = {
+        "td": tuple(reversed(TDUnit)),
+        "rd": tuple(reversed(RDUnit)),
+        "str": ("seconds", "years", "hours"),
+    }
+    for name, units_to_sort in unsorted.items():
+        found[f"sort_units[{name}]"] = functools.partial(sort_units, units_to_sort)
+    return found
+
+
+def run(names: list[str], number: int) -> dict[str, float]:
+    """
+    Time the named cases, in microseconds per call.
+
+    The cases are timed in REPEAT interleaved rounds and each keeps its best
+    round, so a slow patch on the machine does not land on just a few cases.
+    """
+    selected = {name: func for name, func in cases().items() if name in names}
+    best = dict.fromkeys(selected, float("inf"))
+    for _ in range(REPEAT):
+        for name, func in selected.items():
+            best[name] = min(best[name], timeit.timeit(func, number=number))
+    return {name: seconds / number * 1e6 for name, seconds in best.items()}
+
+
+def regressed(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Names of the cases more than threshold percent slower than the baseline."""
+    return [
+        name
+        for name, now in results.items()
+        if name in baseline
+        and (now - baseline[name]) / baseline[name] * 100 > threshold
+    ]
+
+
+def report(
+    results: dict[str, float], baseline: dict[str, float], regressions: list[str]
+) -> None:
+    """Print results next to the baseline."""
+    print(f"{'case':<60} {'now':>9} {'baseline':>9} {'change':>8}")
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<60} {now:>7.2f}us {'new':>9}")
+            continue
+        change = (now - before) / before * 100
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<60} {now:>7.2f}us {before:>7.2f}us {change:>+7.1f}%{flag}")
+
+
+def environment() -> dict[str, str]:
+    """What the timings were measured on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite, then save or compare against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="record the results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="allowed slowdown in percent before a case counts as a regression",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run cases containing this text"
+    )
+    parser.add_argument("--number", type=int, default=NUMBER)
+    args = parser.parse_args(argv)
+    names = [name for name in cases() if args.filter in name]
+
+    if args.save:
+        results = run(names, args.number)
+        data = {**environment(), "number": args.number, "results": results}
+        args.baseline.write_text(json.dumps(data, indent=2) + "\n")
+        print(f"saved {len(results)} cases to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, record one with --save")
+        return 2
+    data = json.loads(args.baseline.read_text())
+    recorded = {key: data.get(key) for key in environment()}
+    if recorded != environment():
+        print(f"warning: baseline was recorded on {recorded}, not {environment()}")
+
+    baseline = data["results"]
+    results = run(names, args.number)
+    # time suspects again before blaming them, timings on busy machines are noisy.
+    suspects = regressed(results, baseline, args.threshold)
+    if suspects:
+        retry = run(suspects, args.number)
+        results.update({name: min(results[name], retry[name]) for name in suspects})
+    regressions = regressed(results, baseline, args.threshold)
+    report(results, baseline, regressions)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold}%")
+        return 1
+    print(f"{len(results)} case(s) within {args.threshold}% of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
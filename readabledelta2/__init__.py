@@ -5,12 +5,80 @@ Readabledelta2.
 :license: MIT, see LICENSE for more details.
 """
 
-from .readabledelta import RDUnit, Style, TDUnit, from_relativedelta, from_timedelta
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from .readabledelta import (
+    DeltaFormatter,
+    DeltaParts,
+    RDUnit,
+    Style,
+    TDUnit,
+    UnitSet,
+    from_datetimes,
+    from_microseconds,
+    from_relativedelta,
+    from_seconds,
+    from_timedelta,
+)
+
+if TYPE_CHECKING:
+    # imported on first access instead, see ``__getattr__`` below.
+    from .parser import (
+        DeltaParser,
+        to_relativedelta,
+        to_relativedelta_many,
+        to_timedelta,
+        to_timedelta_many,
+    )
+    from .template import DeltaTemplate, from_template
 
 __all__ = (
-    "from_relativedelta",
-    "from_timedelta",
+    "DeltaFormatter",
+    "DeltaParser",
+    "DeltaParts",
+    "DeltaTemplate",
+    "RDUnit",
     "Style",
     "TDUnit",
-    "RDUnit",
+    "UnitSet",
+    "from_datetimes",
+    "from_microseconds",
+    "from_relativedelta",
+    "from_seconds",
+    "from_template",
+    "from_timedelta",
+    "to_relativedelta",
+    "to_relativedelta_many",
+    "to_timedelta",
+    "to_timedelta_many",
 )
+
+# names exported from the parser and template modules, which compile their
+# regular expressions on import, to the module they come from.
+_LAZY = {
+    "DeltaParser": "parser",
+    "to_relativedelta": "parser",
+    "to_relativedelta_many": "parser",
+    "to_timedelta": "parser",
+    "to_timedelta_many": "parser",
+    "DeltaTemplate": "template",
+    "from_template": "template",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the parser or the template module on first use of their names."""
+    module = _LAZY.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,17 @@
+"""Entry point for ``python -m readabledelta2``, see ``readabledelta2.cli``."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # the reader went away (e.g. piped into head), stop without a traceback.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,334 @@
+"""
+Humanize durations from asyncio code, in micro-batches given an executor.
+
+Services that render a duration for every request can await it instead::
+
+    >>> await ahumanize(elapsed, Style.SHORT)
+    '1 min and 30 secs'
+
+Every set of options gets a `DeltaBatcher`, which builds the formatter once and
+remembers the strings it rendered, so a repeated value returns without
+suspending the caller.
+
+Given an ``executor``, the other calls that arrive within ``window`` seconds of
+the first one, or during the same iteration of the event loop for the default
+window of 0, are rendered together off the event loop and their futures are
+resolved in one go. Batches are closed early at ``max_batch`` calls, so a call
+waits at most ``window`` seconds, plus a loop iteration, plus the time its batch
+takes to render.
+
+Without an executor or a window, which is the default, the values are rendered
+right away instead. Batching them on the loop costs it more than it saves:
+suspending and waking every caller takes longer than rendering its string, about
+twice the loop time per call for distinct values in ``benchmarks/bench_aio.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import operator
+import weakref
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from . import readabledelta
+from .locales import DEFAULT_LOCALE
+from .readabledelta import (
+    Style,
+    UnitSet,
+    _format_duration,
+    _formatter,
+    _Memo,
+    _timedelta_options,
+    _timedelta_unitset,
+)
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Future, Handle
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable
+    from concurrent.futures import Executor
+
+    from .readabledelta import TDUnit
+
+# seconds a batch stays open after its first call, 0 for one loop iteration.
+WINDOW = 0.0
+# calls rendered together at most.
+MAX_BATCH = 1024
+# option sets ahumanize keeps a batcher for on each loop, cleared when full.
+BATCHERS_SIZE = 256
+
+
+def _render(options: tuple[Any, ...], deltas: list[timedelta | int]) -> list[str]:
+    """Render a batch, each distinct value only once."""
+    render = functools.partial(_format_duration, _formatter(*options))
+    return list(map(_Memo(render).__getitem__, deltas))
+
+
+class DeltaBatcher:
+    """
+    Render durations awaited on an event loop, in micro-batches given an executor.
+
+    The options are validated and the formatter is built once, when the batcher
+    is created. Values can be timedeltas or integer microseconds, as in
+    ``from_microseconds``. Rendered strings are remembered, up to ``MEMO_SIZE``
+    distinct values, and returned straight away when the value comes again.
+
+    Values that have to be rendered are batched when there is an executor or a
+    window, and rendered on the spot otherwise, see the module docstring.
+
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param window: seconds a batch stays open after its first call, 0 for the
+            current iteration of the event loop
+    :param max_batch: number of calls that closes a batch early
+    :param executor: optional ``concurrent.futures`` executor the batches are
+            rendered in, instead of on the event loop
+    """
+
+    def __init__(
+        self,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+        window: float = WINDOW,
+        max_batch: int = MAX_BATCH,
+        executor: Executor | None = None,
+    ) -> None:
+        if window < 0:
+            msg = f"window must not be negative, not {window}"
+            raise ValueError(msg)
+        if max_batch < 1:
+            msg = f"max_batch must be at least 1, not {max_batch}"
+            raise ValueError(msg)
+        options = _timedelta_options(
+            style, units, include_sign, showzero, locale, max_units
+        )
+        formatter = _formatter(*options)
+        if formatter._td_error:
+            raise ValueError(formatter._td_error)
+
+        self.window = window
+        self.max_batch = max_batch
+        self.executor = executor
+        self._options = options
+        self._loop: AbstractEventLoop | None = None
+        self._handle: Handle | None = None
+        self._deltas: list[timedelta | int] = []
+        self._futures: list[Future[str]] = []
+        self._memo: _Memo[timedelta | int, str] = _Memo(
+            functools.partial(_format_duration, formatter)
+        )
+
+    async def humanize(self, delta: timedelta | int) -> str:
+        """Create Human readable string for a timedelta or microseconds."""
+        if not isinstance(delta, timedelta):
+            operator.index(delta)
+        if self.executor is None and not self.window:
+            return self._memo[delta]
+        text = self._memo.get(delta)
+        if text is not None:
+            return text
+
+        loop = asyncio.get_running_loop()
+        if not self._futures:
+            self._loop = loop
+            if self.window:
+                self._handle = loop.call_later(self.window, self.flush)
+            else:
+                self._handle = loop.call_soon(self.flush)
+        elif loop is not self._loop:
+            msg = "DeltaBatcher is already in use by another event loop"
+            raise RuntimeError(msg)
+
+        future: Future[str] = loop.create_future()
+        self._deltas.append(delta)
+        self._futures.append(future)
+        if len(self._futures) >= self.max_batch:
+            self.flush()
+        return await future
+
+    def flush(self) -> None:
+        """Render the open batch now."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        deltas, futures = self._deltas, self._futures
+        if not futures:
+            return
+        self._deltas, self._futures = [], []
+
+        if self.executor is not None:
+            loop = futures[0].get_loop()
+            try:
+                done = loop.run_in_executor(
+                    self.executor, _render, self._options, deltas
+                )
+            except Exception as error:  # noqa: BLE001
+                # e.g. the executor was shut down, fail the batch with it.
+                done = loop.create_future()
+                done.set_exception(error)
+            done.add_done_callback(
+                lambda done: self._settle(deltas, futures, done.result)
+            )
+            return
+        self._settle(deltas, futures, lambda: _render(self._options, deltas))
+
+    def _settle(
+        self,
+        deltas: list[timedelta | int],
+        futures: list[Future[str]],
+        result: Callable[[], list[str]],
+    ) -> None:
+        """Resolve the futures of a batch, and remember the strings."""
+        try:
+            texts = result()
+        except asyncio.CancelledError:
+            # the executor dropped the batch, e.g. shut down with cancel_futures.
+            for future in futures:
+                future.cancel()
+            return
+        except Exception as error:  # noqa: BLE001
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        memo = self._memo
+        if len(memo) + len(texts) > readabledelta.MEMO_SIZE:
+            memo.clear()
+        for delta, future, text in zip(deltas, futures, texts, strict=True):
+            memo[delta] = text
+            if not future.done():
+                future.set_result(text)
+
+
+_batchers: weakref.WeakKeyDictionary[
+    AbstractEventLoop, dict[Hashable, DeltaBatcher]
+] = weakref.WeakKeyDictionary()
+
+
+async def ahumanize(
+    delta: timedelta | int,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    executor: Executor | None = None,
+) -> str:
+    """
+    Create Human readable string for a timedelta, batched given an executor.
+
+    Same output as ``from_timedelta``, or ``from_microseconds`` for integers.
+    Each event loop keeps a `DeltaBatcher` per set of options and executor,
+    with the default window and batch size. Without an executor the value is
+    rendered on the loop right away, a batch there would cost it more than the
+    rendering it saves.
+
+    :param delta: timedelta or integer microseconds
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param executor: optional ``concurrent.futures`` executor the batches are
+            rendered in
+    """
+    loop = asyncio.get_running_loop()
+    batchers = _batchers.get(loop)
+    if batchers is None:
+        batchers = _batchers[loop] = {}
+    if units is not None and not isinstance(units, (tuple, UnitSet)):
+        units = _timedelta_unitset(units)
+    # keyed on the units as given, converting them costs more than the lookup.
+    key = (style, units, include_sign, showzero, locale, max_units, executor)
+    batcher = batchers.get(key)
+    if batcher is None:
+        if len(batchers) >= BATCHERS_SIZE:
+            # open batches stay scheduled, dropping them here loses nothing.
+            batchers.clear()
+        batcher = batchers[key] = DeltaBatcher(
+            style,
+            units,
+            include_sign=include_sign,
+            showzero=showzero,
+            locale=locale,
+            max_units=max_units,
+            executor=executor,
+        )
+    return await batcher.humanize(delta)
+
+
+async def ahumanize_iter(
+    deltas: AsyncIterable[timedelta | int],
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    executor: Executor | None = None,
+    batch_size: int = MAX_BATCH,
+) -> AsyncIterator[str]:
+    """
+    Humanize an async stream of timedeltas or integer microseconds, in order.
+
+    The options are validated once. Without an executor every value is
+    rendered as soon as it arrives, each distinct value only once. With an
+    executor the values are collected into batches of ``batch_size``, or up to
+    the end of the stream, and each batch is rendered in the executor.
+
+    :param deltas: async iterable of timedeltas or integer microseconds
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param executor: optional ``concurrent.futures`` executor for the batches
+    :param batch_size: values per batch handed to the executor
+    """
+    if batch_size < 1:
+        msg = f"batch_size must be at least 1, not {batch_size}"
+        raise ValueError(msg)
+    options = _timedelta_options(
+        style, units, include_sign, showzero, locale, max_units
+    )
+    formatter = _formatter(*options)
+    if formatter._td_error:
+        raise ValueError(formatter._td_error)
+
+    if executor is None:
+        memo = _Memo(functools.partial(_format_duration, formatter))
+        async for delta in deltas:
+            if not isinstance(delta, timedelta):
+                operator.index(delta)
+            yield memo[delta]
+        return
+
+    loop = asyncio.get_running_loop()
+    batch: list[timedelta | int] = []
+    async for delta in deltas:
+        if not isinstance(delta, timedelta):
+            operator.index(delta)
+        batch.append(delta)
+        if len(batch) >= batch_size:
+            for text in await loop.run_in_executor(executor, _render, options, batch):
+                yield text
+            batch = []
+    if batch:
+        for text in await loop.run_in_executor(executor, _render, options, batch):
+            yield text
@@ -0,0 +1,125 @@
+"""
+readabledelta for Apache Arrow duration arrays.
+
+Requires pyarrow, install with ``pip install readabledelta2[arrow]``::
+
+    >>> from readabledelta2.arrow import from_duration_array
+    >>> from_duration_array(pa.array([90, None], pa.duration("s")))
+    <pyarrow.lib.StringArray object at ...>
+    [
+      "1 minute and 30 seconds",
+      null
+    ]
+
+The values are read straight from the Arrow buffers without copying them.
+Durations finer than microseconds are floored to whole microseconds, the same
+as ``readabledelta2.vectorized``, so every result matches ``from_timedelta``
+on the floored value.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import Style, _formatter, _timedelta_options
+
+try:
+    import pyarrow as pa
+except ImportError as exc:  # pragma: no cover
+    msg = (
+        "readabledelta2.arrow requires pyarrow, "
+        "install it with `pip install readabledelta2[arrow]`"
+    )
+    raise ImportError(msg) from exc
+
+if TYPE_CHECKING:
+    from .readabledelta import DeltaFormatter, TDUnit, UnitSet
+
+# nanoseconds are floored, the others are scaled up
+_UNIT_SCALE = {"s": 1000000, "ms": 1000, "us": 1, "ns": 1}
+
+
+def _render_chunk(
+    arr: pa.Array, formatter: DeltaFormatter, *, dictionary: bool
+) -> pa.Array:
+    """Render one duration array, nulls stay null."""
+    unit = arr.type.unit
+    scale = _UNIT_SCALE[unit]
+    offset = arr.offset
+    validity, data = arr.buffers()
+    values = memoryview(data).cast("q")[offset : offset + len(arr)]
+    bitmap = memoryview(validity) if validity is not None and arr.null_count else None
+
+    # index of each value's string in uniques, None for nulls. Not a bounded
+    # memo, uniques keeps every distinct string for the dictionary anyway.
+    seen: dict[int, int] = {}
+    uniques: list[str] = []
+    indices: list[int | None] = []
+    for bit, value in enumerate(values, offset):
+        if bitmap is not None and not bitmap[bit >> 3] >> (bit & 7) & 1:
+            indices.append(None)
+            continue
+        index = seen.get(value)
+        if index is None:
+            total = value // 1000 if unit == "ns" else value * scale
+            index = seen[value] = len(uniques)
+            uniques.append(formatter.format_microseconds(total))
+        indices.append(index)
+    values.release()
+
+    if dictionary:
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, pa.int32()), pa.array(uniques, pa.string())
+        )
+    return pa.array(
+        [None if index is None else uniques[index] for index in indices], pa.string()
+    )
+
+
+def from_duration_array(
+    arr: pa.Array | pa.ChunkedArray,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    dictionary: bool = False,
+) -> pa.Array | pa.ChunkedArray:
+    """
+    Create Human readable strings for an Arrow duration array.
+
+    Each distinct value is rendered once. Chunked arrays come back chunked the
+    same way.
+
+    :param arr: array of any duration unit
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    :param dictionary: return a dictionary encoded array instead of strings
+    """
+    if not pa.types.is_duration(arr.type):
+        msg = f"expected a duration array, not {arr.type}"
+        raise TypeError(msg)
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+
+    if isinstance(arr, pa.ChunkedArray):
+        value_type = (
+            pa.dictionary(pa.int32(), pa.string()) if dictionary else pa.string()
+        )
+        return pa.chunked_array(
+            [
+                _render_chunk(chunk, formatter, dictionary=dictionary)
+                for chunk in arr.chunks
+            ],
+            value_type,
+        )
+    return _render_chunk(arr, formatter, dictionary=dictionary)
@@ -0,0 +1,176 @@
+"""
+Opt-in LRU cache for rendered strings.
+
+Dashboards tend to render the same durations over and over. ``DeltaCache``
+remembers the strings for the most recently used deltas and formatting options::
+
+    >>> cache = DeltaCache(maxsize=10000, resolution=timedelta(seconds=1))
+    >>> cache.from_timedelta(delta, Style.SHORT)
+    >>> cache.cache_info()
+    CacheInfo(hits=..., misses=..., evictions=..., maxsize=10000, currsize=...)
+
+It is safe to share one cache between threads.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import Style, _formatter, _relativedelta_unitset, _timedelta_unitset
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+    from datetime import datetime
+
+    from dateutil.relativedelta import relativedelta
+
+    from .readabledelta import RDUnit, TDUnit, UnitSet
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class DeltaCache:
+    """
+    Bounded LRU cache around `from_timedelta` and `from_relativedelta`.
+
+    Entries are keyed on the delta plus the formatting options. Timedeltas are
+    keyed on their total microseconds, so equal deltas built differently share
+    an entry.
+
+    Leftovers below the smallest requested unit are always rendered, so two
+    timedeltas only produce the same string when they are equal. Pass a
+    ``resolution`` to truncate timedeltas (toward zero) to a multiple of it
+    before they are keyed and rendered; deltas that differ by less than the
+    resolution then share an entry. Relativedeltas are never truncated.
+
+    :param int maxsize: number of strings to keep before evicting the least
+            recently used one
+    :param resolution: optional quantum timedeltas are truncated to
+    """
+
+    def __init__(
+        self, maxsize: int = 4096, *, resolution: timedelta | None = None
+    ) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be at least 1, not {maxsize}"
+            raise ValueError(msg)
+        quantum = 1
+        if resolution is not None:
+            quantum = resolution // timedelta(microseconds=1)
+            if quantum < 1:
+                msg = f"resolution must be at least 1 microsecond, not {resolution}"
+                raise ValueError(msg)
+
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self._quantum = quantum
+        self._data: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get(self, key: Hashable, render: Callable[[], str]) -> str:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+
+        # render outside the lock; a racing thread may render the same key too.
+        value = render()
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def from_timedelta(
+        self,
+        delta: timedelta,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> str:
+        """Cached `from_timedelta`, truncated to the cache resolution."""
+        if not isinstance(delta, timedelta):
+            msg = f"expected timedelta, not {type(delta).__name__}"
+            raise TypeError(msg)
+        mask = _timedelta_unitset(units)
+        total = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        if self._quantum > 1:
+            truncated = abs(total) // self._quantum * self._quantum
+            total = -truncated if total < 0 else truncated
+
+        def render() -> str:
+            formatter = _formatter(
+                style, mask, include_sign, showzero, None, locale, max_units
+            )
+            return formatter.format_microseconds(total)
+
+        return self._get(
+            (timedelta, total, style, mask, include_sign, showzero, locale, max_units),
+            render,
+        )
+
+    def from_relativedelta(
+        self,
+        delta: relativedelta,
+        style: Style = Style.NORMAL,
+        units: tuple[RDUnit | str, ...] | UnitSet | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        anchor: datetime | None = None,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> str:
+        """Cached `from_relativedelta`."""
+        mask = _relativedelta_unitset(units)
+
+        def render() -> str:
+            formatter = _formatter(
+                style, mask, include_sign, showzero, anchor, locale, max_units
+            )
+            return formatter.format_relativedelta(delta)
+
+        key = (type(delta), delta, style, mask, include_sign, showzero, anchor)
+        return self._get((*key, locale, max_units), render)
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._data),
+            )
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,355 @@
+r"""
+Command line humanizer, run with ``python -m readabledelta2``.
+
+Reads one duration per line from stdin and writes the human readable form to
+stdout::
+
+    $ printf '90\n3600.5\n' | python -m readabledelta2 --style short
+    1 min and 30 secs
+    1 hr and 500 msecs
+
+With ``--pattern`` only the matched field of each line is replaced, the rest of
+the line (and lines without a match) pass through untouched::
+
+    $ python -m readabledelta2 -f microseconds -p 'took=(\d+)us' < app.log
+
+``--packed durations.bin`` reads raw little-endian int64 microseconds from a
+memory mapped file instead of lines from stdin.
+
+Input is streamed and output is written in large batches, so memory stays
+bounded whatever the size of the input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import re
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from .locales import DEFAULT_LOCALE, available_locales
+from .packed import humanize_packed, map_packed
+from .readabledelta import DeltaFormatter, Style, TDUnit, seconds_to_microseconds
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import TextIO
+
+# lines collected before each write to stdout
+BATCH_SIZE = 4096
+
+# str(timedelta), e.g. "0:01:30", "371 days, 1:01:00" or "-1 day, 23:59:59.500000"
+TIMEDELTA_RE = re.compile(
+    r"(?:(-?\d+) days?, )?(\d+):(\d{2}):(\d{2})(?:\.(\d{6}))?", re.ASCII
+)
+
+
+class ParseError(ValueError):
+    """A value that could not be read as a duration."""
+
+
+class _Skip(Exception):
+    """Drop the line being humanized, raised from inside ``re.sub``."""
+
+
+def parse_seconds(text: str) -> int:
+    """Parse integer or float seconds to microseconds."""
+    try:
+        return int(text) * 1000000
+    except ValueError:
+        pass
+    try:
+        return seconds_to_microseconds(float(text))
+    except (ValueError, OverflowError):
+        msg = f"cannot parse {text!r} as seconds"
+        raise ParseError(msg) from None
+
+
+def parse_microseconds(text: str) -> int:
+    """Parse integer microseconds."""
+    try:
+        return int(text)
+    except ValueError:
+        msg = f"cannot parse {text!r} as microseconds"
+        raise ParseError(msg) from None
+
+
+def parse_timedelta(text: str) -> int:
+    """Parse the ``str(timedelta)`` form to microseconds."""
+    match = TIMEDELTA_RE.fullmatch(text.strip())
+    if match is None:
+        msg = f"cannot parse {text!r} as a timedelta"
+        raise ParseError(msg)
+    days, hours, minutes, seconds, micro = match.groups()
+    total = (int(days or 0) * 24 + int(hours)) * 60 + int(minutes)
+    return (total * 60 + int(seconds)) * 1000000 + int(micro or 0)
+
+
+PARSERS: dict[str, Callable[[str], int]] = {
+    "seconds": parse_seconds,
+    "microseconds": parse_microseconds,
+    "timedelta": parse_timedelta,
+}
+
+
+class Stats:
+    """Counters for ``--stats``."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.values = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+
+    def report(self, stream: TextIO) -> None:
+        """Write a one line summary of the run."""
+        elapsed = time.perf_counter() - self.start
+        rate = self.lines / elapsed if elapsed else 0.0
+        stream.write(
+            f"readabledelta2: {self.lines} lines, {self.values} values, "
+            f"{self.errors} errors in {elapsed:.3f}s ({rate:,.0f} lines/s)\n"
+        )
+
+
+class Humanizer:
+    """
+    Turn lines of input into lines of output.
+
+    :param formatter: formats the parsed microseconds
+    :param parse: turns the text of a value into microseconds
+    :param pattern: only replace this field of each line; the named group
+            ``delta``, else the first group, else the whole match
+    :param on_error: ``fail`` raises ParseError, ``keep`` leaves the value as it
+            was and ``skip`` drops the line
+    """
+
+    def __init__(
+        self,
+        formatter: DeltaFormatter,
+        parse: Callable[[str], int],
+        pattern: re.Pattern[str] | None = None,
+        on_error: str = "fail",
+        stats: Stats | None = None,
+    ) -> None:
+        self.formatter = formatter
+        self.parse = parse
+        self.pattern = pattern
+        self.on_error = on_error
+        self.stats = stats or Stats()
+        self._group: int | str = 0
+        if pattern is not None and pattern.groups:
+            self._group = "delta" if "delta" in pattern.groupindex else 1
+
+    def _render(self, text: str) -> str:
+        total = self.parse(text)
+        self.stats.values += 1
+        return self.formatter.format_microseconds(total)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        try:
+            rendered = self._render(match[self._group])
+        except ParseError:
+            self.stats.errors += 1
+            if self.on_error == "fail":
+                raise
+            if self.on_error == "skip":
+                raise _Skip from None
+            return match[0]
+        start, end = match.span(self._group)
+        offset = match.start()
+        whole = match[0]
+        return whole[: start - offset] + rendered + whole[end - offset :]
+
+    def line(self, line: str) -> str | None:
+        """Humanize one line (with or without its newline), None to drop it."""
+        self.stats.lines += 1
+        if self.pattern is not None:
+            try:
+                return self.pattern.sub(self._replace, line)
+            except _Skip:
+                return None
+
+        text = line.rstrip("\r\n")
+        try:
+            return self._render(text) + line[len(text) :]
+        except ParseError:
+            self.stats.errors += 1
+            if self.on_error == "skip":
+                return None
+            if self.on_error == "keep":
+                return line
+            raise
+
+    def lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Humanize every line, dropping the skipped ones."""
+        for line in lines:
+            result = self.line(line)
+            if result is not None:
+                yield result
+
+
+def count(values: Iterable[str], stats: Stats) -> Iterator[str]:
+    """Count values (and lines) for ``--stats`` as they go by."""
+    for value in values:
+        stats.lines += 1
+        stats.values += 1
+        yield value
+
+
+def write_lines(lines: Iterable[str], out: TextIO) -> None:
+    """Write lines in large batches, adding newlines where they are missing."""
+    batch: list[str] = []
+    try:
+        for line in lines:
+            batch.append(line if line.endswith("\n") else line + "\n")
+            if len(batch) >= BATCH_SIZE:
+                # cleared first, a failed write must not be retried below.
+                text = "".join(batch)
+                batch.clear()
+                out.write(text)
+    finally:
+        # lines before a failure still make it out.
+        if batch:
+            out.write("".join(batch))
+
+
+def _pattern(text: str) -> re.Pattern[str]:
+    try:
+        return re.compile(text)
+    except re.error as exc:
+        msg = f"invalid pattern {text!r}: {exc}"
+        raise argparse.ArgumentTypeError(msg) from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options."""
+    parser = argparse.ArgumentParser(
+        prog="python -m readabledelta2",
+        description="Humanize durations read line by line from stdin.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=tuple(PARSERS),
+        default="seconds",
+        help="how values are written: integer or float seconds (default), "
+        "integer microseconds or str(timedelta) like '371 days, 1:01:00'",
+    )
+    parser.add_argument(
+        "--packed",
+        metavar="PATH",
+        help="read raw little-endian int64 microseconds from this file (memory "
+        "mapped) instead of lines from stdin",
+    )
+    parser.add_argument(
+        "-p",
+        "--pattern",
+        type=_pattern,
+        help="regex finding the value inside each line; the named group 'delta', "
+        "else the first group, else the whole match is replaced",
+    )
+    parser.add_argument(
+        "-s",
+        "--style",
+        choices=Style.values(),
+        default=Style.NORMAL.value,
+    )
+    parser.add_argument(
+        "-u",
+        "--units",
+        help=f"comma separated units to use, from {', '.join(TDUnit.values())}",
+    )
+    parser.add_argument(
+        "-l",
+        "--locale",
+        choices=available_locales(),
+        default=DEFAULT_LOCALE,
+        help="language of the unit labels",
+    )
+    parser.add_argument(
+        "--no-sign",
+        dest="include_sign",
+        action="store_false",
+        help="leave the minus sign off negative values",
+    )
+    parser.add_argument(
+        "--showzero", action="store_true", help="print units even if they are zero"
+    )
+    parser.add_argument(
+        "--on-error",
+        choices=("fail", "keep", "skip"),
+        default="fail",
+        help="what to do with values that cannot be parsed: stop (default), "
+        "leave them as they are, or drop their line",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="report lines, values and throughput on stderr",
+    )
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int:
+    """Run the humanizer, return the exit code."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    units = tuple(args.units.split(",")) if args.units else None
+    if units and not set(units).issubset(TDUnit.values()):
+        parser.error(f"units can only be the following: {', '.join(TDUnit.values())}")
+    formatter = DeltaFormatter(
+        Style(args.style),
+        units,
+        include_sign=args.include_sign,
+        showzero=args.showzero,
+        locale=args.locale,
+    )
+
+    if args.packed and args.pattern:
+        parser.error("--pattern cannot be used with --packed")
+
+    stats = Stats()
+    try:
+        if args.packed:
+            with map_packed(args.packed) as buffer:
+                values = humanize_packed(
+                    buffer,
+                    formatter.style,
+                    units,
+                    include_sign=formatter.include_sign,
+                    showzero=formatter.showzero,
+                    locale=formatter.locale,
+                    max_units=formatter.max_units,
+                )
+                # the map cannot close while the iterator still reads from it.
+                with contextlib.closing(values):
+                    write_lines(count(values, stats), stdout)
+        else:
+            humanizer = Humanizer(
+                formatter, PARSERS[args.format], args.pattern, args.on_error, stats
+            )
+            write_lines(humanizer.lines(stdin), stdout)
+        stdout.flush()
+    except ParseError as exc:
+        stderr.write(f"readabledelta2: line {stats.lines}: {exc}\n")
+        return 1
+    except BrokenPipeError:
+        raise
+    except (OSError, ValueError) as exc:
+        stderr.write(f"readabledelta2: {exc}\n")
+        return 1
+    finally:
+        if args.stats:
+            stats.report(stderr)
+    return 0
@@ -0,0 +1,142 @@
+"""
+Opt-in instrumentation of the rendering hot path.
+
+Once enabled, every call to a ``from_*`` function or a ``DeltaFormatter``
+``format_*`` method counts its calls and the nanoseconds spent in each phase,
+split by entry point and style::
+
+    >>> instrument.enable()
+    >>> from_timedelta(timedelta(hours=1), Style.SHORT)
+    >>> instrument.stats().phases[("from_timedelta", Style.SHORT, "sign")]
+    PhaseStats(calls=1, ns=291)
+
+The phases are:
+
+``validate``
+    checking and converting the options, and looking up the shared formatter
+    (the plan cache) for the ``from_*`` functions
+``sign``
+    working out whether the delta is negative, for ``from_datetimes`` this
+    includes the calendar difference between the two dates
+``split``
+    spreading the delta over the units
+``render``
+    joining the labels into the final string
+
+The stamps are taken by the formatter itself, between the phases of the one
+rendering path, by a `_Clock` made for each call. While disabled no clock is
+made and the hot path only pays for a few ``is None`` checks per call.
+Calls that raise are not recorded.
+"""
+
+from __future__ import annotations
+
+import threading
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import readabledelta
+from .readabledelta import _formatter
+
+if TYPE_CHECKING:
+    from .readabledelta import Style
+
+PHASES = ("validate", "sign", "split", "render")
+
+
+class PhaseStats(NamedTuple):
+    calls: int
+    ns: int
+
+
+class PlanCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class Stats(NamedTuple):
+    # (entry point, style, phase) -> totals since the last reset
+    phases: dict[tuple[str, Style, str], PhaseStats]
+    plan_cache: PlanCacheInfo
+
+
+_lock = threading.Lock()
+# (entry point, style) -> [calls, ns per phase...]
+_totals: dict[tuple[str, Style], list[int]] = {}
+# plan cache counters at the last reset
+_plan_cache_base = (0, 0)
+
+
+def enable() -> None:
+    """Start recording, counters carry on from where they were."""
+    readabledelta._instrument = _Clock
+
+
+def disable() -> None:
+    """Stop recording, counters are kept until ``reset``."""
+    readabledelta._instrument = None
+
+
+def is_enabled() -> bool:
+    """Return True while calls are being recorded."""
+    return readabledelta._instrument is not None
+
+
+def reset() -> None:
+    """Zero every counter, including the plan cache hits and misses."""
+    global _plan_cache_base  # noqa: PLW0603
+    with _lock:
+        _totals.clear()
+        info = _formatter.cache_info()
+        _plan_cache_base = (info.hits, info.misses)
+
+
+def stats() -> Stats:
+    """Snapshot of the counters since the last reset."""
+    with _lock:
+        phases = {
+            (entry, style, phase): PhaseStats(totals[0], ns)
+            for (entry, style), totals in _totals.items()
+            for phase, ns in zip(PHASES, totals[1:], strict=True)
+        }
+        hits, misses = _plan_cache_base
+    info = _formatter.cache_info()
+    plan_cache = PlanCacheInfo(
+        info.hits - hits, info.misses - misses, info.maxsize or 0, info.currsize
+    )
+    return Stats(phases, plan_cache)
+
+
+class _Clock:
+    """
+    The phase stamps of one call, taken by readabledelta between the phases.
+
+    The stamps are the perf_counter_ns at the start of the call and at the end
+    of each phase. Formatters validate their options when they are built, so
+    their methods start ``validated``, with no time under validate.
+    """
+
+    __slots__ = ("entry", "stamps")
+
+    def __init__(self, entry: str, *, validated: bool = False) -> None:
+        self.entry = entry
+        now = perf_counter_ns()
+        self.stamps = [now, now] if validated else [now]
+
+    def lap(self) -> None:
+        """End the current phase."""
+        self.stamps.append(perf_counter_ns())
+
+    def stop(self, style: Style) -> None:
+        """End the last phase and add the call to the totals."""
+        stamps = self.stamps
+        stamps.append(perf_counter_ns())
+        with _lock:
+            totals = _totals.get((self.entry, style))
+            if totals is None:
+                totals = _totals[self.entry, style] = [0] * (len(PHASES) + 1)
+            totals[0] += 1
+            for i in range(len(PHASES)):
+                totals[i + 1] += stamps[i + 1] - stamps[i]
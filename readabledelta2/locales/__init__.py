@@ -0,0 +1,173 @@
+"""
+Locale catalogs for the unit labels, plural rules and list joiners.
+
+Each locale is a ``LocaleDefinition`` living in a module of its own, imported
+and compiled into flat lookup tables the first time something renders in it,
+so unused locales cost nothing::
+
+    >>> from_timedelta(timedelta(hours=1, minutes=2), locale="de")
+    '1 Stunde und 2 Minuten'
+
+Add your own with ``register_locale``, passing either the definition or a
+function that returns it on first use.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+DEFAULT_LOCALE = "en"
+STYLES = ("normal", "short", "abbrev")
+UNITS = (
+    "years",
+    "months",
+    "weeks",
+    "days",
+    "hours",
+    "minutes",
+    "seconds",
+    "milliseconds",
+    "microseconds",
+)
+# plural rules are tabled for every count below this and, from there up, on the
+# last two digits.
+EXACT_COUNTS = 100
+_TABLE_SIZE = EXACT_COUNTS + 100
+
+
+class LocaleDefinition(NamedTuple):
+    """
+    Labels, plural rule and joiners of a locale, as its authors write them.
+
+    :param labels: unit name -> style -> plural category -> label; a missing
+            category falls back to ``"other"``, which every style must have
+    :param plural: CLDR style rule returning the plural category of a count,
+            e.g. ``"one"`` or ``"other"``. From 100 up it may only depend on
+            the last two digits, which holds for every integer rule in CLDR.
+            It is also called with the float fields a relativedelta can hold.
+    :param separator: put between all but the last two parts
+    :param last_separator: put between the last two parts
+    """
+
+    labels: Mapping[str, Mapping[str, Mapping[str, str]]]
+    plural: Callable[[int], str]
+    separator: str = ", "
+    last_separator: str = " and "
+
+
+class Locale(NamedTuple):
+    """
+    A compiled locale, ready to render.
+
+    ``labels[unit][style]`` holds the label for each count below 100, then
+    for counts from 100 up by their last two digits::
+
+        labels[count] if count < 100 else labels[100 + count % 100]
+
+    Counts that are not integers, like the float fields a relativedelta can
+    hold, go through the plural rule with `label`.
+    """
+
+    name: str
+    labels: dict[str, dict[str, tuple[str, ...]]]
+    separator: str
+    last_separator: str
+    definition: LocaleDefinition
+
+    def label(self, unit: str, style: str, count: float) -> str:
+        """Return the label of a unit for any count, e.g. 1.5."""
+        if isinstance(count, int):
+            table = self.labels[unit][style]
+            return (
+                table[count]
+                if count < EXACT_COUNTS
+                else table[EXACT_COUNTS + count % 100]
+            )
+        forms = self.definition.labels[unit][style]
+        return forms.get(self.definition.plural(count), forms["other"])  # type: ignore[arg-type]
+
+
+def _load_builtin(name: str) -> LocaleDefinition:
+    module = importlib.import_module(f"{__name__}.{name}")
+    return module.LOCALE
+
+
+_loaders: dict[str, Callable[[], LocaleDefinition]] = {
+    name: functools.partial(_load_builtin, name)
+    for name in ("de", "en", "es", "fr", "ru")
+}
+_compiled: dict[str, Locale] = {}
+
+
+def available_locales() -> tuple[str, ...]:
+    """Names of every registered locale, loaded or not."""
+    return tuple(sorted(_loaders))
+
+
+def register_locale(
+    name: str, definition: LocaleDefinition | Callable[[], LocaleDefinition]
+) -> None:
+    """
+    Register a locale, or replace one.
+
+    :param name: name to pass as ``locale``, e.g. ``"pt_BR"``
+    :param definition: the definition, or a function returning it that is
+            only called when the locale is first used
+    """
+    if isinstance(definition, LocaleDefinition):
+        _loaders[name] = lambda: definition
+    else:
+        _loaders[name] = definition
+    if _compiled.pop(name, None) is not None:
+        # formatters, parsers and templates already built hold on to the old
+        # tables.
+        from ..parser import _parser  # noqa: PLC0415
+        from ..readabledelta import _formatter  # noqa: PLC0415
+        from ..template import _template  # noqa: PLC0415
+
+        _formatter.cache_clear()
+        _parser.cache_clear()
+        _template.cache_clear()
+
+
+def get_locale(name: str = DEFAULT_LOCALE) -> Locale:
+    """Return a compiled locale, loading and compiling it on first use."""
+    try:
+        return _compiled[name]
+    except KeyError:
+        pass
+    loader = _loaders.get(name)
+    if loader is None:
+        msg = f"locale can only be one of the following: {available_locales()}"
+        raise ValueError(msg)
+    # compiling twice in a race is harmless, the tables come out the same.
+    locale = _compiled[name] = compile_locale(name, loader())
+    return locale
+
+
+def compile_locale(name: str, definition: LocaleDefinition) -> Locale:
+    """Build the flat label tables for every unit and style of a definition."""
+    categories = [definition.plural(count) for count in range(_TABLE_SIZE)]
+    labels: dict[str, dict[str, tuple[str, ...]]] = {}
+    for unit in UNITS:
+        styles = definition.labels.get(unit, {})
+        labels[unit] = {}
+        for style in STYLES:
+            forms = styles.get(style, {})
+            if "other" not in forms:
+                msg = (
+                    f"locale {name!r} has no 'other' label for {unit} in {style} style"
+                )
+                raise ValueError(msg)
+            table = tuple(
+                forms.get(category, forms["other"]) for category in categories
+            )
+            labels[unit][style] = table
+    return Locale(
+        name, labels, definition.separator, definition.last_separator, definition
+    )
@@ -0,0 +1,67 @@
+"""German."""
+
+from __future__ import annotations
+
+from . import LocaleDefinition
+
+
+def plural(count: int) -> str:
+    """Plural category of a count."""
+    return "one" if count == 1 else "other"
+
+
+# @formatter:off
+# fmt: off
+LOCALE = LocaleDefinition(
+    labels={
+        "microseconds": {
+            "normal": {"one": "Mikrosekunde", "other": "Mikrosekunden"},
+            "short": {"other": "µSek."},
+            "abbrev": {"other": "µs"},
+        },
+        "milliseconds": {
+            "normal": {"one": "Millisekunde", "other": "Millisekunden"},
+            "short": {"other": "Millisek."},
+            "abbrev": {"other": "ms"},
+        },
+        "seconds": {
+            "normal": {"one": "Sekunde", "other": "Sekunden"},
+            "short": {"other": "Sek."},
+            "abbrev": {"other": "s"},
+        },
+        "minutes": {
+            "normal": {"one": "Minute", "other": "Minuten"},
+            "short": {"other": "Min."},
+            "abbrev": {"other": "min"},
+        },
+        "hours": {
+            "normal": {"one": "Stunde", "other": "Stunden"},
+            "short": {"other": "Std."},
+            "abbrev": {"other": "h"},
+        },
+        "days": {
+            "normal": {"one": "Tag", "other": "Tage"},
+            "short": {"other": "Tg."},
+            "abbrev": {"other": "T"},
+        },
+        "weeks": {
+            "normal": {"one": "Woche", "other": "Wochen"},
+            "short": {"other": "Wo."},
+            "abbrev": {"other": "W"},
+        },
+        "months": {
+            "normal": {"one": "Monat", "other": "Monate"},
+            "short": {"other": "Mon."},
+            "abbrev": {"other": "M"},
+        },
+        "years": {
+            "normal": {"one": "Jahr", "other": "Jahre"},
+            "short": {"other": "J."},
+            "abbrev": {"other": "J"},
+        },
+    },
+    plural=plural,
+    last_separator=" und ",
+)
+# fmt: on
+# @formatter:on
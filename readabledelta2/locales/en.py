@@ -0,0 +1,28 @@
+"""English, the labels of ``TIME_UNITS``."""
+
+from __future__ import annotations
+
+from ..readabledelta import TIME_UNITS, Style
+from . import LocaleDefinition
+
+
+def plural(count: int) -> str:
+    """Plural category of a count."""
+    return "one" if count == 1 else "other"
+
+
+LOCALE = LocaleDefinition(
+    labels={
+        unit: {
+            # abbreviations are the same for every count
+            style: (
+                {"other": name}
+                if style is Style.ABBREV
+                else {"one": name[:-1], "other": name}
+            )
+            for style, name in styles.items()
+        }
+        for unit, styles in TIME_UNITS.items()
+    },
+    plural=plural,
+)
@@ -0,0 +1,67 @@
+"""Spanish."""
+
+from __future__ import annotations
+
+from . import LocaleDefinition
+
+
+def plural(count: int) -> str:
+    """Plural category of a count."""
+    return "one" if count == 1 else "other"
+
+
+# @formatter:off
+# fmt: off
+LOCALE = LocaleDefinition(
+    labels={
+        "microseconds": {
+            "normal": {"one": "microsegundo", "other": "microsegundos"},
+            "short": {"other": "µs"},
+            "abbrev": {"other": "µs"},
+        },
+        "milliseconds": {
+            "normal": {"one": "milisegundo", "other": "milisegundos"},
+            "short": {"other": "ms"},
+            "abbrev": {"other": "ms"},
+        },
+        "seconds": {
+            "normal": {"one": "segundo", "other": "segundos"},
+            "short": {"other": "s"},
+            "abbrev": {"other": "s"},
+        },
+        "minutes": {
+            "normal": {"one": "minuto", "other": "minutos"},
+            "short": {"other": "min"},
+            "abbrev": {"other": "min"},
+        },
+        "hours": {
+            "normal": {"one": "hora", "other": "horas"},
+            "short": {"other": "h"},
+            "abbrev": {"other": "h"},
+        },
+        "days": {
+            "normal": {"one": "día", "other": "días"},
+            "short": {"other": "d"},
+            "abbrev": {"other": "d"},
+        },
+        "weeks": {
+            "normal": {"one": "semana", "other": "semanas"},
+            "short": {"other": "sem."},
+            "abbrev": {"other": "sem"},
+        },
+        "months": {
+            "normal": {"one": "mes", "other": "meses"},
+            "short": {"other": "m."},
+            "abbrev": {"other": "m"},
+        },
+        "years": {
+            "normal": {"one": "año", "other": "años"},
+            "short": {"other": "a."},
+            "abbrev": {"other": "a"},
+        },
+    },
+    plural=plural,
+    last_separator=" y ",
+)
+# fmt: on
+# @formatter:on
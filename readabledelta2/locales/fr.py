@@ -0,0 +1,67 @@
+"""French."""
+
+from __future__ import annotations
+
+from . import LocaleDefinition
+
+
+def plural(count: int) -> str:
+    """Plural category of a count, zero is singular in French."""
+    return "one" if count in (0, 1) else "other"
+
+
+# @formatter:off
+# fmt: off
+LOCALE = LocaleDefinition(
+    labels={
+        "microseconds": {
+            "normal": {"one": "microseconde", "other": "microsecondes"},
+            "short": {"other": "µs"},
+            "abbrev": {"other": "µs"},
+        },
+        "milliseconds": {
+            "normal": {"one": "milliseconde", "other": "millisecondes"},
+            "short": {"other": "ms"},
+            "abbrev": {"other": "ms"},
+        },
+        "seconds": {
+            "normal": {"one": "seconde", "other": "secondes"},
+            "short": {"other": "s"},
+            "abbrev": {"other": "s"},
+        },
+        "minutes": {
+            "normal": {"one": "minute", "other": "minutes"},
+            "short": {"other": "min"},
+            "abbrev": {"other": "min"},
+        },
+        "hours": {
+            "normal": {"one": "heure", "other": "heures"},
+            "short": {"other": "h"},
+            "abbrev": {"other": "h"},
+        },
+        "days": {
+            "normal": {"one": "jour", "other": "jours"},
+            "short": {"other": "j"},
+            "abbrev": {"other": "j"},
+        },
+        "weeks": {
+            "normal": {"one": "semaine", "other": "semaines"},
+            "short": {"other": "sem."},
+            "abbrev": {"other": "sem"},
+        },
+        "months": {
+            "normal": {"one": "mois", "other": "mois"},
+            "short": {"other": "m."},
+            "abbrev": {"other": "m"},
+        },
+        "years": {
+            "normal": {"one": "an", "other": "ans"},
+            "short": {"one": "an", "other": "ans"},
+            "abbrev": {"other": "a"},
+        },
+    },
+    plural=plural,
+    last_separator=" et ",
+)
+# fmt: on
+# @formatter:on
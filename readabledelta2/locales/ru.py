@@ -0,0 +1,72 @@
+"""Russian."""
+
+from __future__ import annotations
+
+from . import LocaleDefinition
+
+
+def plural(count: int) -> str:
+    """Plural category of a count, by its last one and two digits."""
+    ones, tens = count % 10, count % 100
+    if ones == 1 and tens != 11:
+        return "one"
+    if 2 <= ones <= 4 and not 12 <= tens <= 14:
+        return "few"
+    return "many"
+
+
+# @formatter:off
+# fmt: off
+LOCALE = LocaleDefinition(
+    labels={
+        "microseconds": {
+            "normal": {"one": "микросекунда", "few": "микросекунды", "other": "микросекунд"},
+            "short": {"other": "мкс"},
+            "abbrev": {"other": "мкс"},
+        },
+        "milliseconds": {
+            "normal": {"one": "миллисекунда", "few": "миллисекунды", "other": "миллисекунд"},
+            "short": {"other": "мс"},
+            "abbrev": {"other": "мс"},
+        },
+        "seconds": {
+            "normal": {"one": "секунда", "few": "секунды", "other": "секунд"},
+            "short": {"other": "сек."},
+            "abbrev": {"other": "с"},
+        },
+        "minutes": {
+            "normal": {"one": "минута", "few": "минуты", "other": "минут"},
+            "short": {"other": "мин."},
+            "abbrev": {"other": "мин"},
+        },
+        "hours": {
+            "normal": {"one": "час", "few": "часа", "other": "часов"},
+            "short": {"other": "ч."},
+            "abbrev": {"other": "ч"},
+        },
+        "days": {
+            "normal": {"one": "день", "few": "дня", "other": "дней"},
+            "short": {"other": "дн."},
+            "abbrev": {"other": "д"},
+        },
+        "weeks": {
+            "normal": {"one": "неделя", "few": "недели", "other": "недель"},
+            "short": {"other": "нед."},
+            "abbrev": {"other": "н"},
+        },
+        "months": {
+            "normal": {"one": "месяц", "few": "месяца", "other": "месяцев"},
+            "short": {"other": "мес."},
+            "abbrev": {"other": "м"},
+        },
+        "years": {
+            "normal": {"one": "год", "few": "года", "other": "лет"},
+            "short": {"one": "г.", "few": "г.", "other": "л."},
+            "abbrev": {"other": "г"},
+        },
+    },
+    plural=plural,
+    last_separator=" и ",
+)
+# fmt: on
+# @formatter:on
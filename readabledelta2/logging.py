@@ -0,0 +1,284 @@
+"""
+Humanize durations in log records only when they are emitted.
+
+``logger.debug("took %s", from_timedelta(delta))`` builds the string even when
+DEBUG is off. `lazy` defers it until a handler formats the record::
+
+    >>> logger.debug("took %s", lazy(delta, Style.SHORT))
+
+Or pass the deltas themselves and let a `DeltaLogFilter`, or a
+`DeltaLogFormatter`, humanize every timedelta and relativedelta argument::
+
+    >>> handler.setFormatter(DeltaLogFormatter("%(levelname)s %(message)s"))
+    >>> logger.debug("took %s", delta)
+
+Records below the level of the logger are dropped before any of them is
+involved, so a disabled call costs the same as logging the bare delta.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import TYPE_CHECKING, Literal
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import (
+    Style,
+    _formatter,
+    _relativedelta_unitset,
+    _timedelta_unitset,
+    from_relativedelta,
+    from_timedelta,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from dateutil.relativedelta import relativedelta
+
+    from .readabledelta import DeltaFormatter, RDUnit, TDUnit, UnitSet
+
+# the arguments of a log record, as typed by ``logging.LogRecord``.
+_Args = tuple[object, ...] | Mapping[str, object]
+
+
+class LazyDelta:
+    """
+    A timedelta or relativedelta humanized the first time it is turned into a string.
+
+    Same output as ``from_timedelta`` or ``from_relativedelta``, which are only
+    called by ``str()``, and only once. The options are not checked before
+    then, so creating one costs next to nothing; invalid ones are reported by
+    ``str()``, and by the logging handler. `lazy` is the short name.
+
+    :param delta: timedelta or relativedelta
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param anchor: date the sign of calendar dependent relativedeltas is
+            measured from, ignored for timedeltas
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    """
+
+    __slots__ = ("_options", "_text", "delta")
+
+    def __init__(
+        self,
+        delta: timedelta | relativedelta,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | RDUnit | str, ...] | UnitSet | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        anchor: datetime | None = None,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> None:
+        # one frame and one tuple, this is all a dropped record pays for.
+        self.delta = delta
+        self._options = (
+            style,
+            units,
+            include_sign,
+            showzero,
+            anchor,
+            locale,
+            max_units,
+        )
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        text = self._text
+        if text is None:
+            style, units, include_sign, showzero, anchor, locale, max_units = (
+                self._options
+            )
+            if not isinstance(self.delta, timedelta):
+                text = from_relativedelta(
+                    self.delta,
+                    style,
+                    units,
+                    include_sign=include_sign,
+                    showzero=showzero,
+                    anchor=anchor,
+                    locale=locale,
+                    max_units=max_units,
+                )
+            else:
+                text = from_timedelta(
+                    self.delta,
+                    style,
+                    units,
+                    include_sign=include_sign,
+                    showzero=showzero,
+                    locale=locale,
+                    max_units=max_units,
+                )
+            self._text = text
+        return text
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.delta!r})"
+
+
+lazy = LazyDelta
+
+
+def _delta_types() -> tuple[type, ...]:
+    """The delta types to humanize, relativedelta only once dateutil is imported."""
+    # an application can't hold a relativedelta without having imported it,
+    # so this keeps dateutil off the import path, as in readabledelta.
+    module = sys.modules.get("dateutil.relativedelta")
+    if module is None:
+        return (timedelta,)
+    return (timedelta, module.relativedelta)
+
+
+class _Humanizer:
+    """Replace the deltas among the arguments of a log record with strings."""
+
+    def __init__(
+        self,
+        style: Style,
+        *,
+        include_sign: bool,
+        showzero: bool,
+        locale: str,
+        max_units: int | None,
+    ) -> None:
+        self._td_formatter: DeltaFormatter = _formatter(
+            style,
+            _timedelta_unitset(None),
+            include_sign,
+            showzero,
+            None,
+            locale,
+            max_units,
+        )
+        self._rd_formatter: DeltaFormatter = _formatter(
+            style,
+            _relativedelta_unitset(None),
+            include_sign,
+            showzero,
+            None,
+            locale,
+            max_units,
+        )
+
+    def _humanize(self, value: object) -> object:
+        if isinstance(value, timedelta):
+            return self._td_formatter.format_timedelta(value)
+        if isinstance(value, _delta_types()):
+            return self._rd_formatter.format_relativedelta(value)  # type: ignore[arg-type]
+        return value
+
+    def args(self, args: _Args) -> _Args:
+        """Return the arguments with the deltas humanized, or them as they are."""
+        types = _delta_types()
+        if isinstance(args, tuple):
+            if any(isinstance(arg, types) for arg in args):
+                return tuple(map(self._humanize, args))
+        elif isinstance(args, Mapping) and any(
+            isinstance(arg, types) for arg in args.values()
+        ):
+            return {key: self._humanize(arg) for key, arg in args.items()}
+        return args
+
+
+class DeltaLogFilter(logging.Filter):
+    """
+    Humanize the timedelta and relativedelta arguments of the records it passes.
+
+    The record arguments are replaced, so the strings are what every handler
+    after the filter sees, ``%r`` included. Added to a handler, only the records
+    that handler emits are humanized. Never drops a record.
+
+    :param name: logger name, as for ``logging.Filter``
+    :param style: normal, short, abbrev
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        style: Style = Style.NORMAL,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> None:
+        super().__init__(name)
+        self._humanizer = _Humanizer(
+            style,
+            include_sign=include_sign,
+            showzero=showzero,
+            locale=locale,
+            max_units=max_units,
+        )
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Humanize the deltas in ``record.args``."""
+        if not super().filter(record):
+            return False
+        if record.args:
+            record.args = self._humanizer.args(record.args)
+        return True
+
+
+class DeltaLogFormatter(logging.Formatter):
+    """
+    ``logging.Formatter`` that humanizes timedelta and relativedelta arguments.
+
+    Unlike `DeltaLogFilter` the record is left as it is for the other handlers.
+    The first arguments are those of ``logging.Formatter``.
+
+    :param delta_style: normal, short, abbrev, named so because
+            ``logging.Formatter`` has a ``style`` of its own
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: Literal["%", "{", "$"] = "%",
+        validate: bool = True,  # noqa: FBT001, FBT002
+        *,
+        defaults: Mapping[str, object] | None = None,
+        delta_style: Style = Style.NORMAL,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> None:
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        self._humanizer = _Humanizer(
+            delta_style,
+            include_sign=include_sign,
+            showzero=showzero,
+            locale=locale,
+            max_units=max_units,
+        )
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record with its deltas humanized."""
+        args = record.args
+        if not args:
+            return super().format(record)
+        record.args = self._humanizer.args(args)
+        try:
+            return super().format(record)
+        finally:
+            record.args = args
@@ -0,0 +1,155 @@
+"""
+Humanize packed int64 microsecond durations straight from a buffer or file.
+
+Tracing exporters often write durations as raw little-endian int64
+microseconds. These helpers read them in place, from any buffer protocol
+object or a memory mapped file, and yield one string per value::
+
+    >>> with map_packed("durations.bin") as buffer:
+    ...     for text in humanize_packed(buffer, Style.SHORT):
+    ...         print(text)
+
+No list of values or timedelta objects is built, so memory stays flat however
+large the input is.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import struct
+import sys
+from typing import TYPE_CHECKING, Literal
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import Style, _formatter, _Memo, _timedelta_options
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from .readabledelta import DeltaFormatter, TDUnit, UnitSet
+
+_NATIVE = "<" if sys.byteorder == "little" else ">"
+# buffer formats taken as native int64, raw bytes are taken as they are.
+INT64_FORMATS = frozenset(
+    ["b", "B", "c"]
+    + [order + code for order in ("", "@", "=", _NATIVE) for code in "ql"]
+)
+# bytes of a memory map read before its pages are dropped, a multiple of the
+# page size.
+WINDOW = 1024 * mmap.PAGESIZE
+
+
+def int64_view(buffer: object) -> memoryview:
+    """
+    Native int64 view of a buffer, without copying it.
+
+    The buffer must hold native int64 values (``array("q")``, an int64 numpy
+    array...) or raw bytes whose size is a multiple of 8.
+    """
+    # release our view even when raising, a live view keeps an mmap open.
+    with memoryview(buffer) as view:  # type: ignore[arg-type]
+        if view.format not in INT64_FORMATS or view.itemsize not in (1, 8):
+            msg = f"expected a buffer of int64 or bytes, not format {view.format!r}"
+            raise TypeError(msg)
+        if view.nbytes % 8:
+            msg = f"buffer size must be a multiple of 8 bytes, not {view.nbytes}"
+            raise ValueError(msg)
+        return view.cast("B").cast("q")
+
+
+def iter_microseconds(
+    buffer: object, byteorder: Literal["little", "big"] = "little"
+) -> Iterator[int]:
+    """
+    Iterate over the int64 values of a buffer.
+
+    :param buffer: raw bytes, or a buffer of native int64 values
+    :param byteorder: byte order of raw bytes, typed int64 buffers are
+            already in native order
+    """
+    with memoryview(buffer) as view:  # type: ignore[arg-type]
+        raw = view.itemsize == 1
+    values = int64_view(buffer)
+    swap = raw and byteorder != sys.byteorder
+    mapped = buffer if isinstance(buffer, mmap.mmap) else None
+    if not swap and mapped is None:
+        return iter(values)
+    return _iter_windows(values, mapped, byteorder if swap else None)
+
+
+def _iter_windows(
+    values: memoryview, mapped: mmap.mmap | None, byteorder: str | None
+) -> Generator[int, None, None]:
+    """
+    Iterate over int64 values a window at a time.
+
+    Windows are byte swapped when a byteorder is given. Pages of a memory map
+    that were already read are handed back to the OS, so the resident size of
+    the process does not grow with the file.
+    """
+    fmt = "<q" if byteorder == "little" else ">q"
+    step = WINDOW // 8
+    for start in range(0, len(values), step):
+        with values[start : start + step] as window:
+            if byteorder is None:
+                yield from window
+            else:
+                for (value,) in struct.iter_unpack(fmt, window):
+                    yield value
+            size = window.nbytes
+        if mapped is not None and hasattr(mmap, "MADV_DONTNEED"):
+            mapped.madvise(mmap.MADV_DONTNEED, start * 8, size)
+
+
+def humanize_packed(
+    buffer: object,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    byteorder: Literal["little", "big"] = "little",
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> Generator[str, None, None]:
+    """
+    Iterate over Human readable strings for the int64 microseconds in a buffer.
+
+    Same output as ``from_microseconds`` on every value. Finish or close the
+    generator before closing a memory map it reads from.
+
+    :param buffer: raw bytes, or a buffer of native int64 values
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param byteorder: byte order of raw bytes
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    """
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+    return _humanize(formatter, iter_microseconds(buffer, byteorder))
+
+
+def _humanize(
+    formatter: DeltaFormatter, values: Iterator[int]
+) -> Generator[str, None, None]:
+    """Render each value, remembering a bounded number of recent results."""
+    yield from map(_Memo(formatter.format_microseconds).__getitem__, values)
+
+
+@contextlib.contextmanager
+def map_packed(path: str | os.PathLike[str]) -> Iterator[mmap.mmap | bytes]:
+    """Memory map a file read only, for ``humanize_packed``."""
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            # empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
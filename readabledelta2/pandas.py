@@ -0,0 +1,141 @@
+"""
+pandas accessors for readabledelta.
+
+Requires pandas, install with ``pip install readabledelta2[pandas]``.
+Importing this module registers a ``readabledelta`` accessor on Series and
+DataFrame objects::
+
+    >>> import readabledelta2.pandas
+    >>> df["took"].readabledelta.format(Style.SHORT)
+
+The split is vectorized (see ``readabledelta2.vectorized``), so it is much
+cheaper than ``Series.apply(from_timedelta)``. NaT values come back missing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import Style, TDUnit, _formatter, _timedelta_options
+from .vectorized import render_unique, split_timedelta_array
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as exc:  # pragma: no cover
+    msg = (
+        "readabledelta2.pandas requires pandas, "
+        "install it with `pip install readabledelta2[pandas]`"
+    )
+    raise ImportError(msg) from exc
+
+if TYPE_CHECKING:
+    from .readabledelta import DeltaFormatter
+
+
+def _format_series(
+    series: pd.Series,
+    formatter: DeltaFormatter,
+    *,
+    categorical: bool,
+) -> pd.Series:
+    rendered, inverse, _ = render_unique(formatter, series.to_numpy())
+    if categorical:
+        # distinct rows render distinct strings; only NaT renders as None.
+        categories = [val for val in rendered if val is not None]
+        codes = inverse.ravel()
+        if len(categories) < len(rendered):
+            missing = rendered.tolist().index(None)
+            codes = np.where(codes == missing, -1, codes)
+            codes[codes > missing] -= 1
+        values = pd.Categorical.from_codes(codes, categories=pd.Index(categories))
+        return pd.Series(values, index=series.index, name=series.name)
+    return pd.Series(
+        rendered[inverse], index=series.index, name=series.name, dtype=object
+    )
+
+
+@pd.api.extensions.register_series_accessor("readabledelta")
+class ReadableDeltaSeriesAccessor:
+    """``Series.readabledelta`` for timedelta64 Series."""
+
+    def __init__(self, series: pd.Series) -> None:
+        if series.dtype.kind != "m":
+            msg = "Can only use .readabledelta accessor with timedelta64 values"
+            raise AttributeError(msg)
+        self._series = series
+
+    def format(
+        self,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | str, ...] | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+        categorical: bool = False,
+    ) -> pd.Series:
+        """
+        Create Human readable strings for every value in the Series.
+
+        :param style: normal, short, abbrev
+        :param units: tuple of timeunits to be used for output
+        :param include_sign: false will prevent sign from appearing
+        :param bool showzero: prints out the values even if they are zero
+        :param locale: language of the labels, see ``readabledelta2.locales``
+        :param max_units: show at most this many non-zero units, the rest is
+                truncated, see ``DeltaFormatter``
+        :param categorical: return a categorical Series instead of strings
+        """
+        formatter = _formatter(
+            *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+        )
+        return _format_series(self._series, formatter, categorical=categorical)
+
+    def split(self, units: tuple[TDUnit | str, ...] = tuple(TDUnit)) -> pd.DataFrame:
+        """
+        Vectorized `split_timedelta_units`, one column per unit.
+
+        :param units: array of time magnitudes to be used for output
+        """
+        data = split_timedelta_array(self._series.to_numpy(), units)
+        return pd.DataFrame(
+            {unit.value: values for unit, values in data.items()},
+            index=self._series.index,
+        )
+
+
+@pd.api.extensions.register_dataframe_accessor("readabledelta")
+class ReadableDeltaDataFrameAccessor:
+    """``DataFrame.readabledelta`` that humanizes every timedelta64 column."""
+
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self._frame = frame
+
+    def format(
+        self,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | str, ...] | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+        categorical: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Return a copy with every timedelta64 column humanized.
+
+        Other columns are left untouched. See ``Series.readabledelta.format``.
+        """
+        formatter = _formatter(
+            *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+        )
+        result = self._frame.copy()
+        for i, (_, series) in enumerate(self._frame.items()):
+            if series.dtype.kind == "m":
+                formatted = _format_series(series, formatter, categorical=categorical)
+                result.isetitem(i, formatted.array)
+        return result
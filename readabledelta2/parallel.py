@@ -0,0 +1,248 @@
+"""
+Render large batches of durations on several processes, or threads.
+
+The input is packed into native int64 microseconds and handed to the workers
+through ``multiprocessing.shared_memory``, so only the chunk boundaries are
+pickled on the way in::
+
+    >>> humanize_parallel(durations, Style.SHORT, workers=8)
+    ['1 min and 30 secs', ...]
+
+On free-threaded builds of Python (3.13t and later) threads run in parallel
+and nothing has to be copied or pickled::
+
+    >>> humanize_threaded(durations, Style.SHORT, max_workers=8)
+    ['1 min and 30 secs', ...]
+
+Every public function of the package can be called from several threads at
+once. Formatters, parsers and templates are not changed after they are built,
+and the caches shared between threads (the formatter, parser and template
+caches, compiled locales) are only written on a miss, where a race at worst
+builds the same thing twice. ``DeltaCache`` and the instrumentation counters
+take their own lock. A ``readabledelta2.aio.DeltaBatcher``, like the rest of
+asyncio, belongs to the event loop using it.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any
+
+from .locales import DEFAULT_LOCALE
+from .packed import int64_view
+from .readabledelta import (
+    Style,
+    _format_duration,
+    _formatter,
+    _Memo,
+    _timedelta_options,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from multiprocessing.context import BaseContext
+
+    from .readabledelta import DeltaFormatter, TDUnit, UnitSet
+
+# values per task handed to a worker
+CHUNKSIZE = 65536
+# values per task handed to a thread
+THREAD_CHUNKSIZE = 8192
+
+
+def _pack(values: Iterable[timedelta | int]) -> memoryview:
+    """Packed int64 microseconds for a buffer or an iterable of deltas."""
+    try:
+        memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        pass
+    else:
+        return int64_view(values)
+
+    packed = array("q")
+    try:
+        for value in values:
+            if isinstance(value, timedelta):
+                value = value // timedelta(microseconds=1)  # noqa: PLW2901
+            packed.append(value)
+    except OverflowError:
+        msg = "values must fit in int64 microseconds (about 292000 years)"
+        raise OverflowError(msg) from None
+    return memoryview(packed)
+
+
+def _render(values: memoryview, options: tuple[Any, ...]) -> list[str]:
+    """Render a run of int64 microseconds, each distinct value only once."""
+    return list(
+        map(_Memo(_formatter(*options).format_microseconds).__getitem__, values)
+    )
+
+
+def _render_chunk(
+    name: str, start: int, stop: int, *, options: tuple[Any, ...]
+) -> list[str]:
+    """Worker side: attach to the shared input and render one chunk of it."""
+    shm = shared_memory.SharedMemory(name)
+    try:
+        view = shm.buf.cast("q")  # type: ignore[union-attr]
+        try:
+            return _render(view[start:stop], options)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def humanize_parallel(
+    values: Iterable[timedelta | int],
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    workers: int | None = None,
+    chunksize: int = CHUNKSIZE,
+    mp_context: BaseContext | None = None,
+) -> list[str]:
+    """
+    Create Human readable strings for many durations using a process pool.
+
+    Same output, in the same order, as calling ``from_timedelta`` (or
+    ``from_microseconds``) on every value. Small inputs, or ``workers=1``, are
+    rendered in this process.
+
+    :param values: timedeltas or integer microseconds, or a buffer of native
+            int64 microseconds (``array("q")``, an int64 numpy array, bytes...)
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param workers: number of processes, defaults to ``os.cpu_count()``
+    :param chunksize: number of values each task renders
+    :param mp_context: multiprocessing context for the pool, e.g.
+            ``multiprocessing.get_context("forkserver")`` in threaded programs
+    """
+    if chunksize < 1:
+        msg = f"chunksize must be at least 1, not {chunksize}"
+        raise ValueError(msg)
+    options = _timedelta_options(
+        style, units, include_sign, showzero, locale, max_units
+    )
+    # fail on bad options here rather than in every worker.
+    formatter = _formatter(*options)
+    if formatter._td_error:
+        raise ValueError(formatter._td_error)
+
+    packed = _pack(values)
+    size = len(packed)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or size <= chunksize:
+        return _render(packed, options)
+
+    shm = shared_memory.SharedMemory(create=True, size=packed.nbytes)
+    try:
+        shm.buf[: packed.nbytes] = packed.cast("B")  # type: ignore[index]
+        starts = range(0, size, chunksize)
+        stops = [min(start + chunksize, size) for start in starts]
+        render_chunk = functools.partial(_render_chunk, shm.name, options=options)
+        result: list[str] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(starts)), mp_context=mp_context
+        ) as executor:
+            for chunk in executor.map(render_chunk, starts, stops):
+                result.extend(chunk)
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _gil_enabled() -> bool:
+    """Return False on free-threaded builds, unless the GIL was turned back on."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def _render_items(
+    formatter: DeltaFormatter, values: Sequence[timedelta | int]
+) -> list[str]:
+    """Render a run of deltas or microseconds, each distinct value only once."""
+    return list(
+        map(_Memo(functools.partial(_format_duration, formatter)).__getitem__, values)
+    )
+
+
+def humanize_threaded(
+    values: Iterable[timedelta | int],
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    max_workers: int | None = None,
+    chunksize: int = THREAD_CHUNKSIZE,
+) -> list[str]:
+    """
+    Create Human readable strings for many durations using a thread pool.
+
+    Same output, in the same order, as calling ``from_timedelta`` (or
+    ``from_microseconds``) on every value. The formatter is built once and only
+    read by the threads, so rendering takes no lock.
+
+    Threads only render in parallel on free-threaded builds. With the GIL,
+    ``max_workers`` defaults to 1 and the values are rendered in this thread.
+
+    :param values: timedeltas or integer microseconds, or a buffer of native
+            int64 microseconds (``array("q")``, an int64 numpy array, bytes...)
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param max_workers: number of threads, defaults to ``os.cpu_count()`` on
+            free-threaded builds
+    :param chunksize: number of values each task renders
+    """
+    if chunksize < 1:
+        msg = f"chunksize must be at least 1, not {chunksize}"
+        raise ValueError(msg)
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+    if formatter._td_error:
+        raise ValueError(formatter._td_error)
+
+    items: Sequence[timedelta | int]
+    try:
+        memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        items = values if isinstance(values, Sequence) else list(values)
+    else:
+        items = int64_view(values)
+    size = len(items)
+    if max_workers is None:
+        max_workers = 1 if _gil_enabled() else os.cpu_count() or 1
+    if max_workers == 1 or size <= chunksize:
+        return _render_items(formatter, items)
+
+    chunks = [items[start : start + chunksize] for start in range(0, size, chunksize)]
+    render = functools.partial(_render_items, formatter)
+    result: list[str] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        for chunk in executor.map(render, chunks):
+            result.extend(chunk)
+    return result
@@ -0,0 +1,222 @@
+"""
+Parse human readable durations back into timedelta or relativedelta.
+
+Every label of every style is recognised, singular or plural, along with the
+list joiners of the locale, so whatever ``from_timedelta`` writes comes back
+unchanged::
+
+    >>> to_timedelta("1 year, 6 days, 1 hour and 1 minute")
+    datetime.timedelta(days=371, seconds=3660)
+    >>> to_timedelta("3h 5m 2s")
+    datetime.timedelta(seconds=11102)
+
+Labels are matched case sensitively, ``m`` is minutes while ``M`` is months.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .locales import DEFAULT_LOCALE, get_locale
+from .readabledelta import (
+    DAYS,
+    HOURS,
+    MICROSECONDS,
+    MILLISECONDS,
+    MINUTES,
+    MONTHS,
+    SECONDS,
+    TD_UNIT_MICROSECONDS,
+    WEEKS,
+    YEARS,
+    _Memo,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dateutil.relativedelta import relativedelta
+
+# relativedelta field and multiplier for each unit
+_RD_FIELDS: dict[str, tuple[str, int]] = {
+    YEARS: ("years", 1),
+    MONTHS: ("months", 1),
+    WEEKS: ("days", 7),
+    DAYS: ("days", 1),
+    HOURS: ("hours", 1),
+    MINUTES: ("minutes", 1),
+    SECONDS: ("seconds", 1),
+    MILLISECONDS: ("microseconds", 1000),
+    MICROSECONDS: ("microseconds", 1),
+}
+
+
+class DeltaParser:
+    """
+    Reusable parser for the strings of one locale.
+
+    The labels and joiners are compiled into a single tokenizer when the
+    parser is built, so parsing only pays for one scan of the text.
+
+    A leading ``-`` on any part makes the whole duration negative, the way
+    ``from_timedelta`` only signs the first part. Repeated units add up.
+
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    """
+
+    def __init__(self, locale: str = DEFAULT_LOCALE) -> None:
+        compiled = get_locale(locale)
+        self.locale = locale
+
+        # every label of every style, singular or plural, to its unit.
+        units: dict[str, str] = {}
+        for unit, styles in compiled.labels.items():
+            for table in styles.values():
+                for label in set(table):
+                    other = units.setdefault(label, unit)
+                    if other != unit:
+                        msg = (
+                            f"locale {locale!r} uses {label!r} for both {other} "
+                            f"and {unit}, it cannot be parsed"
+                        )
+                        raise ValueError(msg)
+        self._sizes = {
+            label: TD_UNIT_MICROSECONDS[unit]  # type: ignore[index]
+            for label, unit in units.items()
+            if unit != MONTHS
+        }
+        self._fields = {label: _RD_FIELDS[unit] for label, unit in units.items()}
+
+        # longest first, so "ms" wins over "m" and "mins" over "min".
+        labels = "|".join(map(re.escape, sorted(units, key=len, reverse=True)))
+        joiners = {compiled.separator.strip(), compiled.last_separator.strip()}
+        separators = "|".join(
+            [r"\s+", *map(re.escape, sorted(joiners - {""}, key=len, reverse=True))]
+        )
+        part = rf"([-+]?)([0-9]+)\s*({labels})(?![^\W\d])"
+        # findall gives (sign, count, label, unexpected) per token, separators
+        # come out as all empty.
+        self._tokens = re.compile(rf"{part}|(?:{separators})|(\S+)")
+
+    def _error(self, text: str, unexpected: str = "") -> ValueError:
+        msg = f"cannot parse {text!r} as a duration"
+        if unexpected:
+            msg += f", unexpected {unexpected!r}"
+        return ValueError(msg)
+
+    def to_microseconds(self, text: str) -> int:
+        """Parse a string into a signed number of microseconds, without months."""
+        sizes = self._sizes
+        total = 0
+        negative = False
+        found = False
+        for sign, count, label, unexpected in self._tokens.findall(text):
+            if unexpected:
+                raise self._error(text, unexpected)
+            if not label:
+                continue
+            try:
+                total += int(count) * sizes[label]
+            except KeyError:
+                msg = (
+                    f"cannot parse {text!r} as a timedelta, months have no fixed length"
+                )
+                raise ValueError(msg) from None
+            negative = negative or sign == "-"
+            found = True
+        if not found:
+            raise self._error(text)
+        return -total if negative else total
+
+    def to_timedelta(self, text: str) -> timedelta:
+        """
+        Parse a string into a timedelta.
+
+        Years are 365 days, as in ``from_timedelta``. Months are rejected.
+        """
+        return timedelta(microseconds=self.to_microseconds(text))
+
+    def to_relativedelta(self, text: str) -> relativedelta:
+        """Parse a string into a relativedelta, weeks are kept as days."""
+        from dateutil.relativedelta import relativedelta  # noqa: PLC0415
+
+        fields = self._fields
+        values = dict.fromkeys(
+            ("years", "months", "days", "hours", "minutes", "seconds", "microseconds"),
+            0,
+        )
+        negative = False
+        found = False
+        for sign, count, label, unexpected in self._tokens.findall(text):
+            if unexpected:
+                raise self._error(text, unexpected)
+            if not label:
+                continue
+            field, multiplier = fields[label]
+            values[field] += int(count) * multiplier
+            negative = negative or sign == "-"
+            found = True
+        if not found:
+            raise self._error(text)
+        if negative:
+            values = {field: -value for field, value in values.items()}
+        return relativedelta(**values)  # type: ignore[arg-type]
+
+
+@functools.lru_cache(maxsize=16)
+def _parser(locale: str) -> DeltaParser:
+    """Shared parsers for the to_* functions, one per locale."""
+    return DeltaParser(locale)
+
+
+def to_timedelta(text: str, locale: str = DEFAULT_LOCALE) -> timedelta:
+    """
+    Parse a Human readable string into a timedelta.
+
+    ``to_timedelta(from_timedelta(delta, ...)) == delta`` for every style, set
+    of units and showzero, as long as the sign is included.
+
+    :param text: e.g. "1 year, 6 days, 1 hour and 1 minute" or "3h 5m 2s"
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    """
+    return _parser(locale).to_timedelta(text)
+
+
+def to_relativedelta(text: str, locale: str = DEFAULT_LOCALE) -> relativedelta:
+    """
+    Parse a Human readable string into a relativedelta.
+
+    Round trips ``from_relativedelta`` output for relativedeltas whose fields
+    all have the same sign.
+
+    :param text: e.g. "1 year, 2 months and 3 days" or "1Y 2M 3D"
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    """
+    return _parser(locale).to_relativedelta(text)
+
+
+def to_timedelta_many(
+    texts: Iterable[str], locale: str = DEFAULT_LOCALE
+) -> list[timedelta]:
+    """
+    Parse many strings into timedeltas, in order.
+
+    The parser is set up once, and each distinct string is only parsed once,
+    remembering up to ``MEMO_SIZE`` of them.
+    """
+    return list(map(_Memo(_parser(locale).to_timedelta).__getitem__, texts))
+
+
+def to_relativedelta_many(
+    texts: Iterable[str], locale: str = DEFAULT_LOCALE
+) -> list[relativedelta]:
+    """
+    Parse many strings into relativedeltas, in order.
+
+    The parser is set up once, and each distinct string is only parsed once,
+    remembering up to ``MEMO_SIZE`` of them.
+    """
+    return list(map(_Memo(_parser(locale).to_relativedelta).__getitem__, texts))
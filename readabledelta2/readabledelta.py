@@ -7,13 +7,31 @@ https://github.com/wimglenn/readabledelta/blob/master/readabledelta.py
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from enum import Enum
-from typing import overload
+import functools
+import operator
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum, IntFlag
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar, overload
 
-from dateutil.relativedelta import relativedelta
+from .locales import DEFAULT_LOCALE, EXACT_COUNTS, get_locale
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+    # dateutil is only imported at runtime when something asks for it, see
+    # the module ``__getattr__`` below.
+    from dateutil.relativedelta import relativedelta
+
+    from .instrument import _Clock
+
+# times the phases of each call while readabledelta2.instrument is enabled.
+_instrument: type[_Clock] | None = None
 
 UTC = timezone.utc
+# relativedeltas whose sign depends on the calendar are measured from here.
+DEFAULT_ANCHOR = datetime(1970, 1, 1, tzinfo=UTC)
+# distinct values the bulk renderers remember, cleared when full.
+MEMO_SIZE = 65536
 
 
 class ExtendedEnum(Enum):
@@ -63,7 +81,8 @@ class RDUnit(str, ExtendedEnum):
     MICROSECONDS = MICROSECONDS
 
 
-T_delta = relativedelta | timedelta
+if TYPE_CHECKING:
+    T_delta = relativedelta | timedelta
 
 # @formatter:off
 # fmt: off
@@ -82,60 +101,163 @@ TIME_UNITS: dict[str, dict[Style, str]] = {
 # @formatter:on
 
 
+class UnitSet(IntFlag):
+    """
+    Set of time units stored as a bitmask.
+
+    Larger units have higher bits, so union, membership and finding the smallest
+    or largest unit are single integer operations. Iterating yields the single
+    unit flags from largest to smallest. A UnitSet is accepted anywhere a tuple
+    of units is, and being hashable it makes a good cache key.
+    """
+
+    MICROSECONDS = 1
+    MILLISECONDS = 2
+    SECONDS = 4
+    MINUTES = 8
+    HOURS = 16
+    DAYS = 32
+    WEEKS = 64
+    MONTHS = 128
+    YEARS = 256
+
+    # IntFlag operators and constructor run Python code from the enum module,
+    # the methods below work on plain ints and build sets through _unitset.
+
+    @classmethod
+    def from_units(cls, units: Iterable[str] | UnitSet) -> UnitSet:
+        """Convert a tuple of units, raising ValueError for unknown ones."""
+        if isinstance(units, UnitSet):
+            return units
+        mask = 0
+        for unit in units:
+            bit = _UNIT_BITS.get(unit) if isinstance(unit, str) else None
+            if bit is None:
+                msg = "Unknown units"
+                raise ValueError(msg)
+            mask |= bit
+        return _unitset(mask)
+
+    @property
+    def unit(self) -> str:
+        """Name of the largest unit in the set, e.g. 'days'."""
+        return _UNIT_NAMES[1 << self.bit_length() >> 1]
+
+    @property
+    def units(self) -> tuple[str, ...]:
+        """Names of the units in the set, from largest to smallest."""
+        return _unit_names(int(self))
+
+    @property
+    def smallest(self) -> UnitSet:
+        """Smallest unit in the set."""
+        mask = int(self)
+        return _unitset(mask & -mask)
+
+    @property
+    def largest(self) -> UnitSet:
+        """Largest unit in the set."""
+        return _unitset(1 << self.bit_length() >> 1)
+
+    def issubset(self, other: UnitSet) -> bool:
+        """Return True if every unit in this set is also in other."""
+        mask = int(self)
+        return mask & int(other) == mask
+
+    def with_smaller_units(self) -> UnitSet:
+        """Return the set plus every unit smaller than its smallest unit."""
+        mask = int(self)
+        if not mask:
+            return self
+        return _unitset(mask | ((mask & -mask) - 1))
+
+    def __contains__(self, unit: object) -> bool:
+        if isinstance(unit, str):
+            bit = _UNIT_BITS.get(unit)
+            return bit is not None and bool(int(self) & bit)
+        if isinstance(unit, int):
+            unit = int(unit)
+            return int(self) & unit == unit
+        return False
+
+    def __iter__(self) -> Iterator[UnitSet]:
+        return iter(_unit_flags(int(self)))
+
+    def __len__(self) -> int:
+        return int(self).bit_count()
+
+
+_UNIT_NAMES: dict[int, str] = {
+    UnitSet.MICROSECONDS: MICROSECONDS,
+    UnitSet.MILLISECONDS: MILLISECONDS,
+    UnitSet.SECONDS: SECONDS,
+    UnitSet.MINUTES: MINUTES,
+    UnitSet.HOURS: HOURS,
+    UnitSet.DAYS: DAYS,
+    UnitSet.WEEKS: WEEKS,
+    UnitSet.MONTHS: MONTHS,
+    UnitSet.YEARS: YEARS,
+}
+# plain ints, so the bit arithmetic stays on int.
+_UNIT_BITS: dict[str, int] = {name: int(bit) for bit, name in _UNIT_NAMES.items()}
+
+
+@functools.cache
+def _unitset(mask: int) -> UnitSet:
+    """The UnitSet of a mask, built once; there are only 512 of them."""
+    return UnitSet(mask)
+
+
+@functools.cache
+def _unit_flags(mask: int) -> tuple[UnitSet, ...]:
+    """The single unit flags of a mask, largest first."""
+    return tuple(_unitset(bit) for bit in reversed(_UNIT_NAMES) if mask & bit)
+
+
+@functools.cache
+def _unit_names(mask: int) -> tuple[str, ...]:
+    """The unit names of a mask, largest first."""
+    return tuple(_UNIT_NAMES[bit] for bit in _unit_flags(mask))
+
+
+TD_UNITSET = UnitSet.from_units(TDUnit)
+RD_UNITSET = UnitSet.from_units(RDUnit)
+
+# number of microseconds in each timedelta unit, used by the split ladder.
+TD_UNIT_MICROSECONDS: dict[TDUnit, int] = {
+    TDUnit.YEARS: 365 * 86400 * 1000000,
+    TDUnit.WEEKS: 7 * 86400 * 1000000,
+    TDUnit.DAYS: 86400 * 1000000,
+    TDUnit.HOURS: 60 * 60 * 1000000,
+    TDUnit.MINUTES: 60 * 1000000,
+    TDUnit.SECONDS: 1000000,
+    TDUnit.MILLISECONDS: 1000,
+    TDUnit.MICROSECONDS: 1,
+}
+
+
 @overload
 def find_smallest_unit(units: tuple[RDUnit, ...]) -> RDUnit: ...
 @overload
 def find_smallest_unit(units: tuple[TDUnit, ...]) -> TDUnit: ...
 @overload
-def find_smallest_unit(units: tuple[str, ...]) -> str: ...
+def find_smallest_unit(units: tuple[str, ...] | UnitSet) -> str: ...
 def find_smallest_unit(
-    units: tuple[RDUnit | TDUnit | str, ...]
+    units: tuple[RDUnit | TDUnit | str, ...] | UnitSet,
 ) -> str | RDUnit | TDUnit:
     """Finds the smallest unit in the tuple"""
+    mask = int(_to_unitset(units))
+    if not mask:
+        raise RuntimeWarning  # pragma: nocover
 
-    def rtn(utype: str) -> RDUnit | TDUnit | str:
-        for unit in units:
-            if unit == utype:
-                return unit
-
-        raise RuntimeError  # pragma: nocover
-
-    if not set(units).issubset(
-        (
-            YEARS,
-            MONTHS,
-            WEEKS,
-            DAYS,
-            HOURS,
-            MINUTES,
-            SECONDS,
-            MILLISECONDS,
-            MICROSECONDS,
-        )
-    ):
-        msg = "Unknown units"
-        raise ValueError(msg)
+    smallest = _UNIT_NAMES[mask & -mask]
+    if isinstance(units, UnitSet):
+        return smallest
+    for unit in units:
+        if unit == smallest:
+            return unit
 
-    if MICROSECONDS in units:
-        return rtn(MICROSECONDS)
-    if MILLISECONDS in units:
-        return rtn(MILLISECONDS)
-    if SECONDS in units:
-        return rtn(SECONDS)
-    if MINUTES in units:
-        return rtn(MINUTES)
-    if HOURS in units:
-        return rtn(HOURS)
-    if DAYS in units:
-        return rtn(DAYS)
-    if WEEKS in units:
-        return rtn(WEEKS)
-    if MONTHS in units:
-        return rtn(MONTHS)
-    if YEARS in units:
-        return rtn(YEARS)
-
-    raise RuntimeWarning  # pragma: nocover
+    raise RuntimeError  # pragma: nocover
 
 
 @overload
@@ -143,290 +265,371 @@ def sort_units(units: tuple[RDUnit, ...]) -> tuple[RDUnit, ...]: ...
 @overload
 def sort_units(units: tuple[TDUnit, ...]) -> tuple[TDUnit, ...]: ...
 @overload
-def sort_units(units: tuple[str, ...]) -> tuple[str, ...]: ...
+def sort_units(units: tuple[str, ...] | UnitSet) -> tuple[str, ...]: ...
 def sort_units(
-    units: tuple[RDUnit | TDUnit | str, ...]
+    units: tuple[RDUnit | TDUnit | str, ...] | UnitSet,
 ) -> tuple[RDUnit | TDUnit | str, ...]:
     """Return tuple of units sorted from largest to smallest time unit"""
-    units = tuple(set(units))
-    if not set(units).issubset(
-        (
-            YEARS,
-            MONTHS,
-            WEEKS,
-            DAYS,
-            HOURS,
-            MINUTES,
-            SECONDS,
-            MILLISECONDS,
-            MICROSECONDS,
-        )
-    ):
-        msg = "Unknown units"
-        raise ValueError(msg)
-
-    new_units = []
-
-    def append(utype: str) -> None:
-        for unit in units:
-            if unit == utype:
-                new_units.append(unit)
-
-    if YEARS in units:
-        append(YEARS)
-    if MONTHS in units:
-        append(MONTHS)
-    if WEEKS in units:
-        append(WEEKS)
-    if DAYS in units:
-        append(DAYS)
-    if HOURS in units:
-        append(HOURS)
-    if MINUTES in units:
-        append(MINUTES)
-    if SECONDS in units:
-        append(SECONDS)
-    if MILLISECONDS in units:
-        append(MILLISECONDS)
-    if MICROSECONDS in units:
-        append(MICROSECONDS)
-    return tuple(new_units)
+    names = _unit_names(int(_to_unitset(units)))
+    if isinstance(units, UnitSet):
+        return names
+    # hand back the caller's own objects, not our names for them.
+    originals = dict(zip(units, units, strict=True))
+    return tuple(map(originals.__getitem__, names))
+
+
+@functools.lru_cache(maxsize=256)
+def _tuple_unitset(units: tuple[str, ...]) -> UnitSet:
+    """``UnitSet.from_units`` for tuples, which callers tend to pass again."""
+    return UnitSet.from_units(units)
+
+
+def _to_unitset(units: Iterable[str] | UnitSet) -> UnitSet:
+    """Convert units to a UnitSet, raising ValueError for unknown ones."""
+    if type(units) is tuple:
+        return _tuple_unitset(units)
+    return UnitSet.from_units(units)
+
+
+def _timedelta_unitset(units: Iterable[TDUnit | str] | UnitSet | None) -> UnitSet:
+    """Convert units once for the timedelta functions."""
+    mask = None
+    if units is not None:
+        try:
+            mask = _to_unitset(units)
+        except ValueError:
+            pass
+        else:
+            if not mask.issubset(TD_UNITSET):
+                mask = None
+        if mask is None:
+            msg = f"units can only be the following: {tuple(TDUnit)}"
+            raise ValueError(msg)
+    return mask or _unitset(0)
+
+
+def _relativedelta_unitset(
+    units: Iterable[RDUnit | str] | UnitSet | None,
+) -> UnitSet:
+    """Convert units once for the relativedelta functions."""
+    mask = None
+    if units is not None:
+        try:
+            mask = _to_unitset(units)
+        except ValueError:
+            pass
+        else:
+            if not mask.issubset(RD_UNITSET):
+                mask = None
+        if mask is None:
+            msg = f"units can only be the following: {tuple(RDUnit)}"
+            raise ValueError(msg)
+    return mask or _unitset(0)
 
 
-################################################################################
-def split_timedelta_units(
-    delta: timedelta, units: tuple[TDUnit | str, ...] = tuple(TDUnit)
-) -> dict[TDUnit, int]:
+@functools.lru_cache(maxsize=256)
+def _timedelta_ladder(units: UnitSet) -> UnitSet:
     """
+    Units the timedelta split fills for the requested units.
 
-    :param timedelta delta:
-    :param units: array of time magnitudes to be used for output
+    Leftovers below the smallest requested unit spill into the next smaller unit,
+    so every unit below it is filled along with the requested ones.
     """
-    units = sort_units(units)
-    if not set(units).issubset(tuple(TDUnit)):
-        msg = f"units can only be the following: {tuple(TDUnit)}"
-        raise ValueError(msg)
-
-    delta = abs(delta)
-
-    # timedeltas are normalised to just days, seconds, microseconds in cpython
-    data = {}
-    days = delta.days
-    seconds = delta.seconds
-    microseconds = delta.microseconds
+    if not units:
+        # without any units years are never filled, everything else spills.
+        return TD_UNITSET & ~UnitSet.YEARS
+    return units.with_smaller_units() & TD_UNITSET
 
-    units_list = list(units)
 
-    def have_leftovers() -> bool:
-        return bool(days or seconds or microseconds)
-
-    if TDUnit.YEARS in units_list:
-        data[TDUnit.YEARS], days = divmod(days, 365)
-        units_list.pop(0)
-    else:
-        data[TDUnit.YEARS] = 0
-
-    if not units_list and have_leftovers():
-        weeks, _ = divmod(days, 7)
-        if weeks:
-            units_list.append(TDUnit.WEEKS)
-
-    if TDUnit.WEEKS in units_list:
-        data[TDUnit.WEEKS], days = divmod(days, 7)
-        units_list.pop(0)
-    else:
-        data[TDUnit.WEEKS] = 0
+@functools.lru_cache(maxsize=256)
+def _relativedelta_ladder(units: UnitSet) -> UnitSet:
+    """
+    Units the relativedelta split fills for the requested units.
 
-    if not units_list and have_leftovers() and days:
-        units_list.append(TDUnit.DAYS)
+    Same as timedelta, except months are always kept because there is no way to
+    convert them to smaller units without the relative dates.
+    """
+    if not units:
+        return (RD_UNITSET & ~UnitSet.YEARS) | UnitSet.MONTHS
+    return (units.with_smaller_units() & RD_UNITSET) | UnitSet.MONTHS
+
+
+@functools.lru_cache(maxsize=256)
+def _ladder_units(ladder: UnitSet) -> tuple[bool, bool, bool, bool, bool, bool]:
+    """Whether the ladder has years, weeks, days, hours, minutes and seconds."""
+    return (
+        YEARS in ladder,
+        WEEKS in ladder,
+        DAYS in ladder,
+        HOURS in ladder,
+        MINUTES in ladder,
+        SECONDS in ladder,
+    )
+
+
+def _split_relativedelta(
+    delta: relativedelta | _Fields, ladder: UnitSet
+) -> tuple[int, int, int, int, int, int, int, int]:
+    """
+    Split the absolute value of a relativedelta over the ladder units.
 
-    if TDUnit.DAYS in units_list:
-        data[TDUnit.DAYS] = days
-        units_list.pop(0)
-    else:
-        data[TDUnit.DAYS] = 0
-        seconds += days * 86400  # 24 * 60 * 60
+    Returns the values for years, months, weeks, days, hours, minutes, seconds
+    and microseconds; units outside the ladder carry down into smaller ones.
+    Like ``abs(delta)``, every field is made positive on its own.
+    """
+    has_years, has_weeks, has_days, has_hours, has_minutes, has_seconds = _ladder_units(
+        ladder
+    )
+    years = abs(delta.years)
+    months = abs(delta.months)
+    weeks = 0
+    days = abs(delta.days)
+    hours = abs(delta.hours)
+    minutes = abs(delta.minutes)
+    seconds = abs(delta.seconds)
+    microseconds = abs(delta.microseconds)
 
-    if not units_list and have_leftovers():
-        hours, _ = divmod(seconds, 60 * 60)
-        if hours:
-            units_list.append(TDUnit.HOURS)
+    # years are relative due to leapyear.... so unless they are in the delta..
+    # we won't calculate them
+    if not has_years:
+        months += years * 12
+        years = 0
+    if has_weeks:
+        weeks, days = divmod(days, 7)
+    if not has_days:
+        hours += days * 24
+        days = 0
+    if not has_hours:
+        minutes += hours * 60
+        hours = 0
+    if not has_minutes:
+        seconds += minutes * 60
+        minutes = 0
+    if not has_seconds:
+        microseconds += seconds * 1000000  # 1000 * 1000
+        seconds = 0
+    return years, months, weeks, days, hours, minutes, seconds, microseconds
 
-    if TDUnit.HOURS in units_list:
-        data[TDUnit.HOURS], seconds = divmod(seconds, 60 * 60)
-        units_list.pop(0)
-    else:
-        data[TDUnit.HOURS] = 0
 
-    if not units_list and have_leftovers():
-        minutes, _ = divmod(seconds, 60)
-        if minutes:
-            units_list.append(TDUnit.MINUTES)
+_U = TypeVar("_U", bound=str)
+_K = TypeVar("_K", bound="Hashable")
+_V = TypeVar("_V")
 
-    if TDUnit.MINUTES in units_list:
-        data[TDUnit.MINUTES], seconds = divmod(seconds, 60)
-        units_list.pop(0)
-    else:
-        data[TDUnit.MINUTES] = 0
 
-    if not units_list and have_leftovers() and seconds:
-        units_list.append(TDUnit.SECONDS)
+class DeltaParts(NamedTuple):
+    """
+    A split timedelta or relativedelta, returned by ``split_*_units(as_parts=True)``.
 
-    if TDUnit.SECONDS in units_list:
-        data[TDUnit.SECONDS] = seconds
-        units_list.pop(0)
-    else:
-        data[TDUnit.SECONDS] = 0
-        microseconds += seconds * 1000000  # 1000 * 1000
+    A plain tuple underneath, read by name or by index, so keeping millions of
+    them costs a fraction of the dicts the split functions return by default.
+    The unit values are absolute and ``sign`` is -1, 0 or 1. Units the split did
+    not fill are 0, so are ``months`` for timedeltas and ``milliseconds`` for
+    relativedeltas.
+    """
 
-    if not units_list and have_leftovers():
-        milliseconds, _ = divmod(microseconds, 1000)
-        if milliseconds:
-            units_list.append(TDUnit.MILLISECONDS)
+    sign: int
+    years: int = 0
+    months: int = 0
+    weeks: int = 0
+    days: int = 0
+    hours: int = 0
+    minutes: int = 0
+    seconds: int = 0
+    milliseconds: int = 0
+    microseconds: int = 0
+
+    @overload
+    def to_dict(self) -> dict[str, int]: ...
+    @overload
+    def to_dict(self, units: Iterable[_U]) -> dict[_U, int]: ...
+    def to_dict(self, units: Iterable[Any] = TDUnit) -> dict[Any, int]:
+        """
+        Return the unit values keyed on units, all of ``TDUnit`` by default.
+
+        Parts of relativedelta splits default to all of ``RDUnit`` instead, so
+        ``to_dict()`` is the dict the split function returns by default.
+        """
+        return {unit: getattr(self, unit) for unit in units}
+
+
+class _RelativeDeltaParts(DeltaParts):
+    """`DeltaParts` of a relativedelta split, keyed on ``RDUnit`` by default."""
+
+    __slots__ = ()
+
+    @overload
+    def to_dict(self) -> dict[str, int]: ...
+    @overload
+    def to_dict(self, units: Iterable[_U]) -> dict[_U, int]: ...
+    def to_dict(self, units: Iterable[Any] = RDUnit) -> dict[Any, int]:
+        return super().to_dict(units)
+
+
+@functools.lru_cache(maxsize=256)
+def _timedelta_sizes(units: UnitSet) -> tuple[int, ...]:
+    """Microseconds per DeltaParts unit field, 0 for the fields the split skips."""
+    ladder = _timedelta_ladder(units)
+    return tuple(
+        TD_UNIT_MICROSECONDS[TDUnit(name)] if name in ladder else 0
+        for name in DeltaParts._fields[1:]
+    )
 
-    if TDUnit.MILLISECONDS in units_list:
-        data[TDUnit.MILLISECONDS], microseconds = divmod(microseconds, 1000)
-        units_list.pop(0)
-    else:
-        data[TDUnit.MILLISECONDS] = 0
 
-    if not units_list and have_leftovers() and microseconds:
-        units_list.append(TDUnit.MICROSECONDS)
+################################################################################
+@overload
+def split_timedelta_units(
+    delta: timedelta,
+    units: tuple[TDUnit | str, ...] | UnitSet = ...,
+    *,
+    as_parts: Literal[False] = False,
+) -> dict[TDUnit, int]: ...
+@overload
+def split_timedelta_units(
+    delta: timedelta,
+    units: tuple[TDUnit | str, ...] | UnitSet = ...,
+    *,
+    as_parts: Literal[True],
+) -> DeltaParts: ...
+def split_timedelta_units(
+    delta: timedelta,
+    units: tuple[TDUnit | str, ...] | UnitSet = tuple(TDUnit),
+    *,
+    as_parts: bool = False,
+) -> dict[TDUnit, int] | DeltaParts:
+    """
 
-    if TDUnit.MICROSECONDS in units_list:
-        data[TDUnit.MICROSECONDS] = microseconds
-        units_list.pop(0)
-    else:
-        data[TDUnit.MICROSECONDS] = 0
+    :param timedelta delta:
+    :param units: array of time magnitudes to be used for output
+    :param as_parts: return a `DeltaParts`, with the sign, instead of a dict
+    """
+    mask = _to_unitset(units)
+    if not mask.issubset(TD_UNITSET):
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        raise ValueError(msg)
 
-    return data
+    # timedeltas are normalised to just days, seconds, microseconds in cpython
+    total = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    values = [(total > 0) - (total < 0)]
+    total = abs(total)
+    for size in _timedelta_sizes(mask):
+        if size:
+            val, total = divmod(total, size)
+            values.append(val)
+        else:
+            values.append(0)
+    parts = DeltaParts._make(values)
+    if as_parts:
+        return parts
+    return parts.to_dict(TDUnit)
 
 
 ################################################################################
+@overload
+def split_relativedelta_units(
+    delta: relativedelta,
+    units: tuple[RDUnit | str, ...] | UnitSet = ...,
+    *,
+    as_parts: Literal[False] = False,
+) -> dict[RDUnit, int]: ...
+@overload
+def split_relativedelta_units(
+    delta: relativedelta,
+    units: tuple[RDUnit | str, ...] | UnitSet = ...,
+    *,
+    as_parts: Literal[True],
+) -> DeltaParts: ...
 def split_relativedelta_units(
-    delta: relativedelta, units: tuple[RDUnit | str, ...] = tuple(RDUnit)
-) -> dict[RDUnit, int]:
+    delta: relativedelta,
+    units: tuple[RDUnit | str, ...] | UnitSet = tuple(RDUnit),
+    *,
+    as_parts: bool = False,
+) -> dict[RDUnit, int] | DeltaParts:
     """
 
     :param relativedelta delta:
     :param units: array of time magnitudes to be used for output
+    :param as_parts: return a `DeltaParts`, with the sign as in
+            `relativedelta_sign`, instead of a dict
     """
-    units = sort_units(units)
-    if not set(units).issubset(tuple(RDUnit)):
+    mask = _to_unitset(units)
+    if not mask.issubset(RD_UNITSET):
         msg = f"units can only be the following: {tuple(RDUnit)}"
         raise ValueError(msg)
 
-    delta = abs(delta)
-
-    data = {}
-    years = delta.years
-    months = delta.months
-    weeks = delta.weeks
-    days = delta.days
-    hours = delta.hours
-    minutes = delta.minutes
-    seconds = delta.seconds
-    microseconds = delta.microseconds
-
-    units_list = list(units)
-
-    def have_leftovers() -> bool:
-        return bool(weeks or days or hours or minutes or seconds or microseconds)
-
-    # years are relative due to leapyear.... so unless they are in the delta..
-    # we won't calculate them
-    if RDUnit.YEARS in units_list:
-        data[RDUnit.YEARS] = years
-        units_list.pop(0)
-    else:
-        data[RDUnit.YEARS] = 0
-        months += years * 12
-
-    # it's impossible to filter out months because there is no way to
-    # convert them to smaller units without the relative dates.
-    if RDUnit.MONTHS not in units_list and months:
-        units_list.append(RDUnit.MONTHS)
-        units_list = list(sort_units(tuple(units_list)))
-
-    if RDUnit.MONTHS in units_list:
-        data[RDUnit.MONTHS] = months
-        months = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.MONTHS] = 0
-
-    if not units_list and have_leftovers():
-        weeks, _ = divmod(days, 7)
-        if weeks:
-            units_list.append(RDUnit.WEEKS)
-
-    if RDUnit.WEEKS in units_list:
-        data[RDUnit.WEEKS], days = divmod(days, 7)
-        weeks = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.WEEKS] = 0
-
-    if not units_list and have_leftovers() and days:
-        units_list.append(RDUnit.DAYS)
-
-    if RDUnit.DAYS in units_list:
-        data[RDUnit.DAYS] = days
-        days = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.DAYS] = 0
-        hours += days * 24
-
-    if not units_list and have_leftovers() and hours:
-        units_list.append(RDUnit.HOURS)
-
-    if RDUnit.HOURS in units_list:
-        data[RDUnit.HOURS] = hours
-        hours = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.HOURS] = 0
-        minutes += hours * 60
-
-    if not units_list and have_leftovers() and minutes:
-        units_list.append(RDUnit.MINUTES)
-
-    if RDUnit.MINUTES in units_list:
-        data[RDUnit.MINUTES] = minutes
-        minutes = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.MINUTES] = 0
-        seconds += minutes * 60
-
-    if not units_list and have_leftovers() and seconds:
-        units_list.append(RDUnit.SECONDS)
+    values = _split_relativedelta(delta, _relativedelta_ladder(mask))
+    if as_parts:
+        years, months, weeks, days, hours, minutes, seconds, micro = values
+        return _RelativeDeltaParts(
+            relativedelta_sign(delta),
+            years,
+            months,
+            weeks,
+            days,
+            hours,
+            minutes,
+            seconds,
+            0,
+            micro,
+        )
+    return dict(zip(RDUnit, values, strict=True))
 
-    if RDUnit.SECONDS in units_list:
-        data[RDUnit.SECONDS] = seconds
-        seconds = 0
-        units_list.pop(0)
-    else:
-        data[RDUnit.SECONDS] = 0
-        microseconds += seconds * 1000000  # 1000 * 1000
 
-    if not units_list and have_leftovers() and microseconds:
-        units_list.append(RDUnit.MICROSECONDS)
+_DAY_MICROSECONDS = 86400 * 1000000
 
-    if RDUnit.MICROSECONDS in units_list:
-        data[RDUnit.MICROSECONDS] = microseconds
-        units_list.pop(0)
-    else:
-        data[RDUnit.MICROSECONDS] = 0
 
-    return data
+def relativedelta_sign(delta: relativedelta, anchor: datetime | None = None) -> int:
+    """
+    Return -1, 0 or 1 for a relativedelta, the way it moves the anchor date.
 
+    The sign is worked out from the fields when the calendar cannot change it:
+    when the months and the fixed length part agree, or when one of them
+    clearly outweighs the other (a month is 28 to 31 days). Otherwise, or when
+    the delta has absolute fields, leapdays, a weekday or fractional values,
+    ``anchor + delta`` is compared with ``anchor``.
 
-def is_negative_relativedelta(delta: relativedelta) -> bool:
+    :param relativedelta delta:
+    :param anchor: date to measure calendar dependent deltas from, defaults to
+            ``DEFAULT_ANCHOR`` (1970-01-01 UTC)
+    """
+    months = delta.years * 12 + delta.months
+    fields = (delta.days, delta.hours, delta.minutes, delta.seconds)
+    micro = delta.microseconds
+    if (
+        type(months) is int
+        and type(micro) is int
+        and all(type(field) is int for field in fields)
+        and not delta.leapdays
+        and not delta.weekday
+        and delta.year is None
+        and delta.month is None
+        and delta.day is None
+        and delta.hour is None
+        and delta.minute is None
+        and delta.second is None
+        and delta.microsecond is None
+    ):
+        days, hours, minutes, seconds = fields
+        micro += (((days * 24 + hours) * 60 + minutes) * 60 + seconds) * 1000000
+        if not months or not micro or (months > 0) == (micro > 0):
+            value = months or micro
+            return (value > 0) - (value < 0)
+        # |months| months span between 28*|months| - 3 and 31*|months| + 3 days
+        # from any date, the 3 being the most the day can be clamped by.
+        if abs(micro) < (28 * abs(months) - 3) * _DAY_MICROSECONDS:
+            return 1 if months > 0 else -1
+        if abs(micro) > (31 * abs(months) + 3) * _DAY_MICROSECONDS:
+            return 1 if micro > 0 else -1
+
+    dt = DEFAULT_ANCHOR if anchor is None else anchor
+    moved = dt + delta
+    return (moved > dt) - (moved < dt)
+
+
+def is_negative_relativedelta(
+    delta: relativedelta, anchor: datetime | None = None
+) -> bool:
     """Determine if relativedelta is negative"""
-    dt: datetime = datetime(1970, 1, 1, tzinfo=UTC)
-    return (dt + delta) < (dt + relativedelta())
+    return relativedelta_sign(delta, anchor) < 0
 
 
 def is_negative_timedelta(delta: timedelta) -> bool:
@@ -434,58 +637,93 @@ def is_negative_timedelta(delta: timedelta) -> bool:
     return delta < timedelta(0)
 
 
-def _process_output(
-    data: dict[RDUnit, int] | dict[TDUnit, int],
-    style: Style,
-    units: tuple[RDUnit | TDUnit | str, ...],
-    showzero: bool,  # noqa: FBT001
-    sign: str,
-) -> str:
-    output = []
-    for k, val in data.items():
-        if not val and k not in units:
-            continue
-        if val == 0 and showzero is False:
-            continue
-        singular = val == 1
-        tu = TIME_UNITS.get(k)
-        if tu is None:  # pragma: no cover
-            msg = f"Invalid key {k}"
-            raise ValueError(msg)
+class _Fields(NamedTuple):
+    """Absolute relativedelta fields, all ``_split_relativedelta`` reads."""
 
-        unit = tu.get(style)
-        if unit is None:
-            msg = f"Invalid argument {style}"
-            raise ValueError(msg)
+    years: int
+    months: int
+    days: int
+    hours: int
+    minutes: int
+    seconds: int
+    microseconds: int
 
-        # make magnitude singular
-        if style in [Style.NORMAL, Style.SHORT] and singular:
-            unit = unit[:-1]
 
-        output.append(f"{sign}{val} {unit}")
-        # we only need to show the negative sign once.
-        if val != 0:
-            sign = ""
+# days per month outside of leap years, indexed by month.
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
-    if len(output) == 0:  # pragma: nocover
-        raise RuntimeError
-    if len(output) == 1:
-        result = output[0]
-    else:
-        left, right = output[:-1], output[-1:]
-        result = f"{', '.join(left)} and {right[0]}"
 
-    return result
+def _add_months(start: date, months: int) -> date:
+    """Move a date by whole months, clamping the day like dateutil."""
+    year, month = divmod(start.month - 1 + months, 12)
+    year += start.year
+    month += 1
+    day = start.day
+    if day > 28:  # noqa: PLR2004
+        if month == 2:  # noqa: PLR2004
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            day = min(day, 29 if leap else 28)
+        else:
+            day = min(day, _MONTH_DAYS[month])
+    return start.replace(year=year, month=month, day=day)
+
+
+def _difference(start: date, end: date) -> tuple[bool, _Fields]:
+    """
+    Return (negative, absolute fields) of ``relativedelta(end, start)``.
+
+    Walks the months the same way dateutil does, without building the
+    relativedelta or normalising it.
+    """
+    if not isinstance(start, date) or not isinstance(end, date):
+        msg = "from_datetimes only diffs datetime/date"
+        raise TypeError(msg)
+    # a date next to a datetime is taken as its midnight.
+    if isinstance(start, datetime) != isinstance(end, datetime):
+        if isinstance(start, datetime):
+            end = datetime.fromordinal(end.toordinal())
+        else:
+            start = datetime.fromordinal(start.toordinal())
+
+    negative = end < start
+    # dateutil adds a timedelta to the moved date, which clears fold.
+    base = start
+    if isinstance(start, datetime) and start.fold:
+        base = start.replace(fold=0)
+    months = (end.year - start.year) * 12 + end.month - start.month
+    moved = _add_months(base, months)
+    # step back when the day or the time of day overshot end.
+    if negative:
+        while end > moved:
+            months += 1
+            moved = _add_months(base, months)
+    else:
+        while end < moved:
+            months -= 1
+            moved = _add_months(base, months)
+
+    rest = end - moved
+    # like relativedelta, only the seconds carry the sign of the rest, the
+    # microseconds stay those of the normalised timedelta.
+    minutes, seconds = divmod(abs(rest.days * 86400 + rest.seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    years, months = divmod(abs(months), 12)
+    return negative, _Fields(
+        years, months, days, hours, minutes, seconds, rest.microseconds
+    )
 
 
 ################################################################################
 def from_timedelta(
     delta: timedelta,
     style: Style = Style.NORMAL,
-    units: tuple[TDUnit | str, ...] | None = None,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
     *,
     include_sign: bool = True,
     showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
 ) -> str:
     """
     Create Human readable timedelta string.
@@ -497,36 +735,36 @@ def from_timedelta(
             allows you to create negative deltas but still have a human sentence like
             '2 hours ago' instead of '-2 hours ago'
     :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
     """
-    negative = is_negative_timedelta(delta)
-    sign = "-" if include_sign and negative else ""
-    delta = abs(delta)
-
-    if units is None or len(units) == 0:
-        units = tuple(TDUnit)
-    else:
-        units = tuple(set(units))
-        if not set(units).issubset(tuple(TDUnit)):
-            msg = f"units can only be the following: {tuple(TDUnit)}"
-            raise ValueError(msg)
-
-    data = split_timedelta_units(delta, units)
-
-    if not delta and not showzero:
-        showzero = True
-        units = (TDUnit.SECONDS,)
-
-    return _process_output(data, style, units, showzero, sign)
+    clock = None if _instrument is None else _instrument("from_timedelta")
+    formatter = _formatter(
+        style,
+        _timedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+    if clock is not None:
+        clock.lap()
+    return formatter._format_timedelta(delta, clock)
 
 
 ################################################################################
 def from_relativedelta(
     delta: relativedelta,
     style: Style = Style.NORMAL,
-    units: tuple[RDUnit | str, ...] | None = None,
+    units: tuple[RDUnit | str, ...] | UnitSet | None = None,
     *,
     include_sign: bool = True,
     showzero: bool = False,
+    anchor: datetime | None = None,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
 ) -> str:
     """
     Create Human readable relativedelta string.
@@ -538,43 +776,574 @@ def from_relativedelta(
             allows you to create negative deltas but still have a human sentence like
             '2 hours ago' instead of '-2 hours ago'
     :param bool showzero: prints out the values even if they are zero
+    :param anchor: date the sign of calendar dependent deltas is measured from
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
     """
-    negative = is_negative_relativedelta(delta)
-    sign = "-" if include_sign and negative else ""
-    delta = abs(delta)
+    clock = None if _instrument is None else _instrument("from_relativedelta")
+    formatter = _formatter(
+        style,
+        _relativedelta_unitset(units),
+        include_sign,
+        showzero,
+        anchor,
+        locale,
+        max_units,
+    )
+    if clock is not None:
+        clock.lap()
+    return formatter._format_relativedelta(delta, clock)
 
-    if units is None or len(units) == 0:
-        units = tuple(RDUnit)
-    else:
-        units = tuple(set(units))
-        if not set(units).issubset(tuple(RDUnit)):
-            msg = f"units can only be the following: {tuple(RDUnit)}"
-            raise ValueError(msg)
 
-    data = split_relativedelta_units(delta, units)
+################################################################################
+def from_datetimes(
+    start: date,
+    end: date,
+    style: Style = Style.NORMAL,
+    units: tuple[RDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> str:
+    """
+    Create Human readable string for the time from start to end.
 
-    if not delta and not showzero:
-        showzero = True
-        units = (RDUnit.SECONDS,)
+    Same output as ``from_relativedelta(relativedelta(end, start))``, without
+    building the relativedelta or measuring its sign, and dateutil is not
+    needed. Negative when end is before start.
 
-    return _process_output(data, style, units, showzero, sign)
+    :param start: datetime or date
+    :param end: datetime or date
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    """
+    clock = None if _instrument is None else _instrument("from_datetimes")
+    formatter = _formatter(
+        style,
+        _relativedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+    if clock is not None:
+        clock.lap()
+    return formatter._format_datetimes(start, end, clock)
+
+
+################################################################################
+def from_microseconds(
+    microseconds: int,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> str:
+    """
+    Create Human readable string from an integer number of microseconds.
+
+    Same output as ``from_timedelta(timedelta(microseconds=microseconds))`` without
+    building the timedelta, and not limited to ``timedelta.max``.
+
+    :param int microseconds:
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    """
+    clock = None if _instrument is None else _instrument("from_microseconds")
+    formatter = _formatter(
+        style,
+        _timedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+    if clock is not None:
+        clock.lap()
+    return formatter._format_microseconds(operator.index(microseconds), clock)
+
+
+def seconds_to_microseconds(seconds: float) -> int:
+    """Convert seconds to microseconds, rounding to the nearest like timedelta."""
+    if isinstance(seconds, int):
+        return seconds * 1000000
+    # split off the whole seconds so large values keep their precision.
+    whole = int(seconds)
+    return whole * 1000000 + round((seconds - whole) * 1000000)
+
+
+def from_seconds(
+    seconds: float,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> str:
+    """
+    Create Human readable string from a number of seconds.
+
+    Fractions are rounded to the nearest microsecond, as ``timedelta`` does.
+    Same output as ``from_timedelta(timedelta(seconds=seconds))`` without
+    building the timedelta, and not limited to ``timedelta.max``.
+
+    :param float seconds:
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    """
+    clock = None if _instrument is None else _instrument("from_seconds")
+    formatter = _formatter(
+        style,
+        _timedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+    if clock is not None:
+        clock.lap()
+    return formatter._format_microseconds(seconds_to_microseconds(seconds), clock)
 
 
 ################################################################################
 def extract_units(
-    delta: timedelta, units: tuple[TDUnit, ...] = tuple(TDUnit)
+    delta: timedelta, units: tuple[TDUnit, ...] | UnitSet = tuple(TDUnit)
 ) -> tuple[TDUnit, ...]:
     """Given a timedelta, determine all the time magnitudes within said delta."""
-    units = tuple(set(units))
-    if not set(units).issubset(tuple(TDUnit)):
-        msg = f"units can only be the following: {tuple(TDUnit)}"
-        raise ValueError(msg)
-    data = split_timedelta_units(delta, units)
-    runits = []
-    for key, val in data.items():
-        if key not in units:
-            continue
-
-        if val:
-            runits.append(key)
-    return tuple(runits)
+    mask = _timedelta_unitset(units)
+    parts = split_timedelta_units(delta, mask, as_parts=True)
+    return tuple(unit for unit in TDUnit if getattr(parts, unit) and unit in mask)
+
+
+################################################################################
+class DeltaFormatter:
+    """
+    Reusable formatter that validates its options once.
+
+    Unit validation, sorting and label lookups happen when the formatter is built,
+    so ``format`` only pays for the arithmetic. Output is identical to
+    ``from_timedelta``/``from_relativedelta`` called with the same options.
+
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param anchor: date the sign of calendar dependent relativedeltas is
+            measured from
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, largest first
+
+    ``max_units`` truncates rather than rounds: the split stops at the last unit
+    shown and whatever is left over is dropped, so with ``max_units=2``
+    "1 year, 6 days and 23 hours" becomes "1 year and 6 days", never 7 days.
+    Only non-zero units count, with ``showzero`` the zero ones before the cut
+    are still shown.
+
+    The options are read only attributes, formatters are shared by the
+    ``from_*`` functions.
+    """
+
+    def __init__(
+        self,
+        style: Style = Style.NORMAL,
+        units: tuple[TDUnit | RDUnit | str, ...] | UnitSet | None = None,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        anchor: datetime | None = None,
+        locale: str = DEFAULT_LOCALE,
+        max_units: int | None = None,
+    ) -> None:
+        if style not in TIME_UNITS[SECONDS]:
+            msg = f"Invalid argument {style}"
+            raise ValueError(msg)
+        if max_units is not None and max_units < 1:
+            msg = f"max_units must be at least 1, not {max_units}"
+            raise ValueError(msg)
+
+        # read only, the from_* functions share formatters between calls.
+        self._style = style
+        self._units = units
+        self._include_sign = include_sign
+        self._showzero = showzero
+        self._anchor = anchor
+        self._locale_name = locale
+        self._max_units = max_units
+
+        self._locale = get_locale(locale)
+        self._separator = self._locale.separator
+        self._last_separator = self._locale.last_separator
+        self._sign = "-" if include_sign else ""
+        self._zero = f"0 {self._locale.labels[SECONDS][style][0]}"
+
+        mask = UnitSet.from_units(units) if units else _unitset(0)
+        td_units = mask or TD_UNITSET
+        rd_units = mask or RD_UNITSET
+        self._td_error = ""
+        self._rd_error = ""
+        if not td_units.issubset(TD_UNITSET):
+            self._td_error = f"units can only be the following: {tuple(TDUnit)}"
+        if not rd_units.issubset(RD_UNITSET):
+            self._rd_error = f"units can only be the following: {tuple(RDUnit)}"
+
+        # only the units the split ladder fills, largest to smallest.
+        self._td_units: tuple[TDUnit, ...] = ()
+        self._td_sizes: tuple[int, ...] = ()
+        self._td_labels: tuple[tuple[bool, tuple[str, ...], str], ...] = ()
+        if not self._td_error:
+            self._td_units = tuple(
+                TDUnit(flag.unit) for flag in _timedelta_ladder(td_units)
+            )
+            self._td_sizes = tuple(TD_UNIT_MICROSECONDS[u] for u in self._td_units)
+            self._td_labels = tuple(self._labels(u, td_units) for u in self._td_units)
+
+        self._rd_ladder = _unitset(0)
+        self._rd_labels: tuple[tuple[bool, tuple[str, ...], str], ...] = ()
+        if not self._rd_error:
+            self._rd_ladder = _relativedelta_ladder(rd_units)
+            self._rd_labels = tuple(self._labels(unit, rd_units) for unit in RDUnit)
+
+    @property
+    def style(self) -> Style:
+        """Style of the labels: normal, short or abbrev."""
+        return self._style
+
+    @property
+    def units(self) -> tuple[TDUnit | RDUnit | str, ...] | UnitSet | None:
+        """The units as given when the formatter was built."""
+        return self._units
+
+    @property
+    def include_sign(self) -> bool:
+        """False when the sign is left out."""
+        return self._include_sign
+
+    @property
+    def showzero(self) -> bool:
+        """True when the units are shown even if they are zero."""
+        return self._showzero
+
+    @property
+    def anchor(self) -> datetime | None:
+        """Date the sign of calendar dependent relativedeltas is measured from."""
+        return self._anchor
+
+    @property
+    def locale(self) -> str:
+        """Language of the labels."""
+        return self._locale_name
+
+    @property
+    def max_units(self) -> int | None:
+        """Show at most this many non-zero units, None for all of them."""
+        return self._max_units
+
+    def _labels(
+        self, unit: str, requested: UnitSet
+    ) -> tuple[bool, tuple[str, ...], str]:
+        """Return (show when zero, label table of the locale, unit) for a unit."""
+        return (
+            self._showzero and unit in requested,
+            self._locale.labels[unit][self._style],
+            unit,
+        )
+
+    def _render(
+        self,
+        labels: tuple[tuple[bool, tuple[str, ...], str], ...],
+        values: list[int] | tuple[int, ...],
+        negative: bool,  # noqa: FBT001
+    ) -> str:
+        """Join the split values into the final string."""
+        sign = self._sign if negative else ""
+        output = []
+        # values stop short of the labels when max_units cut the split.
+        for (showzero, table, unit), val in zip(labels, values, strict=False):
+            if not val:
+                if not showzero:
+                    continue
+                output.append(f"{sign}0 {table[0]}")
+                continue
+            # see readabledelta2.locales.Locale for the table layout.
+            try:
+                label = (
+                    table[val]
+                    if val < EXACT_COUNTS
+                    else table[EXACT_COUNTS + val % 100]
+                )
+            except TypeError:
+                # a float field of a relativedelta, e.g. days=1.5.
+                label = self._locale.label(unit, self._style, val)
+            output.append(f"{sign}{val} {label}")
+            # we only need to show the negative sign once.
+            sign = ""
+
+        if len(output) == 0:  # pragma: nocover
+            raise RuntimeError
+        if len(output) == 1:
+            return output[0]
+        return f"{self._separator.join(output[:-1])}{self._last_separator}{output[-1]}"
+
+    def format(self, delta: T_delta) -> str:
+        """Create Human readable string for a timedelta or relativedelta."""
+        if isinstance(delta, timedelta):
+            return self.format_timedelta(delta)
+        return self.format_relativedelta(delta)
+
+    def format_timedelta(self, delta: timedelta) -> str:
+        """Create Human readable timedelta string."""
+        clock = None
+        if _instrument is not None:
+            clock = _instrument("DeltaFormatter.format_timedelta", validated=True)
+        return self._format_timedelta(delta, clock)
+
+    def format_microseconds(self, total: int) -> str:
+        """
+        Create Human readable string from a signed number of microseconds.
+
+        Unlike timedelta, the total is not limited to ``timedelta.max``.
+        """
+        clock = None
+        if _instrument is not None:
+            clock = _instrument("DeltaFormatter.format_microseconds", validated=True)
+        return self._format_microseconds(total, clock)
+
+    def _format_timedelta(self, delta: timedelta, clock: _Clock | None) -> str:
+        negative = is_negative_timedelta(delta)
+        total = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        return self._format_total(-total if negative else total, negative, clock)
+
+    def _format_microseconds(self, total: int, clock: _Clock | None) -> str:
+        negative = total < 0
+        return self._format_total(-total if negative else total, negative, clock)
+
+    def _format_total(
+        self,
+        total: int,
+        negative: bool,  # noqa: FBT001
+        clock: _Clock | None,
+    ) -> str:
+        """
+        Split an absolute number of microseconds and render it.
+
+        ``clock`` times the phases while ``readabledelta2.instrument`` is enabled.
+        """
+        if self._td_error:
+            raise ValueError(self._td_error)
+        if clock is not None:
+            clock.lap()
+        if not total and not self._showzero:
+            if clock is not None:
+                clock.lap()
+                clock.stop(self._style)
+            return self._zero
+        values = self._split_total(total)
+        if clock is None:
+            return self._render(self._td_labels, values, negative)
+        clock.lap()
+        text = self._render(self._td_labels, values, negative)
+        clock.stop(self._style)
+        return text
+
+    def _split_total(self, total: int) -> list[int]:
+        """
+        Split an absolute number of microseconds over the ladder units.
+
+        With max_units the ladder stops at the last unit shown, the remainder
+        is dropped.
+        """
+        values = []
+        left = self._max_units
+        if left is None:
+            for size in self._td_sizes:
+                val, total = divmod(total, size)
+                values.append(val)
+            return values
+        for size in self._td_sizes:
+            val, total = divmod(total, size)
+            values.append(val)
+            if val:
+                left -= 1
+                if not left:
+                    break
+        return values
+
+    def format_relativedelta(self, delta: relativedelta) -> str:
+        """Create Human readable relativedelta string."""
+        clock = None
+        if _instrument is not None:
+            clock = _instrument("DeltaFormatter.format_relativedelta", validated=True)
+        return self._format_relativedelta(delta, clock)
+
+    def format_datetimes(self, start: date, end: date) -> str:
+        """Create Human readable string for the time from start to end."""
+        clock = None
+        if _instrument is not None:
+            clock = _instrument("DeltaFormatter.format_datetimes", validated=True)
+        return self._format_datetimes(start, end, clock)
+
+    def _format_relativedelta(self, delta: relativedelta, clock: _Clock | None) -> str:
+        negative = is_negative_relativedelta(delta, self._anchor)
+        if self._rd_error:
+            raise ValueError(self._rd_error)
+        return self._format_fields(delta, not delta, negative, clock)
+
+    def _format_datetimes(self, start: date, end: date, clock: _Clock | None) -> str:
+        if self._rd_error:
+            raise ValueError(self._rd_error)
+        negative, fields = _difference(start, end)
+        return self._format_fields(fields, not any(fields), negative, clock)
+
+    def _format_fields(
+        self,
+        delta: relativedelta | _Fields,
+        empty: bool,  # noqa: FBT001
+        negative: bool,  # noqa: FBT001
+        clock: _Clock | None,
+    ) -> str:
+        """
+        Split the fields of a relativedelta and render them.
+
+        ``clock`` times the phases while ``readabledelta2.instrument`` is enabled.
+        """
+        if clock is not None:
+            clock.lap()
+        values = self._split_relativedelta(delta)
+        if clock is not None:
+            clock.lap()
+        if empty and not self._showzero:
+            text = self._zero
+        else:
+            text = self._render(self._rd_labels, values, negative)
+        if clock is not None:
+            clock.stop(self._style)
+        return text
+
+    def _split_relativedelta(self, delta: relativedelta | _Fields) -> tuple[int, ...]:
+        """Split a relativedelta over the ladder units, cut after max_units."""
+        values = _split_relativedelta(delta, self._rd_ladder)
+        left = self._max_units
+        if left is not None:
+            for i, val in enumerate(values):
+                if val:
+                    left -= 1
+                    if not left:
+                        return values[: i + 1]
+        return values
+
+
+@functools.lru_cache(maxsize=256)
+def _formatter(  # noqa: PLR0917
+    style: Style,
+    units: UnitSet,
+    include_sign: bool,  # noqa: FBT001
+    showzero: bool,  # noqa: FBT001
+    anchor: datetime | None = None,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> DeltaFormatter:
+    """
+    Shared formatters for the from_* functions, keyed on their options.
+
+    Pass every option positionally, keywords make the cache key slower to build.
+    """
+    return DeltaFormatter(
+        style,
+        units,
+        include_sign=include_sign,
+        showzero=showzero,
+        anchor=anchor,
+        locale=locale,
+        max_units=max_units,
+    )
+
+
+def _timedelta_options(  # noqa: PLR0917
+    style: Style,
+    units: tuple[TDUnit | str, ...] | UnitSet | None,
+    include_sign: bool,  # noqa: FBT001
+    showzero: bool,  # noqa: FBT001
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+) -> tuple[Style, UnitSet, bool, bool, None, str, int | None]:
+    """
+    The ``_formatter`` arguments for timedeltas, as a tuple.
+
+    The bulk renderers build their formatter with ``_formatter(*options)`` and
+    hand the tuple to the processes or executors rendering for them.
+    """
+    return (
+        style,
+        _timedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+
+
+def _format_duration(formatter: DeltaFormatter, delta: timedelta | int) -> str:
+    """Render a timedelta, or an integer number of microseconds."""
+    if isinstance(delta, timedelta):
+        return formatter.format_timedelta(delta)
+    return formatter.format_microseconds(operator.index(delta))
+
+
+class _Memo(dict[_K, _V]):
+    """
+    The results of a function for each distinct value, for the bulk renderers.
+
+    ``memo[value]`` only calls the function on a miss, so mapping
+    ``memo.__getitem__`` over the values renders each one once. At most
+    ``MEMO_SIZE`` results are kept, the memo is cleared when full.
+    """
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable[[_K], _V]) -> None:
+        super().__init__()
+        self.function = function
+
+    def __missing__(self, value: _K) -> _V:
+        if len(self) >= MEMO_SIZE:
+            self.clear()
+        result = self[value] = self.function(value)
+        return result
+
+
+def __getattr__(name: str) -> object:
+    """Import dateutil on first access to ``relativedelta`` or ``T_delta``."""
+    if name in ("relativedelta", "T_delta"):
+        from dateutil.relativedelta import relativedelta  # noqa: PLC0415
+
+        globals().update(relativedelta=relativedelta, T_delta=relativedelta | timedelta)
+        return globals()[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
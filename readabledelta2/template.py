@@ -0,0 +1,343 @@
+"""
+Output templates, for layouts the three styles cannot express.
+
+A template is compiled once into a render function that only splits the units
+it references::
+
+    >>> from_template(timedelta(hours=26, minutes=5), "{h}h{m:02}m")
+    '26h05m'
+    >>> from_template(timedelta(days=1, seconds=62), "[{D} {D!n} ]{h}:{m:02}:{s:02}")
+    '1 day 0:01:02'
+
+The mini-language is ``str.format`` with a few additions:
+
+``{unit}`` or ``{unit:spec}``
+    the value of a unit, named like ``hours`` or abbreviated like ``h``
+    (``Y W D h m s ms us``), formatted with an integer format spec
+``{unit!n}``, ``{unit!s}``, ``{unit!a}``
+    the label of the unit for its value in the normal, short or abbrev style
+    of the locale, singular or plural
+``{sign}``
+    ``-`` for negative deltas; without it, or when the optional sections holding
+    it are dropped, the sign goes in front of the output
+``[...]``
+    an optional section, dropped when all of its units are zero unless
+    showzero is set; ``[[`` and ``]]`` are literal brackets
+
+The spaces, commas, semicolons, slashes, bars and dashes ending an optional
+section, after its last field, are a separator: they are dropped when none of
+the later sections showing a unit is kept, so ``"[{D} {D!n}, ][{h} {h!n}]"``
+gives ``1 day, 2 hours`` and ``1 day``. Words like "and" are not.
+
+The largest unit takes everything above it, as with the ``units`` option of
+``from_timedelta``. Unlike ``from_timedelta`` nothing below the smallest unit
+can be shown, so the remainder is truncated.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import string
+from typing import TYPE_CHECKING, NamedTuple
+
+from .locales import DEFAULT_LOCALE, EXACT_COUNTS, get_locale
+from .readabledelta import (
+    TD_UNIT_MICROSECONDS,
+    TIME_UNITS,
+    Style,
+    TDUnit,
+    is_negative_timedelta,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+
+# field name -> unit, both the full names and the English abbreviations.
+_FIELDS: dict[str, TDUnit] = {
+    **{unit.value: unit for unit in TDUnit},
+    **{TIME_UNITS[unit][Style.ABBREV]: unit for unit in TDUnit},
+    "us": TDUnit.MICROSECONDS,
+}
+_CONVERSIONS = {"n": Style.NORMAL, "s": Style.SHORT, "a": Style.ABBREV}
+_BRACKETS = re.compile(r"(\[\[|\]\]|\[|\])")
+_SEPARATOR = re.compile(r"[\s,;/|\-\u2013\u2014]+\Z")
+
+
+class _Field(NamedTuple):
+    # "sign", or the unit and the label style for !n/!s/!a (None for the value)
+    name: str
+    unit: TDUnit | None
+    style: Style | None
+    spec: str
+
+
+class _Section(NamedTuple):
+    optional: bool
+    # literal text, then the field that follows it if any
+    pieces: tuple[tuple[str, _Field | None], ...]
+
+
+def _parse(template: str) -> list[_Section]:
+    """Split a template into its sections, and those into literals and fields."""
+    pieces: list[tuple[bool, str]] = []
+    text: list[str] = []
+    optional = False
+    for token in _BRACKETS.split(template):
+        if token in ("[[", "]]"):
+            text.append(token[0])
+        elif token == "[" and not optional:
+            pieces.append((False, "".join(text)))
+            text, optional = [], True
+        elif token == "]" and optional:
+            pieces.append((True, "".join(text)))
+            text, optional = [], False
+        elif token in ("[", "]"):
+            msg = f"unbalanced {token} in template {template!r}"
+            raise ValueError(msg)
+        else:
+            text.append(token)
+    if optional:
+        msg = f"unbalanced [ in template {template!r}"
+        raise ValueError(msg)
+    pieces.append((False, "".join(text)))
+
+    sections = []
+    for optional, text_ in pieces:
+        parsed = tuple(
+            (literal, None if name is None else _field(template, name, spec, conv))
+            for literal, name, spec, conv in string.Formatter().parse(text_)
+        )
+        if parsed:
+            sections.append(_Section(optional, parsed))
+    return sections
+
+
+def _field(
+    template: str, name: str, spec: str | None, conversion: str | None
+) -> _Field:
+    """Validate one ``{...}`` field of a template."""
+    spec = spec or ""
+    if name == "sign" and conversion is None:
+        format("", spec)
+        return _Field(name, None, None, spec)
+    unit = _FIELDS.get(name)
+    if unit is None:
+        if name in ("months", "M"):
+            msg = f"units can only be the following: {tuple(TDUnit)}"
+        else:
+            msg = f"unknown field {{{name}}} in template {template!r}"
+        raise ValueError(msg)
+    if conversion is None:
+        format(0, spec)
+        return _Field(name, unit, None, spec)
+    style = _CONVERSIONS.get(conversion)
+    if style is None:
+        msg = f"conversion can only be one of the following: {tuple(_CONVERSIONS)}"
+        raise ValueError(msg)
+    format("", spec)
+    return _Field(name, unit, style, spec)
+
+
+def _escape(literal: str) -> str:
+    """Escape the braces of literal text, for a format string."""
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+def _kept(
+    compiled: list[tuple[bool, str, tuple[int, ...], str | None]],
+    values: list[int],
+    args: list[object],
+    *,
+    showzero: bool,
+) -> list[str]:
+    """Format the sections that are kept, without the separators left hanging."""
+    output = []
+    follows = False
+    for optional, fmt, shown, bare in reversed(compiled):
+        if showzero or not optional or any(values[index] for index in shown):
+            output.append((fmt if follows or bare is None else bare).format(*args))
+            follows = follows or bool(shown)
+    output.reverse()
+    return output
+
+
+def _compile(
+    template: str, *, include_sign: bool, showzero: bool, locale: str
+) -> tuple[tuple[TDUnit, ...], Callable[[int, bool], str]]:
+    """
+    Compile a template into its units and a render function.
+
+    The render function takes the absolute number of microseconds and whether
+    the delta is negative.
+    """
+    sections = _parse(template)
+    units = {
+        field.unit for s in sections for _, field in s.pieces if field and field.unit
+    }
+    if not units:
+        msg = f"template {template!r} has no units"
+        raise ValueError(msg)
+    ladder = tuple(sorted(units, key=TD_UNIT_MICROSECONDS.__getitem__, reverse=True))
+    sizes = tuple(TD_UNIT_MICROSECONDS[unit] for unit in ladder)
+    labels = get_locale(locale).labels
+
+    # every section becomes a positional format string over
+    # [sign, *values, *labels], along with the values it shows.
+    # optional sections ending in a separator also get the format string
+    # without it, used when no later section with units is kept.
+    label_fields: list[tuple[int, tuple[str, ...]]] = []
+    compiled: list[tuple[bool, str, tuple[int, ...], str | None]] = []
+    # shown values of the optional sections with a {sign}, and whether a
+    # section that is always kept has one.
+    optional_signs: list[tuple[int, ...]] = []
+    placed = False
+    for section in sections:
+        parts = []
+        shown = []
+        signed = False
+        tail = ""
+        for literal, field in section.pieces:
+            parts.append(_escape(literal))
+            if field is None:
+                tail += literal
+                continue
+            tail = ""
+            if field.unit is None:
+                signed = True
+                index = 0
+            elif field.style is None:
+                index = 1 + ladder.index(field.unit)
+                shown.append(index - 1)
+            else:
+                table = labels[field.unit][field.style]
+                label_fields.append((ladder.index(field.unit), table))
+                index = len(ladder) + len(label_fields)
+                shown.append(ladder.index(field.unit))
+            parts.append(f"{{{index}:{field.spec}}}")
+        fmt = "".join(parts)
+        bare = None
+        separator = _SEPARATOR.search(tail)
+        if section.optional and shown and separator:
+            bare = fmt[: len(fmt) - len(_escape(tail))] + _escape(
+                tail[: separator.start()]
+            )
+        compiled.append((section.optional, fmt, tuple(shown), bare))
+        if signed and section.optional:
+            optional_signs.append(tuple(shown))
+        placed = placed or (signed and not section.optional)
+    # the last section with units has nothing after it to be separated from.
+    last = max(index for index, entry in enumerate(compiled) if entry[2])
+    compiled[last] = (*compiled[last][:3], None)
+    separated = any(bare is not None for *_, bare in compiled)
+
+    def render(total: int, negative: bool) -> str:  # noqa: FBT001
+        values = []
+        for size in sizes:
+            val, total = divmod(total, size)
+            values.append(val)
+        # no sign when everything shown was truncated away.
+        sign = "-" if negative and include_sign and any(values) else ""
+        args = [sign, *values]
+        for index, table in label_fields:
+            val = values[index]
+            args.append(
+                table[val] if val < EXACT_COUNTS else table[EXACT_COUNTS + val % 100]
+            )
+        if separated:
+            output = _kept(compiled, values, args, showzero=showzero)
+        else:
+            output = [
+                fmt.format(*args)
+                for optional, fmt, shown, _ in compiled
+                if showzero or not optional or any(values[index] for index in shown)
+            ]
+        if not output:
+            # every section is optional, keep the last like "0 seconds".
+            output.append(compiled[-1][1].format(*args))
+        result = "".join(output)
+        if not sign or placed:
+            return result
+        if optional_signs and (
+            showzero
+            or any(values[index] for shown in optional_signs for index in shown)
+        ):
+            return result
+        # no {sign} in the sections kept, the sign goes in front.
+        return sign + result
+
+    return ladder, render
+
+
+class DeltaTemplate:
+    """
+    Reusable output template for timedeltas, see ``readabledelta2.template``.
+
+    :param template: e.g. "{h}h{m:02}m" or "[{D} {D!n} ]{h}:{m:02}:{s:02}"
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: keep optional sections even when their units are zero
+    :param locale: language of the ``!n``/``!s``/``!a`` labels
+    """
+
+    def __init__(
+        self,
+        template: str,
+        *,
+        include_sign: bool = True,
+        showzero: bool = False,
+        locale: str = DEFAULT_LOCALE,
+    ) -> None:
+        self.template = template
+        self.include_sign = include_sign
+        self.showzero = showzero
+        self.locale = locale
+        self.units, self._render = _compile(
+            template, include_sign=include_sign, showzero=showzero, locale=locale
+        )
+
+    def format(self, delta: timedelta) -> str:
+        """Create the string for a timedelta."""
+        negative = is_negative_timedelta(delta)
+        total = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        return self._render(-total if negative else total, negative)
+
+    def format_microseconds(self, total: int) -> str:
+        """Create the string for a signed number of microseconds."""
+        negative = total < 0
+        return self._render(-total if negative else total, negative)
+
+
+@functools.lru_cache(maxsize=64)
+def _template(
+    template: str,
+    include_sign: bool,  # noqa: FBT001
+    showzero: bool,  # noqa: FBT001
+    locale: str,
+) -> DeltaTemplate:
+    """Shared compiled templates for from_template."""
+    return DeltaTemplate(
+        template, include_sign=include_sign, showzero=showzero, locale=locale
+    )
+
+
+def from_template(
+    delta: timedelta,
+    template: str,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+) -> str:
+    """
+    Create a string for a timedelta laid out by a template.
+
+    Templates are compiled on first use and cached.
+
+    :param timedelta delta:
+    :param template: e.g. "{h}h{m:02}m" or "[{D} {D!n} ]{h}:{m:02}:{s:02}"
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: keep optional sections even when their units are zero
+    :param locale: language of the ``!n``/``!s``/``!a`` labels
+    """
+    return _template(template, include_sign, showzero, locale).format(delta)
@@ -0,0 +1,462 @@
+"""
+Vectorized readabledelta for numpy timedelta64 arrays and datetime64 pairs.
+
+Requires numpy, install with ``pip install readabledelta2[numpy]``.
+
+Values are converted to whole microseconds the same way numpy casts them
+(``arr.astype("timedelta64[us]")``), so every result matches ``from_timedelta``
+called on ``value.astype("timedelta64[us]").item()``. Likewise the calendar
+differences of datetime64 pairs match ``from_datetimes`` on the ``.item()`` of
+each pair. Values too large for int64 microseconds, which numpy's cast wraps
+around, raise OverflowError.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, overload
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import (
+    DeltaFormatter,
+    RDUnit,
+    Style,
+    TDUnit,
+    UnitSet,
+    _formatter,
+    _relativedelta_unitset,
+    _timedelta_options,
+)
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    msg = (
+        "readabledelta2.vectorized requires numpy, "
+        "install it with `pip install readabledelta2[numpy]`"
+    )
+    raise ImportError(msg) from exc
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+_DAY_MICROSECONDS = 86400 * 1000000
+# numpy units coarser than microseconds, their casts to microseconds can wrap.
+_COARSE_UNITS = frozenset(("Y", "M", "W", "D", "h", "m", "s", "ms"))
+
+
+def _cast_microseconds(
+    values: NDArray[np.timedelta64 | np.datetime64], nat: NDArray[np.bool_], dtype: str
+) -> NDArray[np.int64]:
+    """
+    Cast to microseconds as int64, refusing values out of range.
+
+    numpy wraps around silently when the cast overflows, a value that did
+    not fit doesn't cast back to itself.
+    """
+    micro = values.astype(dtype)
+    unit, _ = np.datetime_data(values.dtype)
+    if unit in _COARSE_UNITS and np.any((micro.astype(values.dtype) != values) & ~nat):
+        msg = (
+            f"{values.dtype} values must fit in int64 microseconds "
+            "(about 292000 years)"
+        )
+        raise OverflowError(msg)
+    return micro.view(np.int64)
+
+
+def _to_microseconds(
+    arr: ArrayLike,
+) -> tuple[NDArray[np.int64], NDArray[np.bool_], NDArray[np.bool_]]:
+    """Return (absolute microseconds, negative mask, NaT mask) for the array."""
+    values = np.asarray(arr)
+    if values.dtype.kind != "m":
+        msg = f"expected an array of timedelta64, not {values.dtype}"
+        raise TypeError(msg)
+
+    nat = np.isnat(values)
+    micro = np.where(nat, 0, _cast_microseconds(values, nat, "timedelta64[us]"))
+    return np.abs(micro), micro < 0, nat
+
+
+def _split(
+    formatter: DeltaFormatter, total: NDArray[np.int64]
+) -> dict[TDUnit, NDArray[np.int64]]:
+    """Run the split ladder over a whole array of absolute microseconds."""
+    if formatter._td_error:
+        raise ValueError(formatter._td_error)
+
+    data = {}
+    for unit in TDUnit:
+        data[unit] = np.zeros(total.shape, dtype=np.int64)
+    for unit, size in zip(formatter._td_units, formatter._td_sizes, strict=True):
+        data[unit], total = np.divmod(total, size)
+    return data
+
+
+def split_timedelta_array(
+    arr: ArrayLike, units: tuple[TDUnit | str, ...] = tuple(TDUnit)
+) -> dict[TDUnit, NDArray[np.int64]]:
+    """
+    Vectorized `split_timedelta_units`.
+
+    NaT entries are split as zero.
+
+    :param arr: array of timedelta64 values
+    :param units: array of time magnitudes to be used for output
+    """
+    total, _, _ = _to_microseconds(arr)
+    return _split(DeltaFormatter(units=units), total)
+
+
+@overload
+def from_timedelta_array(
+    arr: ArrayLike,
+    style: Style = ...,
+    units: tuple[TDUnit | str, ...] | None = ...,
+    *,
+    include_sign: bool = ...,
+    showzero: bool = ...,
+    locale: str = ...,
+    max_units: int | None = ...,
+    return_parts: Literal[False] = ...,
+) -> NDArray[np.object_]: ...
+@overload
+def from_timedelta_array(
+    arr: ArrayLike,
+    style: Style = ...,
+    units: tuple[TDUnit | str, ...] | None = ...,
+    *,
+    include_sign: bool = ...,
+    showzero: bool = ...,
+    locale: str = ...,
+    max_units: int | None = ...,
+    return_parts: Literal[True],
+) -> tuple[NDArray[np.object_], dict[TDUnit, NDArray[np.int64]]]: ...
+def from_timedelta_array(
+    arr: ArrayLike,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    return_parts: bool = False,
+) -> NDArray[np.object_] | tuple[NDArray[np.object_], dict[TDUnit, NDArray[np.int64]]]:
+    """
+    Create Human readable strings for a whole array of timedelta64 values.
+
+    The split is done with integer array operations. Each distinct combination
+    of components is rendered only once, then broadcast back to the input shape.
+    NaT entries come back as None.
+
+    :param arr: array of timedelta64 values
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    :param return_parts: also return the per-unit component arrays, not cut
+            by max_units
+    """
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+    rendered, inverse, data = render_unique(formatter, arr)
+    result = rendered[inverse]
+    if return_parts:
+        return result, data
+    return result
+
+
+def render_unique(
+    formatter: DeltaFormatter, arr: ArrayLike
+) -> tuple[NDArray[np.object_], NDArray[np.intp], dict[TDUnit, NDArray[np.int64]]]:
+    """
+    Render each distinct value in the array once.
+
+    Returns the rendered strings (None for NaT), the index into them for every
+    element of the array (same shape as the array) and the split components.
+    """
+    total, negative, nat = _to_microseconds(arr)
+    data = _split(formatter, total)
+    columns = [data[unit] for unit in formatter._td_units]
+    rendered, inverse = _render_rows(
+        formatter, formatter._td_labels, columns, negative, nat
+    )
+    return rendered, inverse, data
+
+
+def _render_rows(
+    formatter: DeltaFormatter,
+    labels: tuple[tuple[bool, tuple[str, ...], str], ...],
+    columns: list[NDArray[np.int64]],
+    negative: NDArray[np.bool_],
+    nat: NDArray[np.bool_],
+) -> tuple[NDArray[np.object_], NDArray[np.intp]]:
+    """
+    Render each distinct row of the split columns once.
+
+    ``columns`` hold one array per label. Returns the rendered strings and the
+    index into them for every element, in the shape of the columns.
+    """
+    max_units = formatter.max_units
+    if max_units is not None:
+        columns = _cut(columns, max_units)
+    stacked: list[NDArray[np.generic]] = [column.ravel() for column in columns]
+    stacked.append(nat.ravel())
+    if formatter.include_sign:
+        stacked.append(negative.ravel())
+    rows, inverse = np.unique(np.column_stack(stacked), axis=0, return_inverse=True)
+
+    nunits = len(columns)
+    rendered = np.empty(len(rows), dtype=object)
+    for i, row in enumerate(rows.tolist()):
+        values = row[:nunits]
+        if row[nunits]:
+            rendered[i] = None
+        elif not any(values) and not formatter.showzero:
+            rendered[i] = formatter._zero
+        else:
+            if max_units is not None:
+                values = _shown(values, max_units)
+            is_negative = bool(formatter.include_sign and row[-1])
+            rendered[i] = formatter._render(labels, values, is_negative)
+
+    return rendered, inverse.reshape(nat.shape)
+
+
+def _cut(columns: list[NDArray[np.int64]], max_units: int) -> list[NDArray[np.int64]]:
+    """
+    Zero every unit after the first max_units non-zero ones of each row.
+
+    The split ladder is greedy, so the units before the cut are the same as
+    those of ``DeltaFormatter`` stopping the split there.
+    """
+    shown = np.zeros(columns[0].shape, dtype=np.int64)
+    cut = []
+    for column in columns:
+        cut.append(np.where(shown < max_units, column, 0))
+        shown += column != 0
+    return cut
+
+
+def _shown(values: list[int], max_units: int) -> list[int]:
+    """Stop the values of a row at its last unit shown, as the scalar split."""
+    for i, val in enumerate(values):
+        if val:
+            max_units -= 1
+            if not max_units:
+                return values[: i + 1]
+    return values
+
+
+def _to_datetime_microseconds(
+    arr: ArrayLike,
+) -> tuple[NDArray[np.int64], NDArray[np.bool_]]:
+    """Return (microseconds since the epoch, NaT mask) for the array."""
+    values = np.asarray(arr)
+    if values.dtype.kind != "M":
+        msg = f"expected an array of datetime64, not {values.dtype}"
+        raise TypeError(msg)
+
+    nat = np.isnat(values)
+    micro = _cast_microseconds(values, nat, "datetime64[us]")
+    return np.where(nat, 0, micro), nat
+
+
+def _add_months(
+    month: NDArray[np.int64],
+    day: NDArray[np.int64],
+    time: NDArray[np.int64],
+    months: NDArray[np.int64],
+) -> NDArray[np.int64]:
+    """
+    Move dates by whole months, clamping the day like dateutil.
+
+    The dates are given as months since the epoch, day of the month and
+    microseconds into the day, the result is in microseconds since the epoch.
+    """
+    target = month + months
+    first = target.view("datetime64[M]").astype("datetime64[D]").view(np.int64)
+    following = (target + 1).view("datetime64[M]").astype("datetime64[D]")
+    length = following.view(np.int64) - first
+    return (first + np.minimum(day, length) - 1) * _DAY_MICROSECONDS + time
+
+
+def _difference(
+    start: NDArray[np.int64], end: NDArray[np.int64]
+) -> tuple[NDArray[np.bool_], tuple[NDArray[np.int64], ...]]:
+    """
+    Vectorized ``readabledelta._difference`` on microseconds since the epoch.
+
+    Returns the negative mask and the absolute years, months, days, hours,
+    minutes, seconds and microseconds of ``relativedelta(end, start)``.
+    """
+    start_day = start // _DAY_MICROSECONDS
+    time = start - start_day * _DAY_MICROSECONDS
+    start_month = start_day.view("datetime64[D]").astype("datetime64[M]")
+    day = start_day - start_month.astype("datetime64[D]").view(np.int64) + 1
+    start_month = start_month.view(np.int64)
+    end_month = (
+        (end // _DAY_MICROSECONDS)
+        .view("datetime64[D]")
+        .astype("datetime64[M]")
+        .view(np.int64)
+    )
+
+    negative = end < start
+    months = end_month - start_month
+    moved = _add_months(start_month, day, time, months)
+    # the moved date is in the month of end, so a day or time of day past end
+    # is undone by a single month.
+    overshot = np.where(negative, end > moved, end < moved)
+    months = np.where(overshot, months + np.where(negative, 1, -1), months)
+    moved = np.where(overshot, _add_months(start_month, day, time, months), moved)
+
+    # like relativedelta, only the seconds carry the sign of the rest.
+    rest = end - moved
+    total_seconds, microseconds = np.divmod(rest, 1000000)
+    minutes, seconds = np.divmod(np.abs(total_seconds), 60)
+    hours, minutes = np.divmod(minutes, 60)
+    days, hours = np.divmod(hours, 24)
+    years, months = np.divmod(np.abs(months), 12)
+    return negative, (years, months, days, hours, minutes, seconds, microseconds)
+
+
+def _split_fields(
+    formatter: DeltaFormatter, fields: tuple[NDArray[np.int64], ...]
+) -> dict[RDUnit, NDArray[np.int64]]:
+    """Vectorized ``readabledelta._split_relativedelta`` over absolute fields."""
+    if formatter._rd_error:
+        raise ValueError(formatter._rd_error)
+
+    years, months, days, hours, minutes, seconds, microseconds = fields
+    zeros = np.zeros(years.shape, dtype=np.int64)
+    weeks = zeros
+    ladder = formatter._rd_ladder
+    if not ladder & UnitSet.YEARS:
+        months = months + years * 12
+        years = zeros
+    if ladder & UnitSet.WEEKS:
+        weeks, days = np.divmod(days, 7)
+    if not ladder & UnitSet.DAYS:
+        hours = hours + days * 24
+        days = zeros
+    if not ladder & UnitSet.HOURS:
+        minutes = minutes + hours * 60
+        hours = zeros
+    if not ladder & UnitSet.MINUTES:
+        seconds = seconds + minutes * 60
+        minutes = zeros
+    if not ladder & UnitSet.SECONDS:
+        microseconds = microseconds + seconds * 1000000
+        seconds = zeros
+    values = (years, months, weeks, days, hours, minutes, seconds, microseconds)
+    return dict(zip(RDUnit, values, strict=True))
+
+
+def split_datetime_arrays(
+    start: ArrayLike,
+    end: ArrayLike,
+    units: tuple[RDUnit | str, ...] = tuple(RDUnit),
+) -> dict[RDUnit, NDArray[np.int64]]:
+    """
+    Vectorized `split_relativedelta_units` of ``relativedelta(end, start)``.
+
+    Pairs with a NaT are split as zero.
+
+    :param start: array of datetime64 values
+    :param end: array of datetime64 values, broadcast against start
+    :param units: array of time magnitudes to be used for output
+    """
+    start_us, start_nat = _to_datetime_microseconds(start)
+    end_us, end_nat = _to_datetime_microseconds(end)
+    start_us, end_us, nat = np.broadcast_arrays(start_us, end_us, start_nat | end_nat)
+    _, fields = _difference(start_us, np.where(nat, start_us, end_us))
+    return _split_fields(DeltaFormatter(units=units), fields)
+
+
+@overload
+def from_datetime_arrays(
+    start: ArrayLike,
+    end: ArrayLike,
+    style: Style = ...,
+    units: tuple[RDUnit | str, ...] | None = ...,
+    *,
+    include_sign: bool = ...,
+    showzero: bool = ...,
+    locale: str = ...,
+    max_units: int | None = ...,
+    return_parts: Literal[False] = ...,
+) -> NDArray[np.object_]: ...
+@overload
+def from_datetime_arrays(
+    start: ArrayLike,
+    end: ArrayLike,
+    style: Style = ...,
+    units: tuple[RDUnit | str, ...] | None = ...,
+    *,
+    include_sign: bool = ...,
+    showzero: bool = ...,
+    locale: str = ...,
+    max_units: int | None = ...,
+    return_parts: Literal[True],
+) -> tuple[NDArray[np.object_], dict[RDUnit, NDArray[np.int64]]]: ...
+def from_datetime_arrays(
+    start: ArrayLike,
+    end: ArrayLike,
+    style: Style = Style.NORMAL,
+    units: tuple[RDUnit | str, ...] | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    return_parts: bool = False,
+) -> NDArray[np.object_] | tuple[NDArray[np.object_], dict[RDUnit, NDArray[np.int64]]]:
+    """
+    Create Human readable calendar differences for arrays of datetime64 pairs.
+
+    Vectorized ``from_datetimes``: years and months are counted on the calendar
+    with month length tables, the rest with integer array operations. Each
+    distinct combination of components is rendered only once. Pairs with a NaT
+    come back as None.
+
+    :param start: array of datetime64 values
+    :param end: array of datetime64 values, broadcast against start
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units, the rest is
+            truncated, see ``DeltaFormatter``
+    :param return_parts: also return the per-unit component arrays, not cut
+            by max_units
+    """
+    formatter = _formatter(
+        style,
+        _relativedelta_unitset(units),
+        include_sign,
+        showzero,
+        None,
+        locale,
+        max_units,
+    )
+    start_us, start_nat = _to_datetime_microseconds(start)
+    end_us, end_nat = _to_datetime_microseconds(end)
+    start_us, end_us, nat = np.broadcast_arrays(start_us, end_us, start_nat | end_nat)
+    negative, fields = _difference(start_us, np.where(nat, start_us, end_us))
+    data = _split_fields(formatter, fields)
+
+    columns = [data[unit] for unit in RDUnit]
+    rendered, inverse = _render_rows(
+        formatter, formatter._rd_labels, columns, negative, nat
+    )
+    result = rendered[inverse]
+    if return_parts:
+        return result, data
+    return result
@@ -0,0 +1,177 @@
+"""
+Write Human readable durations straight into a text or binary stream.
+
+For bulk exports, instead of building every string and joining them::
+
+    >>> with open("report.txt", "wb") as out:
+    ...     write_many(out, durations, Style.ABBREV)
+    1843
+
+Records are written in batches of ``BATCH_SIZE``. Each distinct value is
+rendered once, and for binary streams encoded once, so a repeated value costs
+a lookup and nothing else.
+
+Streams are taken as binary when they are ``io`` binary streams or were opened
+in a binary mode, anything else is written str.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import IO, TYPE_CHECKING, Any
+
+from .locales import DEFAULT_LOCALE
+from .readabledelta import (
+    Style,
+    _format_duration,
+    _formatter,
+    _Memo,
+    _timedelta_options,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import timedelta
+
+    from .readabledelta import DeltaFormatter, TDUnit, UnitSet
+
+# records joined into a single write.
+BATCH_SIZE = 4096
+
+
+def _is_binary(stream: IO[Any]) -> bool:
+    """Return True for streams that take bytes."""
+    if isinstance(stream, io.TextIOBase):
+        return False
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(stream, "mode", "")
+
+
+def write_timedelta(
+    stream: IO[Any],
+    delta: timedelta,
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    end: str = "\n",
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Write one Human readable timedelta to a stream.
+
+    Returns the number of characters, or bytes for binary streams, written.
+
+    :param stream: text or binary stream to write to
+    :param timedelta delta:
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param end: written after the string
+    :param encoding: encoding for binary streams
+    """
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+    text = formatter.format_timedelta(delta) + end
+    if _is_binary(stream):
+        data = text.encode(encoding)
+        stream.write(data)
+        return len(data)
+    stream.write(text)
+    return len(text)
+
+
+def write_many(
+    stream: IO[Any],
+    deltas: Iterable[timedelta | int],
+    style: Style = Style.NORMAL,
+    units: tuple[TDUnit | str, ...] | UnitSet | None = None,
+    *,
+    include_sign: bool = True,
+    showzero: bool = False,
+    locale: str = DEFAULT_LOCALE,
+    max_units: int | None = None,
+    end: str = "\n",
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Write Human readable strings for many timedeltas to a stream, in order.
+
+    Integers are taken as microseconds, as in ``from_microseconds``. Records
+    written before an error still make it out. Returns the number of
+    characters, or bytes for binary streams, written.
+
+    :param stream: text or binary stream to write to
+    :param deltas: timedeltas or integer microseconds
+    :param style: normal, short, abbrev
+    :param units: tuple of timeunits to be used for output
+    :param include_sign: false will prevent sign from appearing
+    :param bool showzero: prints out the values even if they are zero
+    :param locale: language of the labels, see ``readabledelta2.locales``
+    :param max_units: show at most this many non-zero units
+    :param end: written after every string
+    :param encoding: encoding for binary streams
+    """
+    formatter = _formatter(
+        *_timedelta_options(style, units, include_sign, showzero, locale, max_units)
+    )
+    if _is_binary(stream):
+        return _write_bytes(stream, formatter, deltas, end, encoding)
+    return _write_text(stream, formatter, deltas, end)
+
+
+def _write_text(
+    stream: IO[str],
+    formatter: DeltaFormatter,
+    deltas: Iterable[timedelta | int],
+    end: str,
+) -> int:
+    def render(delta: timedelta | int) -> str:
+        return _format_duration(formatter, delta) + end
+
+    return _write(stream, map(_Memo(render).__getitem__, deltas), "".join)
+
+
+def _write_bytes(
+    stream: IO[bytes],
+    formatter: DeltaFormatter,
+    deltas: Iterable[timedelta | int],
+    end: str,
+    encoding: str,
+) -> int:
+    def render(delta: timedelta | int) -> bytes:
+        return (_format_duration(formatter, delta) + end).encode(encoding)
+
+    return _write(stream, map(_Memo(render).__getitem__, deltas), b"".join)
+
+
+def _write(
+    stream: IO[Any], records: Iterable[Any], join: Callable[[list[Any]], Any]
+) -> int:
+    """Write the records in joined batches of ``BATCH_SIZE``, return the size."""
+    batch: list[Any] = []
+    written = 0
+    try:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= BATCH_SIZE:
+                data = join(batch)
+                # cleared first, a failed write must not be retried below.
+                batch.clear()
+                stream.write(data)
+                written += len(data)
+    finally:
+        if batch:
+            data = join(batch)
+            batch.clear()
+            stream.write(data)
+            written += len(data)
+    return written
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from readabledelta2 import (
+    Style,
+    TDUnit,
+    aio,
+    from_microseconds,
+    from_timedelta,
+    readabledelta,
+)
+from readabledelta2.aio import DeltaBatcher, ahumanize, ahumanize_iter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine, Iterator
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(seconds=90),
+    timedelta(days=371, hours=1, minutes=1),
+    -timedelta(seconds=1, microseconds=500000),
+    timedelta(seconds=90),
+] * 5
+MICROSECONDS = [0, -1500, 10**18, 1500]
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(2) as executor:
+        yield executor
+
+
+@pytest.fixture
+def batches(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """The size of every batch rendered."""
+    sizes: list[int] = []
+    render = aio._render
+
+    def counting(options: tuple[Any, ...], deltas: list[timedelta | int]) -> list[str]:
+        sizes.append(len(deltas))
+        return render(options, deltas)
+
+    monkeypatch.setattr(aio, "_render", counting)
+    return sizes
+
+
+def completes_at_once(coro: Coroutine[Any, Any, str]) -> str:
+    """Return the result of a coroutine that finishes without suspending."""
+    with pytest.raises(StopIteration) as info:
+        coro.send(None)
+    return info.value.value  # type: ignore[no-any-return]
+
+
+class TestAhumanize:
+    @pytest.mark.parametrize("style", list(Style))
+    def test_same_as_from_timedelta(self, style: Style) -> None:
+        async def main() -> list[str]:
+            return await asyncio.gather(*(ahumanize(d, style) for d in DELTAS))
+
+        assert asyncio.run(main()) == [from_timedelta(d, style) for d in DELTAS]
+
+    def test_microseconds(self) -> None:
+        async def main() -> list[str]:
+            return [await ahumanize(v, Style.ABBREV) for v in MICROSECONDS]
+
+        assert asyncio.run(main()) == [
+            from_microseconds(v, Style.ABBREV) for v in MICROSECONDS
+        ]
+
+    def test_options(self) -> None:
+        delta = timedelta(days=2, hours=5, minutes=1)
+
+        async def main() -> list[str]:
+            return [
+                await ahumanize(delta, units=["hours", "minutes"]),  # type: ignore[arg-type]
+                await ahumanize(delta, units=(TDUnit.HOURS,), showzero=True),
+                await ahumanize(-delta, include_sign=False, max_units=2),
+                await ahumanize(delta, locale="de"),
+            ]
+
+        assert asyncio.run(main()) == [
+            "53 hours and 1 minute",
+            "53 hours and 1 minute",
+            "2 days and 5 hours",
+            "2 Tage, 5 Stunden und 1 Minute",
+        ]
+
+    def test_executor(self, executor: ThreadPoolExecutor, batches: list[int]) -> None:
+        async def main() -> list[str]:
+            return await asyncio.gather(
+                *(ahumanize(d, executor=executor) for d in DELTAS)
+            )
+
+        assert asyncio.run(main()) == [from_timedelta(d) for d in DELTAS]
+        assert batches == [len(DELTAS)]
+
+    def test_inline_by_default(self, batches: list[int]) -> None:
+        async def main() -> list[str]:
+            return [completes_at_once(ahumanize(d, Style.SHORT)) for d in DELTAS]
+
+        assert asyncio.run(main()) == [from_timedelta(d, Style.SHORT) for d in DELTAS]
+        assert batches == []
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="units can only be the following"):
+            asyncio.run(ahumanize(timedelta(0), units=("months",)))
+        with pytest.raises(TypeError):
+            asyncio.run(ahumanize(1.5))  # type: ignore[arg-type]
+
+
+class TestDeltaBatcher:
+    def test_inline(self, batches: list[int]) -> None:
+        batcher = DeltaBatcher(Style.SHORT)
+
+        for delta in DELTAS:
+            expected = from_timedelta(delta, Style.SHORT)
+            assert completes_at_once(batcher.humanize(delta)) == expected
+        assert batches == []
+
+    def test_batched(self, executor: ThreadPoolExecutor, batches: list[int]) -> None:
+        batcher = DeltaBatcher(max_batch=4, executor=executor)
+
+        async def main() -> list[str]:
+            return await asyncio.gather(*(batcher.humanize(d) for d in DELTAS[:10]))
+
+        assert asyncio.run(main()) == [from_timedelta(d) for d in DELTAS[:10]]
+        assert batches == [4, 4, 2]
+
+    def test_window(self, batches: list[int]) -> None:
+        batcher = DeltaBatcher(window=0.05)
+
+        async def call(delta: timedelta, pause: int) -> str:
+            for _ in range(pause):
+                await asyncio.sleep(0)
+            return await batcher.humanize(delta)
+
+        async def main() -> list[str]:
+            return await asyncio.gather(*(call(d, i) for i, d in enumerate(DELTAS)))
+
+        assert asyncio.run(main()) == [from_timedelta(d) for d in DELTAS]
+        assert batches == [len(DELTAS)]
+
+    def test_memo(self, executor: ThreadPoolExecutor, batches: list[int]) -> None:
+        batcher = DeltaBatcher(executor=executor)
+        expected = [from_timedelta(d) for d in DELTAS]
+
+        async def main() -> list[str]:
+            return await asyncio.gather(*(batcher.humanize(d) for d in DELTAS))
+
+        assert asyncio.run(main()) == expected
+        assert [completes_at_once(batcher.humanize(d)) for d in DELTAS] == expected
+        assert batches == [len(DELTAS)]
+
+    def test_memo_size(
+        self, monkeypatch: pytest.MonkeyPatch, batches: list[int]
+    ) -> None:
+        monkeypatch.setattr(readabledelta, "MEMO_SIZE", 2)
+        batcher = DeltaBatcher(window=0.001)
+
+        async def main() -> None:
+            for delta in DELTAS:
+                await batcher.humanize(delta)
+                await batcher.humanize(delta)
+
+        asyncio.run(main())
+        assert len(batcher._memo) <= 2
+        assert batches == [1] * len(DELTAS)
+
+    def test_cancelled(self, executor: ThreadPoolExecutor) -> None:
+        batcher = DeltaBatcher(executor=executor)
+
+        async def main() -> list[Any]:
+            tasks = [asyncio.create_task(batcher.humanize(d)) for d in DELTAS[:3]]
+            await asyncio.sleep(0)
+            tasks[1].cancel()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        first, cancelled, last = asyncio.run(main())
+        assert first == from_timedelta(DELTAS[0])
+        assert isinstance(cancelled, asyncio.CancelledError)
+        assert last == from_timedelta(DELTAS[2])
+
+    def test_executor_error(self) -> None:
+        executor = ThreadPoolExecutor(1)
+        executor.shutdown()
+        batcher = DeltaBatcher(executor=executor)
+
+        async def main() -> list[Any]:
+            return await asyncio.gather(
+                *(batcher.humanize(d) for d in DELTAS[:3]), return_exceptions=True
+            )
+
+        assert all(isinstance(e, RuntimeError) for e in asyncio.run(main()))
+
+    def test_flush(self, batches: list[int]) -> None:
+        batcher = DeltaBatcher(window=60)
+
+        async def main() -> str:
+            task = asyncio.create_task(batcher.humanize(timedelta(seconds=1)))
+            await asyncio.sleep(0)
+            batcher.flush()
+            return await task
+
+        assert asyncio.run(main()) == "1 second"
+        assert batches == [1]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error", "msg"),
+        [
+            ({"units": ("months",)}, ValueError, "units can only be the following"),
+            ({"max_units": 0}, ValueError, "max_units must be at least 1, not 0"),
+            ({"window": -1}, ValueError, "window must not be negative, not -1"),
+            ({"max_batch": 0}, ValueError, "max_batch must be at least 1, not 0"),
+        ],
+    )
+    def test_invalid(
+        self, kwargs: dict[str, Any], error: type[Exception], msg: str
+    ) -> None:
+        with pytest.raises(error, match=msg):
+            DeltaBatcher(**kwargs)
+
+
+async def produce(values: list[Any]) -> AsyncIterator[Any]:
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+async def collect(iterator: AsyncIterator[str]) -> list[str]:
+    return [text async for text in iterator]
+
+
+class TestAhumanizeIter:
+    def test_inline(self) -> None:
+        result = asyncio.run(collect(ahumanize_iter(produce(DELTAS), Style.SHORT)))
+
+        assert result == [from_timedelta(d, Style.SHORT) for d in DELTAS]
+
+    def test_executor(self, executor: ThreadPoolExecutor, batches: list[int]) -> None:
+        iterator = ahumanize_iter(
+            produce(MICROSECONDS * 3), executor=executor, batch_size=5
+        )
+
+        assert asyncio.run(collect(iterator)) == [
+            from_microseconds(v) for v in MICROSECONDS * 3
+        ]
+        assert batches == [5, 5, 2]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="batch_size must be at least 1, not 0"):
+            asyncio.run(collect(ahumanize_iter(produce([]), batch_size=0)))
+        with pytest.raises(ValueError, match="units can only be the following"):
+            asyncio.run(collect(ahumanize_iter(produce([]), units=("months",))))
+        with pytest.raises(TypeError):
+            asyncio.run(collect(ahumanize_iter(produce([1.5]))))
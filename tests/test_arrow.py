@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+
+import pytest
+
+from readabledelta2 import (
+    Style,
+    TDUnit,
+    from_microseconds,
+    from_timedelta,
+    readabledelta,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+from readabledelta2.arrow import from_duration_array  # noqa: E402
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(milliseconds=1, microseconds=1),
+    timedelta(seconds=80),
+    timedelta(days=6, hours=23, minutes=59, seconds=59),
+    timedelta(weeks=53, hours=1, minutes=1),
+    timedelta(days=375),
+]
+UNITS = [
+    None,
+    (TDUnit.HOURS,),
+    (TDUnit.YEARS, TDUnit.DAYS),
+    ("days", "seconds"),
+]
+
+
+@pytest.mark.parametrize("style", list(Style))
+@pytest.mark.parametrize("include_sign", [True, False])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_matches_from_timedelta(
+    style: Style, include_sign: bool, showzero: bool
+) -> None:
+    deltas = DELTAS + [-d for d in DELTAS]
+    arr = pa.array(deltas, pa.duration("us"))
+    for units in UNITS:
+        result = from_duration_array(
+            arr, style, units, include_sign=include_sign, showzero=showzero
+        )
+        expected = [
+            from_timedelta(
+                d, style, units, include_sign=include_sign, showzero=showzero
+            )
+            for d in deltas
+        ]
+        assert result.type == pa.string()
+        assert result.to_pylist() == expected
+
+
+@pytest.mark.parametrize("locale", ["en", "de"])
+@pytest.mark.parametrize("max_units", [None, 1, 2])
+@pytest.mark.parametrize("dictionary", [True, False])
+def test_locale_and_max_units(
+    locale: str, max_units: int | None, dictionary: bool
+) -> None:
+    deltas = DELTAS + [-d for d in DELTAS]
+    result = from_duration_array(
+        pa.array(deltas, pa.duration("us")),
+        locale=locale,
+        max_units=max_units,
+        dictionary=dictionary,
+    )
+    assert result.to_pylist() == [
+        from_timedelta(d, locale=locale, max_units=max_units) for d in deltas
+    ]
+
+
+@pytest.mark.parametrize(
+    ("unit", "mul", "div"),
+    [("s", 1000000, 1), ("ms", 1000, 1), ("us", 1, 1), ("ns", 1, 1000)],
+)
+def test_units(unit: str, mul: int, div: int) -> None:
+    values = [0, 1, -1, 1500, -1500, 86400 * 1000, 2**40]
+    result = from_duration_array(pa.array(values, pa.duration(unit)))
+
+    # finer than microseconds is floored
+    assert result.to_pylist() == [from_microseconds(v * mul // div) for v in values]
+
+
+def test_nulls() -> None:
+    values = [None, 1, 2, None, 3, 4, 5, 6, 7, None, 60]
+    arr = pa.array(values, pa.duration("s"))
+    expected = [
+        None if v is None else from_timedelta(timedelta(seconds=v)) for v in values
+    ]
+
+    assert from_duration_array(arr).to_pylist() == expected
+    # slices start part way into the validity bitmap
+    assert from_duration_array(arr.slice(3)).to_pylist() == expected[3:]
+    assert from_duration_array(arr.slice(9, 2)).to_pylist() == expected[9:]
+    assert from_duration_array(pa.nulls(3, pa.duration("s"))).to_pylist() == [None] * 3
+    assert from_duration_array(pa.array([], pa.duration("s"))).to_pylist() == []
+
+
+def test_dictionary() -> None:
+    arr = pa.array([60, None, 90, 60], pa.duration("s"))
+    result = from_duration_array(arr, Style.ABBREV, dictionary=True)
+
+    assert result.type == pa.dictionary(pa.int32(), pa.string())
+    assert result.dictionary.to_pylist() == ["1 m", "1 m and 30 s"]
+    assert result.to_pylist() == ["1 m", None, "1 m and 30 s", "1 m"]
+
+
+def test_dictionary_unique(monkeypatch: pytest.MonkeyPatch) -> None:
+    # the bulk renderers' memo limit doesn't apply, the dictionary holds every
+    # distinct string anyway.
+    monkeypatch.setattr(readabledelta, "MEMO_SIZE", 2)
+    arr = pa.array([1, 2, 3] * 3, pa.duration("s"))
+    result = from_duration_array(arr, dictionary=True)
+
+    assert result.dictionary.to_pylist() == ["1 second", "2 seconds", "3 seconds"]
+    assert result.indices.to_pylist() == [0, 1, 2] * 3
+
+
+def test_chunked() -> None:
+    arr = pa.chunked_array(
+        [pa.array([60, None], pa.duration("s")), pa.array([90], pa.duration("s"))]
+    )
+    result = from_duration_array(arr, Style.ABBREV)
+    encoded = from_duration_array(arr, Style.ABBREV, dictionary=True)
+
+    assert result.num_chunks == 2
+    assert result.to_pylist() == ["1 m", None, "1 m and 30 s"]
+    assert encoded.type == pa.dictionary(pa.int32(), pa.string())
+    assert encoded.to_pylist() == ["1 m", None, "1 m and 30 s"]
+
+
+def test_invalid_input() -> None:
+    with pytest.raises(TypeError, match="expected a duration array, not int64"):
+        from_duration_array(pa.array([1, 2]))
+
+    msg = f"units can only be the following: {tuple(TDUnit)}"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        from_duration_array(pa.array([1], pa.duration("s")), units=("months",))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import re
+import threading
+from datetime import timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import RDUnit, Style, TDUnit, from_relativedelta, from_timedelta
+from readabledelta2.cache import CacheInfo, DeltaCache
+
+
+class TestDeltaCache:
+    def test_matches_from_timedelta(self) -> None:
+        cache = DeltaCache()
+        deltas = [timedelta(0), timedelta(weeks=53, hours=1), timedelta(seconds=-80)]
+        for style in Style:
+            for units in (None, (TDUnit.DAYS, TDUnit.MINUTES)):
+                for delta in deltas:
+                    for _ in range(2):
+                        assert cache.from_timedelta(
+                            delta, style, units, showzero=True
+                        ) == from_timedelta(delta, style, units, showzero=True)
+
+    def test_matches_from_relativedelta(self) -> None:
+        cache = DeltaCache()
+        deltas = [
+            relativedelta(),
+            relativedelta(years=1, days=3),
+            -relativedelta(hours=5),
+        ]
+        for style in Style:
+            for units in (None, (RDUnit.MONTHS, RDUnit.HOURS)):
+                for delta in deltas:
+                    for _ in range(2):
+                        assert cache.from_relativedelta(
+                            delta, style, units, include_sign=False
+                        ) == from_relativedelta(delta, style, units, include_sign=False)
+
+    def test_locale_and_max_units(self) -> None:
+        cache = DeltaCache()
+        td = timedelta(days=9, hours=5, minutes=1)
+        rd = relativedelta(years=1, months=2, days=3)
+        for locale in ("en", "de"):
+            for max_units in (None, 1, 2):
+                assert cache.from_timedelta(
+                    td, locale=locale, max_units=max_units
+                ) == from_timedelta(td, locale=locale, max_units=max_units)
+                assert cache.from_relativedelta(
+                    rd, locale=locale, max_units=max_units
+                ) == from_relativedelta(rd, locale=locale, max_units=max_units)
+
+        assert cache.cache_info().currsize == 12
+
+    def test_hits_and_misses(self) -> None:
+        cache = DeltaCache(maxsize=2)
+        cache.from_timedelta(timedelta(hours=1))
+        cache.from_timedelta(timedelta(minutes=60))
+        cache.from_timedelta(timedelta(hours=1), Style.SHORT)
+        assert cache.cache_info() == CacheInfo(
+            hits=1, misses=2, evictions=0, maxsize=2, currsize=2
+        )
+
+    def test_lru_eviction(self) -> None:
+        cache = DeltaCache(maxsize=2)
+        cache.from_timedelta(timedelta(hours=1))
+        cache.from_timedelta(timedelta(hours=2))
+        cache.from_timedelta(timedelta(hours=1))  # hours=2 is now the oldest
+        cache.from_timedelta(timedelta(hours=3))
+        assert cache.cache_info().evictions == 1
+        cache.from_timedelta(timedelta(hours=1))
+        assert cache.cache_info().hits == 2
+        cache.from_timedelta(timedelta(hours=2))
+        assert cache.cache_info() == CacheInfo(
+            hits=2, misses=4, evictions=2, maxsize=2, currsize=2
+        )
+
+    def test_cache_clear(self) -> None:
+        cache = DeltaCache()
+        cache.from_timedelta(timedelta(hours=1))
+        cache.cache_clear()
+        assert cache.cache_info() == CacheInfo(0, 0, 0, 4096, 0)
+
+    def test_resolution(self) -> None:
+        cache = DeltaCache(resolution=timedelta(seconds=1))
+        assert cache.from_timedelta(timedelta(seconds=61, milliseconds=400)) == (
+            "1 minute and 1 second"
+        )
+        assert cache.from_timedelta(timedelta(seconds=61, milliseconds=900)) == (
+            "1 minute and 1 second"
+        )
+        assert cache.from_timedelta(-timedelta(seconds=61, milliseconds=900)) == (
+            "-1 minute and 1 second"
+        )
+        assert cache.from_timedelta(timedelta(milliseconds=900)) == "0 seconds"
+        assert cache.cache_info().hits == 1
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="maxsize must be at least 1"):
+            DeltaCache(maxsize=0)
+        with pytest.raises(ValueError, match="resolution must be at least"):
+            DeltaCache(resolution=timedelta(0))
+
+        cache = DeltaCache()
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            cache.from_timedelta(timedelta(0), units=("months",))
+        with pytest.raises(TypeError, match="expected timedelta"):
+            cache.from_timedelta(relativedelta(hours=1))  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Invalid argument foobar"):
+            cache.from_timedelta(timedelta(1), style="foobar")  # type: ignore[arg-type]
+        assert cache.cache_info().currsize == 0
+
+    def test_threads(self) -> None:
+        cache = DeltaCache(maxsize=50)
+        errors = []
+
+        def work(offset: int) -> None:
+            for i in range(500):
+                delta = timedelta(seconds=(i + offset) % 80)
+                if cache.from_timedelta(delta) != from_timedelta(delta):
+                    errors.append(delta)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        assert not errors
+        assert info.hits + info.misses == 8 * 500
+        assert info.currsize == 50
+        # racing threads may both miss on the same key before either stores it.
+        assert info.misses - info.evictions >= 50
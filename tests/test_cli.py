@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from readabledelta2 import Style, cli, from_timedelta
+from readabledelta2.cli import main, parse_timedelta, write_lines
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(seconds=90, microseconds=500),
+    timedelta(days=371, hours=1, minutes=1),
+    -timedelta(seconds=1, microseconds=500000),
+    -timedelta(days=10000, hours=5),
+    timedelta.max,
+    timedelta.min,
+]
+
+
+def run(argv: list[str], text: str) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = main(argv, io.StringIO(text), stdout, stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class TestWriteLines:
+    def test_batches(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cli, "BATCH_SIZE", 2)
+        out = io.StringIO()
+        writes: list[str] = []
+        monkeypatch.setattr(out, "write", writes.append)
+        write_lines(["a", "b\n", "c"], out)
+
+        assert writes == ["a\nb\n", "c\n"]
+
+        writes.clear()
+        write_lines(["a", "b"], out)
+        assert writes == ["a\nb\n"]
+
+    def test_write_error_not_repeated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cli, "BATCH_SIZE", 2)
+        out = io.StringIO()
+        writes: list[str] = []
+
+        def failing(text: str) -> int:
+            writes.append(text)
+            msg = "disk full"
+            raise OSError(msg)
+
+        monkeypatch.setattr(out, "write", failing)
+        with pytest.raises(OSError, match="disk full"):
+            write_lines(["a", "b", "c"], out)
+
+        assert writes == ["a\nb\n"]
+
+
+class TestCli:
+    def test_seconds(self) -> None:
+        code, out, err = run(["--style", "short"], "90\n3600.5\n-1.25\n")
+
+        assert code == 0
+        assert err == ""
+        assert out.splitlines() == [
+            from_timedelta(timedelta(seconds=90), Style.SHORT),
+            from_timedelta(timedelta(seconds=3600.5), Style.SHORT),
+            from_timedelta(timedelta(seconds=-1.25), Style.SHORT),
+        ]
+
+    def test_microseconds(self) -> None:
+        code, out, _ = run(["-f", "microseconds", "-u", "seconds"], "1500000\n-7")
+
+        assert code == 0
+        assert out == "1 second and 500 milliseconds\n-7 microseconds\n"
+
+    def test_timedelta(self) -> None:
+        text = "".join(f"{delta}\n" for delta in DELTAS)
+        code, out, _ = run(["-f", "timedelta"], text)
+
+        assert code == 0
+        assert out.splitlines() == [from_timedelta(delta) for delta in DELTAS]
+        for delta in DELTAS:
+            assert parse_timedelta(str(delta)) == delta // timedelta(microseconds=1)
+
+    def test_options(self) -> None:
+        code, out, _ = run(
+            ["-s", "abbrev", "-u", "hours,minutes", "--no-sign", "--showzero"],
+            "-60\n",
+        )
+
+        assert code == 0
+        assert out == "0 h and 1 m\n"
+
+    def test_locale(self) -> None:
+        code, out, _ = run(["--locale", "de", "-s", "short"], "90\n")
+
+        assert code == 0
+        assert out == "1 Min. und 30 Sek.\n"
+
+    def test_pattern(self) -> None:
+        text = "GET / took=1500ms status=200\nno duration here\nfoo took=90ms\n"
+        code, out, _ = run(["-f", "microseconds", "-p", r"took=(?P<delta>\d+)ms"], text)
+
+        assert code == 0
+        assert out == (
+            "GET / took=1 millisecond and 500 microsecondsms status=200\n"
+            "no duration here\n"
+            "foo took=90 microsecondsms\n"
+        )
+
+    def test_pattern_groups(self) -> None:
+        _, first, _ = run(["-p", r"(\d+)s (\d+)s"], "a 60s 90s\n")
+        _, whole, _ = run(["-p", r"\d+"], "a 60 90\n")
+
+        assert first == "a 1 minutes 90s\n"
+        assert whole == "a 1 minute 1 minute and 30 seconds\n"
+
+    def test_fail(self) -> None:
+        code, out, err = run([], "1\nnope\n2\n")
+
+        assert code == 1
+        assert out == "1 second\n"
+        assert err == "readabledelta2: line 2: cannot parse 'nope' as seconds\n"
+
+    @pytest.mark.parametrize(
+        ("on_error", "expected"),
+        [
+            ("keep", "1 second\nnope\n2 seconds\n"),
+            ("skip", "1 second\n2 seconds\n"),
+        ],
+    )
+    def test_on_error(self, on_error: str, expected: str) -> None:
+        code, out, _ = run(["--on-error", on_error], "1\nnope\n2\n")
+
+        assert code == 0
+        assert out == expected
+
+    @pytest.mark.parametrize(
+        ("on_error", "expected"),
+        [
+            ("keep", "a took=1 second\nb took=nope\nc took=2 seconds\n"),
+            ("skip", "a took=1 second\nc took=2 seconds\n"),
+        ],
+    )
+    def test_pattern_on_error(self, on_error: str, expected: str) -> None:
+        text = "a took=1\nb took=nope\nc took=2\n"
+        code, out, _ = run(["-p", r"took=(\S+)", "--on-error", on_error], text)
+
+        assert code == 0
+        assert out == expected
+
+    def test_stats(self) -> None:
+        code, _, err = run(["--stats", "--on-error", "skip"], "1\nnope\n2\n")
+
+        assert code == 0
+        assert err.startswith("readabledelta2: 3 lines, 2 values, 1 errors in ")
+        assert err.endswith(" lines/s)\n")
+
+    def test_packed(self, tmp_path: Path) -> None:
+        path = tmp_path / "durations.bin"
+        # timedelta.max and min do not fit in int64 microseconds
+        deltas = DELTAS[:-2]
+        values = [d // timedelta(microseconds=1) for d in deltas]
+        path.write_bytes(b"".join(v.to_bytes(8, "little", signed=True) for v in values))
+
+        code, out, err = run(["--packed", str(path), "-s", "short", "--stats"], "")
+
+        assert code == 0
+        assert out.splitlines() == [from_timedelta(d, Style.SHORT) for d in deltas]
+        assert err.startswith("readabledelta2: 6 lines, 6 values, 0 errors in ")
+
+    def test_packed_errors(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        odd = tmp_path / "odd.bin"
+        odd.write_bytes(b"\0" * 12)
+        empty = tmp_path / "empty.bin"
+        empty.touch()
+
+        assert run(["--packed", str(empty)], "") == (0, "", "")
+        assert run(["--packed", str(odd)], "") == (
+            1,
+            "",
+            "readabledelta2: buffer size must be a multiple of 8 bytes, not 12\n",
+        )
+        code, _, err = run(["--packed", str(tmp_path / "missing.bin")], "")
+        assert code == 1
+        assert err.startswith("readabledelta2: [Errno 2] No such file or directory")
+        with pytest.raises(SystemExit):
+            run(["--packed", str(empty), "-p", "x"], "")
+        assert "--pattern cannot be used with --packed" in capsys.readouterr().err
+
+    def test_invalid_units(self, capsys: pytest.CaptureFixture[str]) -> None:
+        with pytest.raises(SystemExit) as exc:
+            run(["-u", "months"], "")
+
+        assert exc.value.code == 2
+        assert "units can only be the following" in capsys.readouterr().err
+
+    def test_module(self) -> None:
+        proc = subprocess.run(
+            [sys.executable, "-m", "readabledelta2", "-f", "timedelta"],
+            input="371 days, 1:01:00\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert proc.stdout == "1 year, 6 days, 1 hour and 1 minute\n"
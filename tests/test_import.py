@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+import readabledelta2.readabledelta
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Import time of the package over that of dateutil.relativedelta, which the
+# package used to import, measured side by side so the budget follows the speed
+# of the machine. Once dateutil was made lazy the package took about two thirds
+# of the time, this allows about twice that.
+IMPORT_BUDGET = 1.3
+# imported first by both, the callers already have them and which of them
+# site imports differs between Python versions.
+PRELUDE = "import datetime, re, typing\n"
+
+
+def importtime(code: str, pycache: Path | None = None) -> dict[str, int]:
+    """Run code in a fresh interpreter, return cumulative import time (us) per module."""
+    env = None
+    if pycache is not None:
+        env = {**os.environ, "PYTHONPYCACHEPREFIX": str(pycache)}
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestImport:
+    def test_dateutil_not_imported(self) -> None:
+        modules = importtime(
+            "from datetime import date, timedelta\n"
+            "import readabledelta2\n"
+            "readabledelta2.from_timedelta(timedelta(days=1, seconds=5))\n"
+            "readabledelta2.from_datetimes(date(2024, 1, 31), date(2024, 3, 1))"
+        )
+
+        assert "readabledelta2" in modules
+        assert not [name for name in modules if name.startswith("dateutil")]
+
+    def test_import_budget(self, tmp_path: Path) -> None:
+        # the first runs write the bytecode, keep the best of the rest.
+        package = []
+        dateutil = []
+        for _ in range(8):
+            package.append(importtime(f"{PRELUDE}import readabledelta2", tmp_path))
+            dateutil.append(
+                importtime(f"{PRELUDE}import dateutil.relativedelta", tmp_path)
+            )
+        best = min(modules["readabledelta2"] for modules in package[1:])
+        baseline = min(modules["dateutil.relativedelta"] for modules in dateutil[1:])
+
+        assert best < baseline * IMPORT_BUDGET
+
+    def test_parser_and_template_not_imported(self) -> None:
+        modules = importtime(
+            "import readabledelta2\n"
+            "from readabledelta2 import DeltaFormatter, Style, from_timedelta"
+        )
+
+        assert "readabledelta2.parser" not in modules
+        assert "readabledelta2.template" not in modules
+
+    def test_lazy_exports(self) -> None:
+        from readabledelta2 import parser, template  # noqa: PLC0415
+
+        assert readabledelta2.from_template is template.from_template
+        assert readabledelta2.DeltaParser is parser.DeltaParser
+        assert set(readabledelta2.__all__) <= set(dir(readabledelta2))
+        with pytest.raises(AttributeError, match="does_not_exist"):
+            _ = readabledelta2.does_not_exist
+
+    def test_lazy_attributes(self) -> None:
+        module = readabledelta2.readabledelta
+
+        assert module.relativedelta is relativedelta
+        assert module.T_delta == relativedelta | module.timedelta
+
+    def test_unknown_attribute(self) -> None:
+        module = readabledelta2.readabledelta
+
+        with pytest.raises(AttributeError, match="does_not_exist"):
+            _ = module.does_not_exist
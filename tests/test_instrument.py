@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import (
+    DeltaFormatter,
+    Style,
+    from_datetimes,
+    from_microseconds,
+    from_relativedelta,
+    from_seconds,
+    from_timedelta,
+    instrument,
+)
+from readabledelta2.instrument import PHASES, PhaseStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CALLS: list[tuple[str, Callable[[], str]]] = [
+    ("from_timedelta", lambda: from_timedelta(timedelta(days=-1, hours=5))),
+    ("from_timedelta", lambda: from_timedelta(timedelta(0))),
+    ("from_timedelta", lambda: from_timedelta(timedelta(days=9), max_units=1)),
+    ("from_microseconds", lambda: from_microseconds(-90_000_001)),
+    ("from_seconds", lambda: from_seconds(3600.5)),
+    ("from_relativedelta", lambda: from_relativedelta(relativedelta(months=-1))),
+    ("from_relativedelta", lambda: from_relativedelta(relativedelta())),
+    (
+        "from_relativedelta",
+        lambda: from_relativedelta(relativedelta(years=1, days=2), max_units=1),
+    ),
+    (
+        "from_datetimes",
+        lambda: from_datetimes(datetime(2024, 1, 31, 12), date(2023, 2, 28)),
+    ),
+    ("from_datetimes", lambda: from_datetimes(date(2024, 1, 1), date(2024, 1, 1))),
+    (
+        "DeltaFormatter.format_timedelta",
+        lambda: DeltaFormatter(showzero=True).format(timedelta(0)),
+    ),
+    (
+        "DeltaFormatter.format_microseconds",
+        lambda: DeltaFormatter().format_microseconds(5),
+    ),
+    (
+        "DeltaFormatter.format_relativedelta",
+        lambda: DeltaFormatter().format(relativedelta(years=1, days=2)),
+    ),
+    (
+        "DeltaFormatter.format_datetimes",
+        lambda: DeltaFormatter().format_datetimes(date(2024, 1, 1), date(2025, 3, 1)),
+    ),
+]
+
+
+@pytest.fixture
+def enabled() -> Iterator[None]:
+    instrument.reset()
+    instrument.enable()
+    try:
+        yield
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
+def test_disabled_by_default() -> None:
+    instrument.reset()
+    from_timedelta(timedelta(hours=1))
+
+    assert not instrument.is_enabled()
+    assert instrument.stats().phases == {}
+
+
+@pytest.mark.usefixtures("enabled")
+class TestEnabled:
+    def test_same_output(self) -> None:
+        results = [call() for _, call in CALLS]
+        instrument.disable()
+
+        assert results == [call() for _, call in CALLS]
+
+    def test_phases(self) -> None:
+        for _, call in CALLS:
+            call()
+        phases = instrument.stats().phases
+
+        for entry, _ in CALLS:
+            calls = sum(entry == name for name, _ in CALLS)
+            for phase in PHASES:
+                found = phases[entry, Style.NORMAL, phase]
+                assert found.calls == calls
+                assert found.ns >= 0
+        assert {key[0] for key in phases} == {entry for entry, _ in CALLS}
+
+    def test_formatter_not_validated(self) -> None:
+        formatter = DeltaFormatter()
+        formatter.format(timedelta(hours=1))
+        formatter.format_datetimes(date(2024, 1, 1), date(2024, 2, 1))
+        phases = instrument.stats().phases
+
+        for entry in ("format_timedelta", "format_datetimes"):
+            assert phases[f"DeltaFormatter.{entry}", Style.NORMAL, "validate"] == (1, 0)
+
+    def test_by_style(self) -> None:
+        from_timedelta(timedelta(hours=1), Style.SHORT)
+        from_timedelta(timedelta(hours=1), Style.SHORT)
+        from_timedelta(timedelta(hours=1), Style.ABBREV)
+        phases = instrument.stats().phases
+
+        assert phases["from_timedelta", Style.SHORT, "render"].calls == 2
+        assert phases["from_timedelta", Style.ABBREV, "render"].calls == 1
+        assert ("from_timedelta", Style.NORMAL, "render") not in phases
+
+    def test_errors_are_not_recorded(self) -> None:
+        with pytest.raises(ValueError, match="units can only be the following"):
+            from_timedelta(timedelta(hours=1), units=("months",))
+        with pytest.raises(ValueError, match="units can only be the following"):
+            DeltaFormatter(units=("months",)).format(timedelta(hours=1))
+
+        assert instrument.stats().phases == {}
+
+    def test_plan_cache(self) -> None:
+        for _ in range(3):
+            from_timedelta(timedelta(hours=1), Style.ABBREV, ("days", "minutes"))
+        info = instrument.stats().plan_cache
+
+        assert info.hits + info.misses == 3
+        assert info.hits >= 2
+        assert info.currsize >= 1
+        instrument.reset()
+        assert instrument.stats().plan_cache[:2] == (0, 0)
+
+    def test_reset_and_disable(self) -> None:
+        from_seconds(1)
+        instrument.disable()
+        from_seconds(1)
+
+        assert instrument.stats().phases["from_seconds", Style.NORMAL, "sign"][0] == 1
+        instrument.reset()
+        assert instrument.stats().phases == {}
+
+    def test_threads(self) -> None:
+        def work() -> None:
+            for _ in range(500):
+                from_microseconds(1)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        found = instrument.stats().phases["from_microseconds", Style.NORMAL, "split"]
+        assert isinstance(found, PhaseStats)
+        assert found.calls == 2000
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import (
+    DeltaFormatter,
+    Style,
+    from_microseconds,
+    from_relativedelta,
+    from_seconds,
+    from_template,
+    from_timedelta,
+    locales,
+)
+from readabledelta2.locales import (
+    LocaleDefinition,
+    available_locales,
+    get_locale,
+    register_locale,
+)
+from readabledelta2.locales.ru import plural as ru_plural
+from readabledelta2.readabledelta import TIME_UNITS, _formatter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Undo any registrations a test makes."""
+    monkeypatch.setattr(locales, "_loaders", dict(locales._loaders))
+    monkeypatch.setattr(locales, "_compiled", dict(locales._compiled))
+    yield
+    _formatter.cache_clear()
+
+
+def pig_latin() -> LocaleDefinition:
+    labels: dict[str, Mapping[str, Mapping[str, str]]] = {
+        unit: {style.value: {"other": f"{name}ay"} for style, name in styles.items()}
+        for unit, styles in TIME_UNITS.items()
+    }
+    return LocaleDefinition(labels, lambda _: "other", " / ", " & ")
+
+
+class TestBuiltin:
+    def test_available(self) -> None:
+        assert available_locales() == ("de", "en", "es", "fr", "ru")
+
+    def test_english_is_default(self) -> None:
+        delta = timedelta(days=1, hours=2, seconds=1)
+        for style in Style:
+            assert from_timedelta(delta, style, locale="en") == from_timedelta(
+                delta, style
+            )
+
+    @pytest.mark.parametrize(
+        ("locale", "style", "expected"),
+        [
+            ("de", Style.NORMAL, "1 Tag, 2 Stunden und 1 Sekunde"),
+            ("de", Style.SHORT, "1 Tg., 2 Std. und 1 Sek."),
+            ("es", Style.NORMAL, "1 día, 2 horas y 1 segundo"),
+            ("fr", Style.NORMAL, "1 jour, 2 heures et 1 seconde"),
+            ("fr", Style.ABBREV, "1 j, 2 h et 1 s"),
+            ("ru", Style.NORMAL, "1 день, 2 часа и 1 секунда"),
+            ("ru", Style.ABBREV, "1 д, 2 ч и 1 с"),  # noqa: RUF001
+        ],
+    )
+    def test_from_timedelta(self, locale: str, style: Style, expected: str) -> None:
+        delta = timedelta(days=1, hours=2, seconds=1)
+
+        assert from_timedelta(delta, style, locale=locale) == expected
+
+    def test_zero(self) -> None:
+        # zero takes the singular in French
+        assert from_timedelta(timedelta(0), locale="fr") == "0 seconde"
+        assert from_timedelta(timedelta(0), locale="ru") == "0 секунд"
+        assert (
+            from_timedelta(
+                timedelta(hours=1),
+                units=("hours", "minutes"),
+                showzero=True,
+                locale="de",
+            )
+            == "1 Stunde und 0 Minuten"
+        )
+
+    def test_other_entry_points(self) -> None:
+        assert from_seconds(-90, locale="de") == "-1 Minute und 30 Sekunden"
+        assert (
+            from_microseconds(2500, locale="es") == "2 milisegundos y 500 microsegundos"
+        )
+        assert (
+            from_relativedelta(relativedelta(years=1, months=2), locale="ru")
+            == "1 год и 2 месяца"
+        )
+        formatter = DeltaFormatter(Style.NORMAL, ("hours",), locale="fr")
+        assert formatter.format(timedelta(hours=2)) == "2 heures"
+
+    @pytest.mark.parametrize(
+        ("hours", "expected"),
+        [
+            (1, "час"),
+            (2, "часа"),
+            (5, "часов"),
+            (11, "часов"),
+            (12, "часов"),
+            (21, "час"),
+            (22, "часа"),
+            (101, "час"),
+            (111, "часов"),
+            (114, "часов"),
+            (1002, "часа"),
+        ],
+    )
+    def test_russian_plurals(self, hours: int, expected: str) -> None:
+        result = from_timedelta(timedelta(hours=hours), units=("hours",), locale="ru")
+
+        assert result == f"{hours} {expected}"
+
+    def test_table_matches_rule(self) -> None:
+        table = get_locale("ru").labels["days"]["normal"]
+        forms = {"one": "день", "few": "дня", "many": "дней"}
+
+        for count in range(2000):
+            index = count if count < 100 else 100 + count % 100
+            assert table[index] == forms[ru_plural(count)]
+
+
+class TestRegistry:
+    def test_register_definition(self) -> None:
+        register_locale("pig", pig_latin())
+
+        assert "pig" in available_locales()
+        assert from_timedelta(timedelta(days=8, hours=1), locale="pig") == (
+            "1 weeksay / 1 daysay & 1 hoursay"
+        )
+
+    def test_register_lazily(self) -> None:
+        calls = []
+
+        def load() -> LocaleDefinition:
+            calls.append(1)
+            return pig_latin()
+
+        register_locale("pig", load)
+        assert calls == []
+
+        from_timedelta(timedelta(days=1), locale="pig")
+        from_timedelta(timedelta(days=2), locale="pig")
+        assert calls == [1]
+
+    def test_replace(self) -> None:
+        register_locale("pig", pig_latin())
+        assert from_timedelta(timedelta(days=1), locale="pig") == "1 daysay"
+
+        definition = pig_latin()
+        register_locale("pig", definition._replace(plural=lambda _: "one"))
+        # a missing category falls back to "other"
+        assert from_timedelta(timedelta(days=1), locale="pig") == "1 daysay"
+        labels = dict(definition.labels)
+        labels["days"] = {style.value: {"other": "d"} for style in Style}
+        register_locale("pig", definition._replace(labels=labels))
+        assert from_timedelta(timedelta(days=1), locale="pig") == "1 d"
+
+    def test_replace_template(self) -> None:
+        register_locale("pig", pig_latin())
+        assert from_template(timedelta(days=1), "{D} {D!n}", locale="pig") == (
+            "1 daysay"
+        )
+
+        definition = pig_latin()
+        labels = dict(definition.labels)
+        labels["days"] = {style.value: {"other": "d"} for style in Style}
+        register_locale("pig", definition._replace(labels=labels))
+        assert from_template(timedelta(days=1), "{D} {D!n}", locale="pig") == "1 d"
+        assert from_timedelta(timedelta(days=1), locale="pig") == "1 d"
+
+    def test_unknown(self) -> None:
+        msg = f"locale can only be one of the following: {available_locales()}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            from_timedelta(timedelta(days=1), locale="xx")
+
+    def test_missing_other(self) -> None:
+        definition = pig_latin()
+        labels = dict(definition.labels)
+        labels["hours"] = {"normal": {"one": "h"}}
+        register_locale("broken", definition._replace(labels=labels))
+
+        msg = "locale 'broken' has no 'other' label for hours in normal style"
+        with pytest.raises(ValueError, match=msg):
+            get_locale("broken")
+
+
+def test_unused_locales_are_not_imported() -> None:
+    code = (
+        "import sys\n"
+        "from datetime import timedelta\n"
+        "import readabledelta2\n"
+        "readabledelta2.from_timedelta(timedelta(days=1))\n"
+        "print(sorted(m for m in sys.modules if m.startswith('readabledelta2.loc')))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert (
+        proc.stdout.strip() == "['readabledelta2.locales', 'readabledelta2.locales.en']"
+    )
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import io
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+import readabledelta2.logging as rdlogging
+from readabledelta2 import RDUnit, Style, TDUnit, from_relativedelta, from_timedelta
+from readabledelta2.logging import DeltaLogFilter, DeltaLogFormatter, LazyDelta, lazy
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TD = timedelta(days=2, hours=5, minutes=1)
+RD = relativedelta(months=-1, days=-3)
+
+
+@pytest.fixture
+def logger() -> Iterator[logging.Logger]:
+    logger = logging.getLogger("readabledelta2.tests")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    for log_filter in logger.filters[:]:
+        logger.removeFilter(log_filter)
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[timedelta]:
+    """The timedeltas rendered, as "text"."""
+    rendered: list[timedelta] = []
+
+    def counting(delta: timedelta, *_args: object, **_kwargs: object) -> str:
+        rendered.append(delta)
+        return "text"
+
+    monkeypatch.setattr(rdlogging, "from_timedelta", counting)
+    return rendered
+
+
+def add_handler(
+    logger: logging.Logger, formatter: logging.Formatter | None = None
+) -> io.StringIO:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter or logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    return stream
+
+
+class TestLazy:
+    def test_timedelta(self) -> None:
+        assert str(lazy(TD)) == from_timedelta(TD)
+        assert str(lazy(-TD, Style.SHORT, (TDUnit.HOURS,), include_sign=False)) == (
+            from_timedelta(-TD, Style.SHORT, (TDUnit.HOURS,), include_sign=False)
+        )
+        assert str(lazy(TD, locale="de", max_units=2)) == "2 Tage und 5 Stunden"
+
+    def test_relativedelta(self) -> None:
+        anchor = datetime(2024, 3, 1)
+        assert str(lazy(RD)) == from_relativedelta(RD)
+        assert str(lazy(RD, Style.ABBREV, (RDUnit.DAYS,), anchor=anchor)) == (
+            from_relativedelta(RD, Style.ABBREV, (RDUnit.DAYS,), anchor=anchor)
+        )
+
+    def test_rendered_once(self, calls: list[timedelta]) -> None:
+        value = lazy(TD)
+        assert calls == []
+        assert f"{value} {value}" == "text text"
+        assert calls == [TD]
+
+    def test_not_rendered_when_dropped(
+        self, logger: logging.Logger, calls: list[timedelta]
+    ) -> None:
+        stream = add_handler(logger)
+        logger.debug("took %s", lazy(TD))
+        assert calls == []
+        logger.info("took %s", lazy(TD))
+        assert calls == [TD]
+        assert stream.getvalue() == "took text\n"
+
+    def test_repr(self) -> None:
+        assert repr(lazy(TD)) == f"LazyDelta({TD!r})"
+        assert lazy is LazyDelta
+
+    def test_invalid_on_render(self) -> None:
+        value = lazy(TD, units=("months",))
+        with pytest.raises(ValueError, match="units can only be the following"):
+            str(value)
+
+
+class TestDeltaLogFilter:
+    def test_args(self, logger: logging.Logger) -> None:
+        stream = add_handler(logger)
+        logger.addFilter(DeltaLogFilter(style=Style.SHORT))
+        logger.info("%s then %s after %d tries", TD, RD, 3)
+        logger.info("%(took)s", {"took": -TD, "count": 1})
+        logger.info("no args")
+
+        assert stream.getvalue().splitlines() == [
+            (
+                f"{from_timedelta(TD, Style.SHORT)} then "
+                f"{from_relativedelta(RD, Style.SHORT)} after 3 tries"
+            ),
+            from_timedelta(-TD, Style.SHORT),
+            "no args",
+        ]
+
+    def test_replaces_args(self) -> None:
+        record = logging.LogRecord("x", logging.INFO, "", 0, "%s %s", (TD, 1), None)
+        assert DeltaLogFilter(max_units=1).filter(record)
+        assert record.args == ("2 days", 1)
+
+    def test_leaves_other_args(self) -> None:
+        args = ("x", 1)
+        record = logging.LogRecord("x", logging.INFO, "", 0, "%s %s", args, None)
+        assert DeltaLogFilter().filter(record)
+        assert record.args is args
+
+    def test_name(self) -> None:
+        record = logging.LogRecord("other", logging.INFO, "", 0, "%s", (TD,), None)
+        assert not DeltaLogFilter("readabledelta2").filter(record)
+        assert record.args == (TD,)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="max_units must be at least 1, not 0"):
+            DeltaLogFilter(max_units=0)
+
+
+class TestDeltaLogFormatter:
+    def test_format(self, logger: logging.Logger) -> None:
+        formatter = DeltaLogFormatter(
+            "{levelname} {message}", style="{", delta_style=Style.ABBREV, locale="de"
+        )
+        stream = add_handler(logger, formatter)
+        logger.info("took %s and %r", TD, "x")
+
+        assert stream.getvalue() == (
+            f"INFO took {from_timedelta(TD, Style.ABBREV, locale='de')} and 'x'\n"
+        )
+
+    def test_record_unchanged(self, logger: logging.Logger) -> None:
+        humanized = add_handler(logger, DeltaLogFormatter())
+        plain = add_handler(logger)
+        logger.info("took %s", TD)
+
+        assert humanized.getvalue() == f"took {from_timedelta(TD)}\n"
+        assert plain.getvalue() == f"took {TD}\n"
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="max_units must be at least 1, not 0"):
+            DeltaLogFormatter(max_units=0)
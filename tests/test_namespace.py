@@ -3,10 +3,23 @@ import readabledelta2
 
 def test_readabledelta2() -> None:
     expected = [
+        "DeltaFormatter",
+        "DeltaParser",
+        "DeltaParts",
+        "DeltaTemplate",
+        "from_datetimes",
+        "from_microseconds",
         "from_relativedelta",
+        "from_seconds",
+        "from_template",
         "from_timedelta",
+        "to_relativedelta",
+        "to_relativedelta_many",
+        "to_timedelta",
+        "to_timedelta_many",
         "Style",
         "TDUnit",
         "RDUnit",
+        "UnitSet",
     ]
     assert sorted(readabledelta2.__all__) == sorted(expected)
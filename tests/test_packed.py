@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import mmap
+import sys
+from array import array
+from typing import TYPE_CHECKING, Literal
+
+import pytest
+
+from readabledelta2 import Style, from_microseconds, packed, readabledelta
+from readabledelta2.packed import (
+    humanize_packed,
+    int64_view,
+    iter_microseconds,
+    map_packed,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+VALUES = [0, 1, -1, 1500, -1500, 90 * 10**6, 86400 * 10**6 * 400, -(2**62), 2**63 - 1]
+
+
+def test_array() -> None:
+    result = list(humanize_packed(array("q", VALUES), Style.SHORT))
+
+    assert result == [from_microseconds(v, Style.SHORT) for v in VALUES]
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_raw_bytes(byteorder: Literal["little", "big"]) -> None:
+    data = b"".join(v.to_bytes(8, byteorder, signed=True) for v in VALUES)
+    result = humanize_packed(data, units=("days", "seconds"), byteorder=byteorder)
+
+    assert list(result) == [
+        from_microseconds(v, units=("days", "seconds")) for v in VALUES
+    ]
+
+
+def test_locale_and_max_units() -> None:
+    result = humanize_packed(array("q", VALUES), locale="de", max_units=2)
+
+    assert list(result) == [
+        from_microseconds(v, locale="de", max_units=2) for v in VALUES
+    ]
+
+
+def test_typed_buffers_are_native() -> None:
+    # a typed buffer is already native, byteorder only applies to raw bytes
+    other: Literal["little", "big"] = "big" if sys.byteorder == "little" else "little"
+    values = array("q", VALUES)
+
+    assert list(iter_microseconds(values, other)) == VALUES  # type: ignore[arg-type]
+
+
+def test_memo_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(readabledelta, "MEMO_SIZE", 3)
+    values = [v % 5 * 10**6 for v in range(20)]
+
+    assert list(humanize_packed(array("q", values))) == [
+        from_microseconds(v) for v in values
+    ]
+
+
+@pytest.mark.parametrize("window", [1, 2, 5])
+def test_map_packed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, window: int
+) -> None:
+    # windows smaller than the file exercise dropping pages behind the reader
+    monkeypatch.setattr(packed, "WINDOW", window * mmap.PAGESIZE)
+    values = list(range(-5000, 5000, 7))
+    path = tmp_path / "durations.bin"
+    array("q", values).tofile(path.open("wb"))
+
+    with map_packed(path) as buffer:
+        result = list(humanize_packed(buffer, Style.ABBREV))
+
+    assert result == [from_microseconds(v, Style.ABBREV) for v in values]
+
+
+def test_map_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.bin"
+    path.touch()
+
+    with map_packed(path) as buffer:
+        assert list(humanize_packed(buffer)) == []
+
+
+def test_invalid_buffers() -> None:
+    with pytest.raises(
+        TypeError, match="expected a buffer of int64 or bytes, not format 'd'"
+    ):
+        int64_view(array("d", [1.0]))
+    with pytest.raises(TypeError, match="not format 'i'"):
+        int64_view(array("i", [1, 2]))
+    with pytest.raises(ValueError, match="multiple of 8 bytes, not 12"):
+        int64_view(b"\0" * 12)
+    with pytest.raises(TypeError):
+        int64_view([1, 2])
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from readabledelta2 import Style, TDUnit, from_timedelta
+
+pd = pytest.importorskip("pandas")
+
+import readabledelta2.pandas  # noqa: E402, F401
+
+if TYPE_CHECKING:
+    from pandas import Series
+
+SECONDS = [90, 3600, None, -5, 90, 0]
+
+
+@pytest.fixture
+def series() -> Series:
+    return pd.Series(pd.to_timedelta(SECONDS, unit="s"), name="took")
+
+
+@pytest.mark.parametrize("style", list(Style))
+@pytest.mark.parametrize("include_sign", [True, False])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_format(
+    series: Series, style: Style, include_sign: bool, showzero: bool
+) -> None:
+    units = (TDUnit.MINUTES, TDUnit.SECONDS)
+    result = series.readabledelta.format(
+        style, units, include_sign=include_sign, showzero=showzero
+    )
+    expected = [
+        (
+            None
+            if s is None
+            else from_timedelta(
+                timedelta(seconds=s),
+                style,
+                units,
+                include_sign=include_sign,
+                showzero=showzero,
+            )
+        )
+        for s in SECONDS
+    ]
+    assert result.tolist() == expected
+    assert result.name == "took"
+    assert result.index.equals(series.index)
+
+
+@pytest.mark.parametrize("categorical", [True, False])
+def test_format_locale_and_max_units(categorical: bool) -> None:
+    # max_units cuts both to the same string, rendered and categorized once.
+    series = pd.Series(pd.to_timedelta([3723, 3720, None], unit="s"), name="took")
+    expected = from_timedelta(timedelta(seconds=3720), locale="de")
+    result = series.readabledelta.format(
+        locale="de", max_units=2, categorical=categorical
+    )
+    assert result.astype(object).where(result.notna(), None).tolist() == [
+        expected,
+        expected,
+        None,
+    ]
+    if categorical:
+        assert result.cat.categories.tolist() == [expected]
+
+    frame = pd.DataFrame({"took": series}).readabledelta.format(
+        locale="de", max_units=2
+    )
+    assert frame["took"].tolist()[:2] == [expected, expected]
+
+
+def test_format_categorical(series: Series) -> None:
+    result = series.readabledelta.format(Style.ABBREV, categorical=True)
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.isna().tolist() == [False, False, True, False, False, False]
+    assert result.astype(object).where(result.notna(), None).tolist() == [
+        "1 m and 30 s",
+        "1 h",
+        None,
+        "-5 s",
+        "1 m and 30 s",
+        "0 s",
+    ]
+
+
+def test_split(series: Series) -> None:
+    result = series.readabledelta.split((TDUnit.MINUTES,))
+    assert list(result.columns) == [unit.value for unit in TDUnit]
+    assert result["minutes"].tolist() == [1, 60, 0, 0, 1, 0]
+    assert result["seconds"].tolist() == [30, 0, 0, 5, 30, 0]
+
+
+def test_dataframe(series: Series) -> None:
+    frame = pd.DataFrame({"took": series, "other": range(len(series))})
+    result = frame.readabledelta.format(Style.SHORT)
+    assert result["took"].tolist()[:2] == ["1 min and 30 secs", "1 hr"]
+    assert result["other"].tolist() == list(range(len(series)))
+    assert frame["took"].dtype.kind == "m"
+
+
+def test_wrong_dtype() -> None:
+    with pytest.raises(AttributeError, match="timedelta64"):
+        _ = pd.Series([1, 2]).readabledelta
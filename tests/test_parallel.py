@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import multiprocessing
+import re
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from readabledelta2 import (
+    DeltaFormatter,
+    Style,
+    TDUnit,
+    from_datetimes,
+    from_microseconds,
+    from_template,
+    from_timedelta,
+    parallel,
+    readabledelta,
+    to_timedelta,
+)
+from readabledelta2.cache import DeltaCache
+from readabledelta2.parallel import humanize_parallel, humanize_threaded
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(seconds=90),
+    timedelta(days=371, hours=1, minutes=1),
+    -timedelta(seconds=1, microseconds=500000),
+    -timedelta(days=10000, hours=5),
+] * 7
+MICROSECONDS = [delta // timedelta(microseconds=1) for delta in DELTAS]
+# the test process may have threads running, which fork() does not like.
+CONTEXT = None
+if "forkserver" in multiprocessing.get_all_start_methods():
+    CONTEXT = multiprocessing.get_context("forkserver")
+
+
+class TestHumanizeParallel:
+    def test_in_process(self) -> None:
+        assert humanize_parallel(DELTAS) == [from_timedelta(d) for d in DELTAS]
+        assert humanize_parallel(DELTAS, workers=1, chunksize=1) == [
+            from_timedelta(d) for d in DELTAS
+        ]
+
+    def test_workers(self) -> None:
+        result = humanize_parallel(
+            DELTAS,
+            Style.ABBREV,
+            (TDUnit.HOURS,),
+            workers=3,
+            chunksize=4,
+            mp_context=CONTEXT,
+        )
+
+        assert result == [
+            from_timedelta(d, Style.ABBREV, (TDUnit.HOURS,)) for d in DELTAS
+        ]
+
+    def test_locale_and_max_units(self) -> None:
+        result = humanize_parallel(
+            DELTAS, locale="de", max_units=1, workers=2, chunksize=4, mp_context=CONTEXT
+        )
+
+        assert result == [from_timedelta(d, locale="de", max_units=1) for d in DELTAS]
+        assert humanize_parallel(DELTAS, locale="de", max_units=1) == result
+
+    def test_memo_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        rendered: list[int] = []
+        original = DeltaFormatter.format_microseconds
+
+        def counting(formatter: DeltaFormatter, total: int) -> str:
+            rendered.append(total)
+            return original(formatter, total)
+
+        monkeypatch.setattr(DeltaFormatter, "format_microseconds", counting)
+        monkeypatch.setattr(readabledelta, "MEMO_SIZE", 2)
+        result = humanize_parallel(MICROSECONDS, workers=1)
+
+        assert result == [from_microseconds(v) for v in MICROSECONDS]
+        # six distinct values cycling through a memo of two are rendered again.
+        assert len(rendered) > len(set(MICROSECONDS))
+        rendered.clear()
+        assert humanize_threaded(MICROSECONDS) == result
+        assert len(rendered) > len(set(MICROSECONDS))
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            MICROSECONDS,
+            array("q", MICROSECONDS),
+            memoryview(array("q", MICROSECONDS)),
+            array("q", MICROSECONDS).tobytes(),
+        ],
+    )
+    def test_inputs(self, values: list[int]) -> None:
+        expected = [from_microseconds(v, showzero=True) for v in MICROSECONDS]
+
+        assert (
+            humanize_parallel(
+                values, showzero=True, workers=2, chunksize=8, mp_context=CONTEXT
+            )
+            == expected
+        )
+
+    def test_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        values = np.array(MICROSECONDS, dtype=np.int64)
+
+        assert humanize_parallel(
+            values, workers=2, chunksize=8, mp_context=CONTEXT
+        ) == [from_microseconds(v) for v in MICROSECONDS]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(TypeError, match="expected a buffer of int64 or bytes"):
+            humanize_parallel(array("d", [1.0]))  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="multiple of 8 bytes, not 12"):
+            humanize_parallel(bytes(12))
+        with pytest.raises(OverflowError, match="must fit in int64"):
+            humanize_parallel([timedelta.max])
+        with pytest.raises(ValueError, match="chunksize must be at least 1, not 0"):
+            humanize_parallel(DELTAS, chunksize=0)
+
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            humanize_parallel(DELTAS, units=("months",))
+
+
+class TestHumanizeThreaded:
+    @pytest.fixture
+    def pools(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        """max_workers of every thread pool started."""
+        started: list[int] = []
+
+        class Pool(ThreadPoolExecutor):
+            def __init__(self, max_workers: int) -> None:
+                started.append(max_workers)
+                super().__init__(max_workers)
+
+        monkeypatch.setattr(parallel, "ThreadPoolExecutor", Pool)
+        return started
+
+    def test_in_thread(self, pools: list[int]) -> None:
+        assert humanize_threaded(DELTAS) == [from_timedelta(d) for d in DELTAS]
+        assert humanize_threaded(DELTAS, max_workers=1, chunksize=1) == [
+            from_timedelta(d) for d in DELTAS
+        ]
+        assert pools == []
+
+    def test_threads(self, pools: list[int]) -> None:
+        result = humanize_threaded(
+            DELTAS,
+            Style.ABBREV,
+            (TDUnit.HOURS,),
+            locale="de",
+            max_units=1,
+            max_workers=3,
+            chunksize=4,
+        )
+
+        assert result == [
+            from_timedelta(d, Style.ABBREV, (TDUnit.HOURS,), locale="de", max_units=1)
+            for d in DELTAS
+        ]
+        assert pools == [3]
+
+    @pytest.mark.parametrize("gil", [True, False])
+    def test_default_workers(
+        self, monkeypatch: pytest.MonkeyPatch, pools: list[int], gil: bool
+    ) -> None:
+        monkeypatch.setattr(parallel, "_gil_enabled", lambda: gil)
+        monkeypatch.setattr(parallel.os, "cpu_count", lambda: 4)
+
+        assert humanize_threaded(DELTAS, chunksize=8) == [
+            from_timedelta(d) for d in DELTAS
+        ]
+        assert pools == ([] if gil else [4])
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            MICROSECONDS,
+            iter(MICROSECONDS),
+            array("q", MICROSECONDS),
+            array("q", MICROSECONDS).tobytes(),
+        ],
+    )
+    def test_inputs(self, values: list[int]) -> None:
+        expected = [from_microseconds(v, showzero=True) for v in MICROSECONDS]
+
+        assert (
+            humanize_threaded(values, showzero=True, max_workers=2, chunksize=8)
+            == expected
+        )
+
+    def test_invalid(self) -> None:
+        with pytest.raises(TypeError, match="expected a buffer of int64 or bytes"):
+            humanize_threaded(array("d", [1.0]))  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="chunksize must be at least 1, not 0"):
+            humanize_threaded(DELTAS, chunksize=0)
+        with pytest.raises(ValueError, match="max_units must be at least 1, not 0"):
+            humanize_threaded(DELTAS, max_units=0)
+
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            humanize_threaded(DELTAS, units=("months",))
+
+
+def test_thread_safety() -> None:
+    """Public functions give the same results when called from many threads."""
+    cache = DeltaCache(maxsize=8)
+    start = datetime(2024, 1, 31, 9)
+    styles = list(Style)
+    calls: list[Callable[[int], Any]] = [
+        lambda i: from_timedelta(DELTAS[i % len(DELTAS)], styles[i % 3]),
+        lambda i: from_microseconds(i * 10**9, locale=("de", "fr", "ru")[i % 3]),
+        lambda i: from_datetimes(start, start + timedelta(hours=i * 7)),
+        lambda i: from_template(timedelta(seconds=i), "[{h}:]{m:02}:{s:02}"),
+        lambda i: to_timedelta(from_timedelta(timedelta(minutes=i))),
+        lambda i: cache.from_timedelta(timedelta(seconds=i % 16)),
+    ]
+    expected = [[call(i) for i in range(200)] for call in calls]
+    threads = 8
+    barrier = threading.Barrier(threads)
+    results: list[list[list[Any]]] = []
+
+    def work() -> None:
+        barrier.wait()
+        results.append([[call(i) for i in range(200)] for call in calls])
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert results == [expected] * threads
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import itertools
+import re
+from datetime import timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import (
+    DeltaParser,
+    RDUnit,
+    Style,
+    TDUnit,
+    from_relativedelta,
+    from_timedelta,
+    locales,
+    to_relativedelta,
+    to_relativedelta_many,
+    to_timedelta,
+    to_timedelta_many,
+)
+from readabledelta2.locales import LocaleDefinition, available_locales, register_locale
+from readabledelta2.readabledelta import TIME_UNITS
+
+TD_DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(milliseconds=1, microseconds=1),
+    timedelta(seconds=90, microseconds=500),
+    timedelta(days=6, hours=23, minutes=59, seconds=59, microseconds=999999),
+    timedelta(days=371, hours=1, minutes=1),
+    timedelta(days=3660, hours=5, minutes=6, seconds=7, microseconds=8),
+    timedelta.max,
+    timedelta.min,
+]
+TD_UNITS = [
+    None,
+    (TDUnit.HOURS,),
+    (TDUnit.YEARS, TDUnit.DAYS),
+    (TDUnit.WEEKS, TDUnit.MINUTES, TDUnit.MILLISECONDS),
+]
+RD_DELTAS = [
+    relativedelta(),
+    relativedelta(microseconds=1),
+    relativedelta(years=1, months=2, days=17, hours=3, minutes=4, seconds=5),
+    relativedelta(months=25, days=3),
+    relativedelta(years=-2, days=-40, seconds=-1),
+]
+RD_UNITS = [
+    None,
+    (RDUnit.YEARS, RDUnit.MONTHS, RDUnit.DAYS),
+    (RDUnit.MONTHS, RDUnit.WEEKS, RDUnit.SECONDS),
+]
+
+
+class TestToTimedelta:
+    @pytest.mark.parametrize("style", list(Style))
+    @pytest.mark.parametrize("showzero", [True, False])
+    @pytest.mark.parametrize("locale", available_locales())
+    def test_round_trip(self, style: Style, showzero: bool, locale: str) -> None:
+        for delta, units in itertools.product(TD_DELTAS, TD_UNITS):
+            # timedelta.max and min cannot be negated
+            extreme = delta in (timedelta.max, timedelta.min)
+            for signed in (delta,) if extreme else (delta, -delta):
+                text = from_timedelta(
+                    signed, style, units, showzero=showzero, locale=locale
+                )
+                assert to_timedelta(text, locale) == signed, text
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("1 year, 6 days, 1 hour and 1 minute", timedelta(days=371, minutes=61)),
+            ("3h 5m 2s", timedelta(hours=3, minutes=5, seconds=2)),
+            ("3h5m2s", timedelta(hours=3, minutes=5, seconds=2)),
+            ("1 wk, 1 day", timedelta(days=8)),
+            ("  2 hrs and 1 hr  ", timedelta(hours=3)),
+            ("+5 secs", timedelta(seconds=5)),
+            ("-1 h 30 m", -timedelta(minutes=90)),
+            ("250 ms, 3 µs", timedelta(milliseconds=250, microseconds=3)),
+        ],
+    )
+    def test_loose_input(self, text: str, expected: timedelta) -> None:
+        assert to_timedelta(text) == expected
+
+    @pytest.mark.parametrize(
+        ("text", "unexpected"),
+        [
+            ("", None),
+            ("and", None),
+            ("5", "'5'"),
+            ("5 fortnights", "'5'"),
+            ("1 hour and half", "'half'"),
+            ("1 minutesx", "'1'"),
+            ("1 Hour", "'1'"),
+        ],
+    )
+    def test_invalid(self, text: str, unexpected: str | None) -> None:
+        msg = f"cannot parse {text!r} as a duration"
+        if unexpected:
+            msg += f", unexpected {unexpected}"
+        with pytest.raises(ValueError, match=f"^{re.escape(msg)}$"):
+            to_timedelta(text)
+
+    def test_months(self) -> None:
+        with pytest.raises(ValueError, match="months have no fixed length"):
+            to_timedelta("1 month and 2 days")
+        # M is months, m is minutes
+        with pytest.raises(ValueError, match="months have no fixed length"):
+            to_timedelta("1M")
+        assert to_timedelta("1m") == timedelta(minutes=1)
+
+    def test_overflow(self) -> None:
+        with pytest.raises(OverflowError):
+            to_timedelta("3000000 years")
+        assert DeltaParser().to_microseconds("3000000 years") == (
+            3000000 * 365 * 86400 * 1000000
+        )
+
+
+class TestToRelativedelta:
+    @pytest.mark.parametrize("style", list(Style))
+    @pytest.mark.parametrize("showzero", [True, False])
+    @pytest.mark.parametrize("locale", available_locales())
+    def test_round_trip(self, style: Style, showzero: bool, locale: str) -> None:
+        for delta, units in itertools.product(RD_DELTAS, RD_UNITS):
+            for signed in (delta, -delta):
+                text = from_relativedelta(
+                    signed, style, units, showzero=showzero, locale=locale
+                )
+                assert to_relativedelta(text, locale) == signed, text
+
+    def test_fields(self) -> None:
+        assert to_relativedelta("1Y 2M 3D") == relativedelta(years=1, months=2, days=3)
+        assert to_relativedelta("2 weeks and 5 msecs") == relativedelta(
+            days=14, microseconds=5000
+        )
+        assert to_relativedelta("-14 months") == relativedelta(years=-1, months=-2)
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="unexpected 'months'"):
+            to_relativedelta("1 year, months")
+
+
+class TestMany:
+    def test_timedeltas(self) -> None:
+        texts = [from_timedelta(delta) for delta in TD_DELTAS] * 2
+
+        assert to_timedelta_many(texts) == TD_DELTAS * 2
+        assert to_timedelta_many(iter(["1 Tag", "2 Tage"]), "de") == [
+            timedelta(days=1),
+            timedelta(days=2),
+        ]
+        assert to_timedelta_many([]) == []
+
+    def test_relativedeltas(self) -> None:
+        texts = [from_relativedelta(delta) for delta in RD_DELTAS]
+
+        assert to_relativedelta_many(texts) == RD_DELTAS
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError, match="cannot parse 'nope'"):
+            to_timedelta_many(["1 hour", "nope"])
+
+
+class TestLocales:
+    def test_ambiguous_labels(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(locales, "_loaders", dict(locales._loaders))
+        monkeypatch.setattr(locales, "_compiled", dict(locales._compiled))
+        labels = {
+            unit: {style.value: {"other": "x"} for style in styles}
+            for unit, styles in TIME_UNITS.items()
+        }
+        register_locale("x", LocaleDefinition(labels, lambda _: "other"))
+
+        with pytest.raises(ValueError, match="locale 'x' uses 'x' for both"):
+            DeltaParser("x")
+
+    def test_separators(self) -> None:
+        assert to_timedelta("1 Stunde und 2 Minuten", "de") == timedelta(minutes=62)
+        assert to_timedelta("1 j, 2 h et 1 s", "fr") == timedelta(
+            days=1, hours=2, seconds=1
+        )
+        with pytest.raises(ValueError, match="unexpected 'and'"):
+            to_timedelta("1 Stunde and 2 Minuten", "de")
+
+    def test_unknown(self) -> None:
+        with pytest.raises(ValueError, match="locale can only be one of the following"):
+            to_timedelta("1 hour", "xx")
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import re
-from datetime import timedelta
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from typing import ClassVar
 
 import pytest
 from dateutil.relativedelta import relativedelta
 
-from readabledelta2 import Style, from_relativedelta, from_timedelta
+from readabledelta2 import (
+    DeltaFormatter,
+    DeltaParts,
+    Style,
+    from_datetimes,
+    from_microseconds,
+    from_relativedelta,
+    from_seconds,
+    from_timedelta,
+)
 from readabledelta2.readabledelta import (
     DAYS,
     HOURS,
@@ -21,8 +30,13 @@ from readabledelta2.readabledelta import (
     YEARS,
     RDUnit,
     TDUnit,
+    UnitSet,
+    _formatter,
+    _timedelta_unitset,
     extract_units,
     find_smallest_unit,
+    is_negative_relativedelta,
+    relativedelta_sign,
     sort_units,
     split_relativedelta_units,
     split_timedelta_units,
@@ -167,11 +181,11 @@ class TestSplitUnitsTimedelta:
     def test_invalid_units(self) -> None:
         msg = "Unknown units"
         with pytest.raises(ValueError, match=re.escape(msg)):
-            split_timedelta_units(timedelta(0), units=["bogus"])  # type: ignore[arg-type]
+            split_timedelta_units(timedelta(0), units=["bogus"])  # type: ignore[call-overload]
 
         msg = f"units can only be the following: {tuple(TDUnit)}"
         with pytest.raises(ValueError, match=re.escape(msg)):
-            split_timedelta_units(timedelta(0), units=["months"])  # type: ignore[arg-type]
+            split_timedelta_units(timedelta(0), units=["months"])  # type: ignore[call-overload]
 
 
 class TestSplitUnitsRelativedelta:
@@ -370,11 +384,75 @@ class TestSplitUnitsRelativedelta:
     def test_invalid_units(self) -> None:
         msg = "Unknown units"
         with pytest.raises(ValueError, match=msg):
-            split_relativedelta_units(relativedelta(days=0), units=["bogus"])  # type: ignore[arg-type]
+            split_relativedelta_units(relativedelta(days=0), units=["bogus"])  # type: ignore[call-overload]
 
         msg = f"units can only be the following: {tuple(RDUnit)}"
         with pytest.raises(ValueError, match=re.escape(msg)):
-            split_relativedelta_units(relativedelta(days=0), units=["milliseconds"])  # type: ignore[arg-type]
+            split_relativedelta_units(relativedelta(days=0), units=["milliseconds"])  # type: ignore[call-overload]
+
+
+class TestDeltaParts:
+    td_deltas: ClassVar = [
+        timedelta(0),
+        timedelta(weeks=53, hours=1, minutes=1, microseconds=1500),
+        -timedelta(days=9, seconds=5),
+    ]
+    rd_deltas: ClassVar = [
+        relativedelta(),
+        relativedelta(years=1, months=2, days=9, hours=3, microseconds=5),
+        relativedelta(months=-1, days=2),
+        relativedelta(hours=-1, minutes=30),
+    ]
+
+    def test_timedelta(self) -> None:
+        parts = split_timedelta_units(-timedelta(days=8, minutes=1), as_parts=True)
+
+        assert parts == DeltaParts(-1, weeks=1, days=1, minutes=1)
+        assert parts.sign == parts[0] == -1
+        assert parts.days == parts[4] == 1
+        assert parts.months == parts.milliseconds == 0
+
+    @pytest.mark.parametrize("units", [tuple(TDUnit), (DAYS, MINUTES), (YEARS,)])
+    def test_timedelta_to_dict(self, units: tuple[str, ...]) -> None:
+        for delta in self.td_deltas:
+            parts = split_timedelta_units(delta, units, as_parts=True)
+            assert parts.to_dict() == split_timedelta_units(delta, units)
+            assert parts.sign == (delta > timedelta(0)) - (delta < timedelta(0))
+
+    def test_relativedelta(self) -> None:
+        delta = relativedelta(years=-1, months=-2, hours=-3)
+        parts = split_relativedelta_units(delta, (MONTHS, HOURS), as_parts=True)
+
+        assert parts == DeltaParts(-1, months=14, hours=3)
+
+    @pytest.mark.parametrize("units", [tuple(RDUnit), (MONTHS, HOURS), (YEARS,)])
+    def test_relativedelta_to_dict(self, units: tuple[str, ...]) -> None:
+        for delta in self.rd_deltas:
+            parts = split_relativedelta_units(delta, units, as_parts=True)
+            assert parts.to_dict() == split_relativedelta_units(delta, units)
+            assert parts.to_dict(RDUnit) == split_relativedelta_units(delta, units)
+            assert parts.sign == relativedelta_sign(delta)
+
+    def test_relativedelta_kind_kept(self) -> None:
+        delta = relativedelta(years=1, months=2)
+        parts = split_relativedelta_units(delta, as_parts=True)._replace(days=3)
+
+        assert isinstance(parts, DeltaParts)
+        assert list(parts.to_dict()) == list(RDUnit)
+        assert parts.to_dict()[RDUnit.DAYS] == 3
+        assert list(DeltaParts(*parts).to_dict()) == list(TDUnit)
+
+    def test_to_dict_units(self) -> None:
+        parts = DeltaParts(1, hours=2, minutes=3)
+
+        assert parts.to_dict((HOURS, MINUTES)) == {HOURS: 2, MINUTES: 3}
+
+    def test_immutable(self) -> None:
+        parts = DeltaParts(1, days=2)
+
+        assert not hasattr(parts, "__dict__")
+        with pytest.raises(AttributeError):
+            parts.days = 3  # type: ignore[misc]
 
 
 class TestTimedelta:
@@ -1090,6 +1168,25 @@ class TestRelativedelta:
         ]
         self._rd_units(cases, delta, True)
 
+    @pytest.mark.parametrize(
+        ("delta", "expected"),
+        [
+            (relativedelta(days=1.5), "1.5 days"),  # type: ignore[arg-type]
+            (relativedelta(hours=1.0), "1.0 hour"),  # type: ignore[arg-type]
+            (-relativedelta(days=1.5), "-1.5 days"),  # type: ignore[arg-type]
+            (relativedelta(days=2, hours=1.5), "2 days and 1.5 hours"),  # type: ignore[arg-type]
+            (relativedelta(seconds=0.5), "0.5 seconds"),  # type: ignore[arg-type]
+        ],
+    )
+    def test_float_fields(self, delta: relativedelta, expected: str) -> None:
+        assert from_relativedelta(delta) == expected
+
+    def test_float_fields_locale(self) -> None:
+        delta = relativedelta(days=1.5)  # type: ignore[arg-type]
+
+        assert from_relativedelta(delta, locale="de") == "1.5 Tage"
+        assert from_relativedelta(delta, locale="fr") == "1.5 jours"
+
     def test_relativedelta_invalid_units(self) -> None:
         msg = f"units can only be the following: {tuple(RDUnit)}"
         with pytest.raises(ValueError, match=re.escape(msg)):
@@ -1263,3 +1360,454 @@ def test_sort_units_invalid() -> None:
 
     with pytest.raises(ValueError, match="Unknown units"):
         sort_units((FAKEUnit.YEARS, FAKEUnit.WEEKS, FAKEUnit.FOO))
+
+
+class TestDeltaFormatter:
+    td_units: ClassVar = [
+        None,
+        (TDUnit.HOURS,),
+        (TDUnit.DAYS, TDUnit.HOURS),
+        (TDUnit.YEARS, TDUnit.DAYS),
+        (TDUnit.WEEKS, TDUnit.MINUTES),
+        ("days", "seconds"),
+        (TDUnit.MILLISECONDS,),
+        tuple(TDUnit),
+    ]
+    rd_units: ClassVar = [
+        None,
+        (RDUnit.YEARS,),
+        (RDUnit.HOURS,),
+        (RDUnit.MONTHS, RDUnit.DAYS),
+        (RDUnit.WEEKS, RDUnit.MINUTES),
+        ("days", "seconds"),
+        tuple(RDUnit),
+    ]
+
+    @pytest.mark.parametrize("style", list(Style))
+    @pytest.mark.parametrize("include_sign", [True, False])
+    @pytest.mark.parametrize("showzero", [True, False])
+    def test_matches_from_timedelta(
+        self, style: Style, include_sign: bool, showzero: bool
+    ) -> None:
+        deltas = [d for _, d in TestTimedelta.cases] + [timedelta(0)]
+        for units in self.td_units:
+            fmt = DeltaFormatter(
+                style, units, include_sign=include_sign, showzero=showzero
+            )
+            for delta in deltas:
+                for d in (delta, -delta):
+                    assert fmt.format(d) == from_timedelta(
+                        d, style, units, include_sign=include_sign, showzero=showzero
+                    )
+
+    @pytest.mark.parametrize("style", list(Style))
+    @pytest.mark.parametrize("include_sign", [True, False])
+    @pytest.mark.parametrize("showzero", [True, False])
+    def test_matches_from_relativedelta(
+        self, style: Style, include_sign: bool, showzero: bool
+    ) -> None:
+        deltas = [d for _, d in TestRelativedelta.rd_cases] + [
+            relativedelta(),
+            relativedelta(years=1, months=2, weeks=53, hours=1, minutes=1),
+        ]
+        for units in self.rd_units:
+            fmt = DeltaFormatter(
+                style, units, include_sign=include_sign, showzero=showzero
+            )
+            for delta in deltas:
+                for d in (delta, -delta):
+                    assert fmt.format(d) == from_relativedelta(
+                        d, style, units, include_sign=include_sign, showzero=showzero
+                    )
+
+    def test_invalid_style(self) -> None:
+        with pytest.raises(ValueError, match="Invalid argument foobar"):
+            DeltaFormatter(style="foobar")  # type: ignore[arg-type]
+
+    def test_read_only(self) -> None:
+        anchor = datetime(2024, 1, 1)
+        fmt = DeltaFormatter(
+            Style.SHORT,
+            ("days",),
+            include_sign=False,
+            showzero=True,
+            anchor=anchor,
+            locale="de",
+            max_units=1,
+        )
+        assert (
+            fmt.style,
+            fmt.units,
+            fmt.include_sign,
+            fmt.showzero,
+            fmt.anchor,
+            fmt.locale,
+            fmt.max_units,
+        ) == (Style.SHORT, ("days",), False, True, anchor, "de", 1)
+
+        shared = _formatter(Style.NORMAL, _timedelta_unitset(None), True, False)
+        for name in ("style", "units", "showzero", "locale", "max_units"):
+            with pytest.raises(AttributeError):
+                setattr(shared, name, None)
+        assert from_timedelta(timedelta(hours=1)) == "1 hour"
+
+    def test_unknown_units(self) -> None:
+        with pytest.raises(ValueError, match="Unknown units"):
+            DeltaFormatter(units=("bogus",))
+
+    def test_units_for_other_delta_type(self) -> None:
+        fmt = DeltaFormatter(units=(TDUnit.MILLISECONDS,))
+        msg = f"units can only be the following: {tuple(RDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            fmt.format(relativedelta(days=1))
+
+        fmt = DeltaFormatter(units=(RDUnit.MONTHS,))
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            fmt.format(timedelta(days=1))
+
+    def test_format_timedelta_using_relativedelta(self) -> None:
+        msg = "'<' not supported between instances of 'relativedelta' and 'datetime.timedelta'"
+        with pytest.raises(TypeError, match=msg):
+            DeltaFormatter().format_timedelta(relativedelta(hours=0))  # type: ignore[arg-type]
+
+
+class TestFromNumbers:
+    deltas: ClassVar = [d for _, d in TestTimedelta.cases] + [timedelta(0)]
+
+    @pytest.mark.parametrize("style", list(Style))
+    def test_from_microseconds(self, style: Style) -> None:
+        for delta in self.deltas:
+            for d in (delta, -delta):
+                total = d // timedelta(microseconds=1)
+                assert from_microseconds(total, style) == from_timedelta(d, style)
+                assert from_microseconds(
+                    total, style, (TDUnit.HOURS,), include_sign=False, showzero=True
+                ) == from_timedelta(
+                    d, style, (TDUnit.HOURS,), include_sign=False, showzero=True
+                )
+
+    @pytest.mark.parametrize("style", list(Style))
+    def test_from_seconds(self, style: Style) -> None:
+        for delta in self.deltas:
+            for d in (delta, -delta):
+                assert from_seconds(d.total_seconds(), style) == from_timedelta(
+                    d, style
+                )
+
+    def test_from_seconds_rounding(self) -> None:
+        for seconds in (0.1, 1.0000005, 2.5e-7, -3.4999996, 12345.678901):
+            assert from_seconds(seconds) == from_timedelta(timedelta(seconds=seconds))
+        assert from_seconds(90) == "1 minute and 30 seconds"
+
+    def test_beyond_timedelta_max(self) -> None:
+        total = (timedelta.max // timedelta(microseconds=1)) * 10
+        assert from_microseconds(total, units=(TDUnit.YEARS,)) == (
+            "27397260 years, 14 weeks, 1 day, 23 hours, 59 minutes, 59 seconds, "
+            "999 milliseconds and 990 microseconds"
+        )
+        assert from_seconds(-1e16, Style.ABBREV, (TDUnit.DAYS,)) == (
+            "-115740740740 D, 17 h, 46 m and 40 s"
+        )
+
+    def test_invalid(self) -> None:
+        with pytest.raises(TypeError):
+            from_microseconds(1.5)  # type: ignore[arg-type]
+
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            from_seconds(1, units=("months",))
+
+
+class TestRelativedeltaSign:
+    anchors: ClassVar = [
+        None,
+        datetime(1970, 2, 1, tzinfo=timezone.utc),
+        datetime(2000, 1, 31),
+        datetime(2024, 2, 29, 12, 30),
+        datetime(2023, 12, 31, 23, 59, 59, 999999),
+    ]
+
+    @pytest.mark.parametrize(
+        ("delta", "sign"),
+        [
+            (relativedelta(), 0),
+            (relativedelta(microseconds=1), 1),
+            (relativedelta(days=-1, hours=23), -1),
+            (relativedelta(years=-1, months=-2, days=-3), -1),
+            (relativedelta(months=1, days=-24), 1),
+            (relativedelta(years=1, days=-333), 1),
+            (relativedelta(months=-1, days=35), 1),
+            (relativedelta(years=-2, hours=1, minutes=-1), -1),
+        ],
+    )
+    def test_closed_form(self, delta: relativedelta, sign: int) -> None:
+        for anchor in self.anchors:
+            assert relativedelta_sign(delta, anchor) == sign
+            assert is_negative_relativedelta(delta, anchor) is (sign < 0)
+
+    def test_calendar_dependent(self) -> None:
+        delta = relativedelta(months=1, days=-30)
+        feb = datetime(1970, 2, 1, tzinfo=timezone.utc)
+
+        assert relativedelta_sign(delta) == 1
+        assert relativedelta_sign(delta, feb) == -1
+        assert relativedelta_sign(relativedelta(months=1, days=-28), feb) == 0
+        assert from_relativedelta(delta) == "1 month, 4 weeks and 2 days"
+        assert from_relativedelta(delta, anchor=feb) == "-1 month, 4 weeks and 2 days"
+        assert DeltaFormatter(anchor=feb).format(delta) == (
+            "-1 month, 4 weeks and 2 days"
+        )
+
+    def test_matches_anchored_arithmetic(self) -> None:
+        deltas = [
+            relativedelta(years=y, months=m, days=d, hours=h)
+            for y in (-1, 0, 1)
+            for m in (-13, -1, 0, 2)
+            for d in (-400, -62, -29, 0, 27, 31, 59, 366)
+            for h in (-25, 0, 3)
+        ]
+        deltas += [
+            relativedelta(months=1, leapdays=-40),
+            relativedelta(months=-1, day=31),
+            relativedelta(days=-0.4),  # type: ignore[arg-type]
+            relativedelta(weekday=0),
+        ]
+        for anchor in self.anchors:
+            dt = datetime(1970, 1, 1, tzinfo=timezone.utc) if anchor is None else anchor
+            for delta in deltas:
+                expected = ((dt + delta) > dt) - ((dt + delta) < dt)
+                assert relativedelta_sign(delta, anchor) == expected
+
+
+class TestUnitSet:
+    def test_from_units(self) -> None:
+        units = UnitSet.from_units(("days", TDUnit.HOURS, RDUnit.MONTHS))
+        assert units == UnitSet.MONTHS | UnitSet.DAYS | UnitSet.HOURS
+        assert UnitSet.from_units(units) is units
+        assert UnitSet.from_units(()) == UnitSet(0)
+
+    def test_unknown_units(self) -> None:
+        with pytest.raises(ValueError, match="Unknown units"):
+            UnitSet.from_units(("days", "wibblies"))
+        with pytest.raises(ValueError, match="Unknown units"):
+            UnitSet.from_units((1,))  # type: ignore[arg-type]
+
+    def test_membership(self) -> None:
+        units = UnitSet.DAYS | UnitSet.HOURS
+        assert "days" in units
+        assert TDUnit.HOURS in units
+        assert RDUnit.MONTHS not in units
+        assert "wibblies" not in units
+        assert UnitSet.DAYS in units
+        assert len(units) == 2
+        assert hash(units) == hash(UnitSet.from_units(("hours", "days")))
+
+    def test_ordering(self) -> None:
+        units = UnitSet.MICROSECONDS | UnitSet.YEARS | UnitSet.MINUTES
+        assert list(units) == [UnitSet.YEARS, UnitSet.MINUTES, UnitSet.MICROSECONDS]
+        assert units.units == (YEARS, MINUTES, MICROSECONDS)
+        assert units.smallest == UnitSet.MICROSECONDS
+        assert units.largest == UnitSet.YEARS
+        assert units.smallest.unit == MICROSECONDS
+        assert UnitSet(0).units == ()
+
+    def test_with_smaller_units(self) -> None:
+        assert UnitSet.SECONDS.with_smaller_units() == (
+            UnitSet.SECONDS | UnitSet.MILLISECONDS | UnitSet.MICROSECONDS
+        )
+        assert (UnitSet.DAYS | UnitSet.MINUTES).with_smaller_units().units == (
+            DAYS,
+            MINUTES,
+            SECONDS,
+            MILLISECONDS,
+            MICROSECONDS,
+        )
+        assert UnitSet(0).with_smaller_units() == UnitSet(0)
+
+    def test_results_are_unitsets(self) -> None:
+        units = UnitSet.from_units(("days", "minutes"))
+        assert type(units) is UnitSet
+        assert all(type(flag) is UnitSet for flag in units)
+        assert type(units.smallest) is UnitSet
+        assert type(units.largest) is UnitSet
+        assert type(units.with_smaller_units()) is UnitSet
+        assert units.issubset(UnitSet.from_units(TDUnit))
+        assert not UnitSet.MONTHS.issubset(UnitSet.from_units(TDUnit))
+
+    def test_accepted_as_units(self) -> None:
+        delta = timedelta(weeks=53, hours=1, minutes=1)
+        td_units = UnitSet.DAYS | UnitSet.MINUTES
+        assert from_timedelta(delta, units=td_units) == "371 days and 61 minutes"
+        assert split_timedelta_units(delta, td_units) == split_timedelta_units(
+            delta, (DAYS, MINUTES)
+        )
+        assert extract_units(delta, td_units) == (TDUnit.DAYS, TDUnit.MINUTES)
+        assert sort_units(td_units) == (DAYS, MINUTES)
+        assert find_smallest_unit(td_units) == MINUTES
+        assert DeltaFormatter(units=td_units).format(delta) == (
+            "371 days and 61 minutes"
+        )
+
+        rdelta = relativedelta(years=1, days=3, hours=2)
+        rd_units = UnitSet.MONTHS | UnitSet.HOURS
+        assert from_relativedelta(rdelta, units=rd_units) == "12 months and 74 hours"
+        assert split_relativedelta_units(rdelta, rd_units) == (
+            split_relativedelta_units(rdelta, (MONTHS, HOURS))
+        )
+
+    def test_invalid_units_for_delta(self) -> None:
+        msg = f"units can only be the following: {tuple(TDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            from_timedelta(timedelta(0), units=UnitSet.MONTHS)
+
+        msg = f"units can only be the following: {tuple(RDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            split_relativedelta_units(relativedelta(), UnitSet.MILLISECONDS)
+
+
+class TestMaxUnits:
+    delta: ClassVar = timedelta(days=371, hours=23, minutes=5, microseconds=7)
+
+    @pytest.mark.parametrize(
+        ("max_units", "expected"),
+        [
+            (1, "1 year"),
+            (2, "1 year and 6 days"),
+            (3, "1 year, 6 days and 23 hours"),
+            (5, "1 year, 6 days, 23 hours, 5 minutes and 7 microseconds"),
+            (None, "1 year, 6 days, 23 hours, 5 minutes and 7 microseconds"),
+        ],
+    )
+    def test_truncates(self, max_units: int | None, expected: str) -> None:
+        assert from_timedelta(self.delta, max_units=max_units) == expected
+        assert from_timedelta(-self.delta, max_units=max_units) == f"-{expected}"
+
+    def test_other_entry_points(self) -> None:
+        total = self.delta // timedelta(microseconds=1)
+        assert from_microseconds(total, Style.ABBREV, max_units=2) == "1 Y and 6 D"
+        assert from_seconds(5401, max_units=1) == "1 hour"
+        formatter = DeltaFormatter(max_units=2)
+        assert formatter.format(self.delta) == "1 year and 6 days"
+        assert formatter.format(relativedelta(years=1, months=2, days=3)) == (
+            "1 year and 2 months"
+        )
+
+    def test_skips_zero_units(self) -> None:
+        delta = timedelta(days=365, seconds=1, microseconds=999999)
+        assert from_timedelta(delta, max_units=2) == "1 year and 1 second"
+        assert (
+            from_timedelta(
+                delta, units=(TDUnit.YEARS, TDUnit.DAYS, TDUnit.SECONDS), max_units=2
+            )
+            == "1 year and 1 second"
+        )
+        assert (
+            from_timedelta(
+                delta,
+                units=(TDUnit.YEARS, TDUnit.DAYS, TDUnit.SECONDS),
+                showzero=True,
+                max_units=2,
+            )
+            == "1 year, 0 days and 1 second"
+        )
+
+    def test_relativedelta(self) -> None:
+        delta = relativedelta(years=2, months=1, days=20, hours=5)
+        assert from_relativedelta(delta, max_units=2) == "2 years and 1 month"
+        assert from_relativedelta(-delta, Style.SHORT, max_units=3) == (
+            "-2 yrs, 1 mnth and 2 wks"
+        )
+        assert from_relativedelta(relativedelta(), max_units=1) == "0 seconds"
+
+    def test_zero(self) -> None:
+        assert from_timedelta(timedelta(0), max_units=1) == "0 seconds"
+        assert (
+            from_timedelta(
+                timedelta(0),
+                units=(TDUnit.HOURS, TDUnit.MINUTES),
+                showzero=True,
+                max_units=1,
+            )
+            == "0 hours and 0 minutes"
+        )
+
+    @pytest.mark.parametrize("max_units", [0, -1])
+    def test_invalid(self, max_units: int) -> None:
+        with pytest.raises(ValueError, match="max_units must be at least 1"):
+            from_timedelta(timedelta(0), max_units=max_units)
+        with pytest.raises(ValueError, match="max_units must be at least 1"):
+            DeltaFormatter(max_units=max_units)
+
+
+class TestFromDatetimes:
+    pairs: ClassVar = [
+        (datetime(2024, 1, 31), datetime(2024, 2, 29)),
+        (datetime(2024, 1, 31), datetime(2024, 3, 1)),
+        (datetime(2023, 3, 31, 12), datetime(2024, 2, 29, 11, 59)),
+        (datetime(2020, 2, 29), datetime(2021, 2, 28)),
+        (datetime(2021, 5, 3, 8, 30, 0, 500), datetime(2021, 5, 3, 8, 29, 59)),
+        (datetime(1999, 12, 31, 23, 59, 59), datetime(2000, 1, 1)),
+        (date(2024, 1, 31), date(2025, 1, 30)),
+        (date(2024, 1, 1), datetime(2024, 1, 1, 6)),
+        (datetime(2024, 1, 1, 6), date(2024, 1, 1)),
+        (
+            datetime(2024, 3, 31, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=5))),
+        ),
+        (datetime(1, 1, 1), datetime(9999, 12, 31, 23, 59, 59, 999999)),
+        (date(2024, 5, 5), date(2024, 5, 5)),
+    ]
+
+    @pytest.mark.parametrize("style", list(Style))
+    @pytest.mark.parametrize("showzero", [True, False])
+    @pytest.mark.parametrize(
+        "units",
+        [
+            None,
+            (RDUnit.YEARS, RDUnit.DAYS),
+            (RDUnit.MONTHS, RDUnit.WEEKS, RDUnit.SECONDS),
+            (RDUnit.HOURS, RDUnit.MICROSECONDS),
+        ],
+    )
+    def test_matches_relativedelta(
+        self, style: Style, showzero: bool, units: tuple[RDUnit, ...] | None
+    ) -> None:
+        for start, end in self.pairs:
+            for a, b in ((start, end), (end, start)):
+                expected = from_relativedelta(
+                    relativedelta(b, a), style, units, showzero=showzero
+                )
+                assert from_datetimes(a, b, style, units, showzero=showzero) == (
+                    expected
+                )
+
+    def test_output(self) -> None:
+        start = datetime(2024, 1, 31, 9)
+        assert from_datetimes(start, datetime(2024, 2, 29, 9)) == "1 month"
+        assert from_datetimes(start, datetime(2024, 3, 1, 10)) == (
+            "1 month, 1 day and 1 hour"
+        )
+        assert from_datetimes(datetime(2025, 3, 1), start) == (
+            "-1 year, 1 month and 15 hours"
+        )
+        assert from_datetimes(start, start, Style.ABBREV) == "0 s"
+        assert (
+            from_datetimes(
+                date(2020, 2, 29), date(2023, 3, 1), include_sign=False, max_units=1
+            )
+            == "3 years"
+        )
+
+    def test_formatter(self) -> None:
+        formatter = DeltaFormatter(Style.SHORT, (RDUnit.MONTHS, RDUnit.DAYS))
+        assert formatter.format_datetimes(date(2024, 1, 15), date(2025, 2, 14)) == (
+            "12 mnths and 30 days"
+        )
+
+    def test_invalid(self) -> None:
+        with pytest.raises(TypeError, match="only diffs datetime/date"):
+            from_datetimes("2024-01-01", date(2024, 1, 1))  # type: ignore[arg-type]
+        msg = f"units can only be the following: {tuple(RDUnit)}"
+        with pytest.raises(ValueError, match=re.escape(msg)):
+            from_datetimes(date(2024, 1, 1), date(2024, 1, 2), units=("milliseconds",))
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+
+import pytest
+
+from readabledelta2 import DeltaTemplate, TDUnit, from_template, from_timedelta
+from readabledelta2.template import _template
+
+DELTA = timedelta(days=3, hours=4, minutes=5, seconds=6, microseconds=7008)
+
+
+class TestFromTemplate:
+    @pytest.mark.parametrize(
+        ("template", "expected"),
+        [
+            ("{h}h{m:02}m", "76h05m"),
+            ("{D} days {h}:{m:02}:{s:02}", "3 days 4:05:06"),
+            ("{days}d {hours:>3}h", "3d   4h"),
+            ("{s}.{ms:03}{us:03}", "273906.007008"),
+            ("{s}.{µs:06}", "273906.007008"),
+            ("{W} {W!n}, {D} {D!s} and {h}{h!a}", "0 weeks, 3 days and 4h"),
+            ("{{{h}}} [[{m}]]", "{76} [5]"),
+        ],
+    )
+    def test_layouts(self, template: str, expected: str) -> None:
+        assert from_template(DELTA, template) == expected
+
+    def test_units_are_truncated(self) -> None:
+        assert DeltaTemplate("{m} {h}").units == (TDUnit.HOURS, TDUnit.MINUTES)
+        assert from_template(timedelta(hours=1, seconds=59), "{h}:{m:02}") == "1:00"
+        assert from_template(timedelta(days=400), "{Y} {Y!n}") == "1 year"
+
+    def test_matches_from_timedelta_units(self) -> None:
+        units = (TDUnit.DAYS, TDUnit.HOURS, TDUnit.MINUTES)
+        template = "{D} {D!n}, {h} {h!n} and {m} {m!n}"
+        # whole minutes, so from_timedelta has nothing to spill below them.
+        for minutes in (0, 1, 61, 1441, 4565, 10**6):
+            delta = timedelta(minutes=minutes)
+            expected = from_timedelta(delta, units=units, showzero=True)
+            assert from_template(delta, template) == expected
+
+
+class TestSign:
+    def test_prefix(self) -> None:
+        assert from_template(-DELTA, "{h}h{m:02}m") == "-76h05m"
+        assert from_template(-DELTA, "{h}h{m:02}m", include_sign=False) == "76h05m"
+
+    def test_placed(self) -> None:
+        assert from_template(-DELTA, "{h}h ago{sign}") == "76h ago-"
+        assert from_template(DELTA, "({sign:>1}){h}h") == "( )76h"
+
+    def test_optional(self) -> None:
+        template = "[{sign}{D}d ]{h}h"
+        assert from_template(-DELTA, template) == "-3d 4h"
+        assert from_template(-timedelta(hours=1), template) == "-1h"
+        assert from_template(-timedelta(hours=1), template, showzero=True) == ("-0d 1h")
+        assert from_template(-timedelta(hours=1), "[{sign}]{h}h") == "-1h"
+
+    def test_truncated_to_zero(self) -> None:
+        assert from_template(-timedelta(seconds=30), "{m}m") == "0m"
+
+
+class TestOptional:
+    template = "[{D} {D!n} ]{h}:{m:02}:{s:02}"
+
+    def test_dropped_when_zero(self) -> None:
+        assert from_template(DELTA, self.template) == "3 days 4:05:06"
+        assert from_template(timedelta(seconds=62), self.template) == "0:01:02"
+        assert from_template(-timedelta(seconds=62), self.template) == "-0:01:02"
+
+    def test_showzero(self) -> None:
+        assert from_template(timedelta(seconds=62), self.template, showzero=True) == (
+            "0 days 0:01:02"
+        )
+
+    def test_all_optional(self) -> None:
+        template = "[{h}h ][{m}m ][{s}s]"
+        assert from_template(timedelta(hours=2, seconds=5), template) == "2h 5s"
+        assert from_template(timedelta(0), template) == "0s"
+
+    @pytest.mark.parametrize(
+        ("delta", "expected"),
+        [
+            (timedelta(days=1, hours=2), "1 day, 2 hours"),
+            (timedelta(days=1), "1 day"),
+            (timedelta(hours=2), "2 hours"),
+            (timedelta(0), "0 hours"),
+        ],
+    )
+    def test_separator(self, delta: timedelta, expected: str) -> None:
+        assert from_template(delta, "[{D} {D!n}, ][{h} {h!n}]") == expected
+
+    def test_separator_before_literal(self) -> None:
+        template = "[{D}d, ][{h}h] ago"
+        assert from_template(timedelta(days=1), template) == "1d ago"
+        assert from_template(timedelta(days=1, hours=1), template) == "1d, 1h ago"
+        assert from_template(timedelta(hours=2), "[{h}h | ][{m}m]") == "2h"
+
+    def test_separator_showzero(self) -> None:
+        template = "[{D} {D!n}, ][{h} {h!n}]"
+        assert from_template(timedelta(days=1), template, showzero=True) == (
+            "1 day, 0 hours"
+        )
+
+    def test_not_a_separator(self) -> None:
+        assert from_template(timedelta(days=2), "[{D} days ago]") == "2 days ago"
+        assert from_template(timedelta(hours=2), "[({h}h), ][{m}m]") == "(2h)"
+        assert from_template(timedelta(hours=2), "[{h}h and ][{m}m]") == "2h and"
+
+
+def test_locale() -> None:
+    template = "{D} {D!n} {h} {h!a}"
+    assert from_template(DELTA, template, locale="de") == "3 Tage 4 h"
+    assert DeltaTemplate(template, locale="fr").format(DELTA) == "3 jours 4 h"
+
+
+def test_format_microseconds() -> None:
+    template = DeltaTemplate("{D}d{h}h")
+    total = DELTA // timedelta(microseconds=1)
+
+    assert template.format_microseconds(total) == template.format(DELTA) == "3d4h"
+    assert template.format_microseconds(-total * 10**6) == "-3170208d9h"
+
+
+def test_compiled_once() -> None:
+    _template.cache_clear()
+    for _ in range(3):
+        from_template(DELTA, "{h}h")
+
+    assert _template.cache_info().hits == 2
+
+
+@pytest.mark.parametrize(
+    ("template", "msg"),
+    [
+        ("{M}", f"units can only be the following: {tuple(TDUnit)}"),
+        ("{months}", f"units can only be the following: {tuple(TDUnit)}"),
+        ("{x}h", "unknown field {x} in template '{x}h'"),
+        ("{}", "unknown field {} in template '{}'"),
+        ("{h!r}", "conversion can only be one of the following: ('n', 's', 'a')"),
+        ("{h:q}", "Unknown format code 'q'"),
+        ("[{h}", "unbalanced [ in template '[{h}'"),
+        ("[{h}[{m}]]", "unbalanced [ in template '[{h}[{m}]]'"),
+        ("{h}]", "unbalanced ] in template '{h}]'"),
+        ("{h", "expected '}' before end of string"),
+        ("no fields", "template 'no fields' has no units"),
+        ("{sign}", "template '{sign}' has no units"),
+    ],
+)
+def test_invalid(template: str, msg: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        DeltaTemplate(template)
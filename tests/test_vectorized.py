@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from readabledelta2 import (
+    RDUnit,
+    Style,
+    TDUnit,
+    from_datetimes,
+    from_seconds,
+    from_timedelta,
+)
+from readabledelta2.readabledelta import (
+    split_relativedelta_units,
+    split_timedelta_units,
+)
+
+np = pytest.importorskip("numpy")
+
+from readabledelta2.vectorized import (  # noqa: E402
+    from_datetime_arrays,
+    from_timedelta_array,
+    split_datetime_arrays,
+    split_timedelta_array,
+)
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(milliseconds=1, microseconds=1),
+    timedelta(seconds=80),
+    timedelta(hours=2, minutes=1, seconds=1),
+    timedelta(days=6, hours=23, minutes=59, seconds=59),
+    timedelta(weeks=53, hours=1, minutes=1),
+    timedelta(weeks=60, hours=1),
+    timedelta(days=375),
+]
+UNITS = [
+    None,
+    (TDUnit.HOURS,),
+    (TDUnit.DAYS, TDUnit.HOURS),
+    (TDUnit.YEARS, TDUnit.DAYS),
+    (TDUnit.WEEKS, TDUnit.MINUTES),
+    ("days", "seconds"),
+    (TDUnit.MILLISECONDS,),
+]
+
+
+@pytest.mark.parametrize("style", list(Style))
+@pytest.mark.parametrize("include_sign", [True, False])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_matches_from_timedelta(
+    style: Style, include_sign: bool, showzero: bool
+) -> None:
+    deltas = DELTAS + [-d for d in DELTAS]
+    arr = np.array(deltas, dtype="timedelta64[us]")
+    for units in UNITS:
+        result = from_timedelta_array(
+            arr, style, units, include_sign=include_sign, showzero=showzero
+        )
+        expected = [
+            from_timedelta(
+                d, style, units, include_sign=include_sign, showzero=showzero
+            )
+            for d in deltas
+        ]
+        assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("locale", ["en", "de"])
+@pytest.mark.parametrize("max_units", [None, 1, 2])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_locale_and_max_units(
+    locale: str, max_units: int | None, showzero: bool
+) -> None:
+    deltas = DELTAS + [-d for d in DELTAS]
+    arr = np.array(deltas, dtype="timedelta64[us]")
+    for units in UNITS:
+        result = from_timedelta_array(
+            arr, units=units, showzero=showzero, locale=locale, max_units=max_units
+        )
+        expected = [
+            from_timedelta(
+                d, units=units, showzero=showzero, locale=locale, max_units=max_units
+            )
+            for d in deltas
+        ]
+        assert result.tolist() == expected
+
+
+def test_parts_match_split_timedelta_units() -> None:
+    arr = np.array(DELTAS, dtype="timedelta64[us]")
+    for units in UNITS:
+        _, parts = from_timedelta_array(arr, units=units, return_parts=True)
+        for i, delta in enumerate(DELTAS):
+            expected = split_timedelta_units(delta, units or tuple(TDUnit))
+            assert {k: int(v[i]) for k, v in parts.items()} == expected
+
+
+def test_split_timedelta_array() -> None:
+    arr = np.array([timedelta(weeks=53, hours=1, minutes=1)], dtype="timedelta64[us]")
+    parts = split_timedelta_array(arr, (TDUnit.DAYS, TDUnit.MINUTES))
+    assert parts[TDUnit.DAYS].tolist() == [371]
+    assert parts[TDUnit.MINUTES].tolist() == [61]
+    assert parts[TDUnit.HOURS].tolist() == [0]
+
+
+def test_nat() -> None:
+    arr = np.array([1500, "NaT", -3600 * 10**9], dtype="timedelta64[ns]")
+    assert from_timedelta_array(arr).tolist() == ["1 microsecond", None, "-1 hour"]
+
+
+def test_keeps_shape() -> None:
+    arr = np.array([[1, 2], [3, 60]], dtype="timedelta64[s]")
+    assert from_timedelta_array(arr, Style.ABBREV).tolist() == [
+        ["1 s", "2 s"],
+        ["3 s", "1 m"],
+    ]
+    assert from_timedelta_array(np.array([], dtype="timedelta64[s]")).shape == (0,)
+
+
+def test_invalid_input() -> None:
+    with pytest.raises(TypeError, match="expected an array of timedelta64"):
+        from_timedelta_array(np.array([1, 2]))
+
+    msg = f"units can only be the following: {tuple(TDUnit)}"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        from_timedelta_array(np.array([1], dtype="timedelta64[s]"), units=("months",))
+
+
+@pytest.mark.parametrize("dtype", ["timedelta64[s]", "timedelta64[W]"])
+def test_out_of_range(dtype: str) -> None:
+    # 10**15 seconds or weeks don't fit in int64 microseconds, numpy would wrap.
+    values = np.array([1, 10**15, "NaT"], dtype=dtype)
+    with pytest.raises(OverflowError, match=rf"{re.escape(dtype)} values must fit"):
+        from_timedelta_array(values)
+    with pytest.raises(OverflowError, match="must fit in int64 microseconds"):
+        split_timedelta_array(-values)
+
+    limit = np.array([2**63 // 10**6 - 1, "NaT"], dtype="timedelta64[s]")
+    assert from_timedelta_array(limit)[0] == from_seconds(2**63 // 10**6 - 1)
+
+
+STARTS = [
+    datetime(2024, 1, 31, 9),
+    datetime(2024, 1, 31, 9),
+    datetime(2023, 3, 31, 12),
+    datetime(2020, 2, 29),
+    datetime(2021, 5, 3, 8, 30, 0, 500),
+    datetime(1969, 12, 31, 23, 59, 59),
+    datetime(1, 1, 1),
+    datetime(2024, 5, 5),
+]
+ENDS = [
+    datetime(2024, 2, 29, 9),
+    datetime(2024, 3, 1, 10),
+    datetime(2024, 2, 29, 11, 59),
+    datetime(2021, 2, 28),
+    datetime(2021, 5, 3, 8, 29, 59),
+    datetime(1970, 1, 1),
+    datetime(9999, 12, 31, 23, 59, 59, 999999),
+    datetime(2024, 5, 5),
+]
+RD_UNITS = [
+    None,
+    (RDUnit.YEARS, RDUnit.DAYS),
+    (RDUnit.MONTHS, RDUnit.WEEKS, RDUnit.SECONDS),
+    (RDUnit.HOURS, RDUnit.MICROSECONDS),
+]
+
+
+@pytest.mark.parametrize("style", list(Style))
+@pytest.mark.parametrize("include_sign", [True, False])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_matches_from_datetimes(
+    style: Style, include_sign: bool, showzero: bool
+) -> None:
+    starts = STARTS + ENDS
+    ends = ENDS + STARTS
+    start = np.array(starts, dtype="datetime64[us]")
+    end = np.array(ends, dtype="datetime64[us]")
+    for units in RD_UNITS:
+        result = from_datetime_arrays(
+            start, end, style, units, include_sign=include_sign, showzero=showzero
+        )
+        expected = [
+            from_datetimes(
+                a, b, style, units, include_sign=include_sign, showzero=showzero
+            )
+            for a, b in zip(starts, ends, strict=True)
+        ]
+        assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("locale", ["en", "de"])
+@pytest.mark.parametrize("max_units", [None, 1, 2])
+@pytest.mark.parametrize("showzero", [True, False])
+def test_datetime_locale_and_max_units(
+    locale: str, max_units: int | None, showzero: bool
+) -> None:
+    starts = STARTS + ENDS
+    ends = ENDS + STARTS
+    start = np.array(starts, dtype="datetime64[us]")
+    end = np.array(ends, dtype="datetime64[us]")
+    for units in RD_UNITS:
+        result = from_datetime_arrays(
+            start,
+            end,
+            units=units,
+            showzero=showzero,
+            locale=locale,
+            max_units=max_units,
+        )
+        expected = [
+            from_datetimes(
+                a,
+                b,
+                units=units,
+                showzero=showzero,
+                locale=locale,
+                max_units=max_units,
+            )
+            for a, b in zip(starts, ends, strict=True)
+        ]
+        assert result.tolist() == expected
+
+
+def test_datetime_parts_match_split_relativedelta_units() -> None:
+    start = np.array(STARTS, dtype="datetime64[us]")
+    end = np.array(ENDS, dtype="datetime64[us]")
+    for units in RD_UNITS:
+        _, parts = from_datetime_arrays(start, end, units=units, return_parts=True)
+        for i, (a, b) in enumerate(zip(STARTS, ENDS, strict=True)):
+            expected = split_relativedelta_units(
+                relativedelta(b, a), units or tuple(RDUnit)
+            )
+            assert {k: int(v[i]) for k, v in parts.items()} == expected
+
+
+def test_split_datetime_arrays() -> None:
+    parts = split_datetime_arrays(
+        np.array(["2024-01-31"], dtype="datetime64[D]"),
+        np.array(["2025-03-01T06"], dtype="datetime64[h]"),
+        (RDUnit.MONTHS, RDUnit.HOURS),
+    )
+    assert parts[RDUnit.MONTHS].tolist() == [13]
+    assert parts[RDUnit.HOURS].tolist() == [30]
+    assert parts[RDUnit.DAYS].tolist() == [0]
+
+
+def test_datetime_nat_and_broadcast() -> None:
+    start = np.array(["2024-01-15", "NaT", "2023-06-30"], dtype="datetime64[D]")
+    end = np.datetime64("2024-03-01")
+    assert from_datetime_arrays(start, end, Style.SHORT).tolist() == [
+        "1 mnth, 2 wks and 1 day",
+        None,
+        "8 mnths and 1 day",
+    ]
+    assert from_datetime_arrays(
+        start.reshape(3, 1), np.array(["NaT", "2024-01-15"], dtype="datetime64[D]")
+    ).tolist() == [
+        [None, "0 seconds"],
+        [None, None],
+        [None, "6 months, 2 weeks and 2 days"],
+    ]
+
+
+def test_datetime_invalid_input() -> None:
+    with pytest.raises(TypeError, match="expected an array of datetime64"):
+        from_datetime_arrays(np.array([1]), np.array(["2024-01-01"], dtype="M8[D]"))
+
+    msg = f"units can only be the following: {tuple(RDUnit)}"
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        split_datetime_arrays(
+            np.array(["2024-01-01"], dtype="M8[D]"),
+            np.array(["2024-01-02"], dtype="M8[D]"),
+            ("milliseconds",),
+        )
+    with pytest.raises(OverflowError, match=r"datetime64\[D\] values must fit"):
+        from_datetime_arrays(
+            np.array([10**12], dtype="M8[D]"), np.datetime64("2024-01-01")
+        )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+from datetime import timedelta
+from typing import IO, TYPE_CHECKING, Any
+
+import pytest
+
+from readabledelta2 import (
+    Style,
+    TDUnit,
+    from_microseconds,
+    from_timedelta,
+    readabledelta,
+    writer,
+)
+from readabledelta2.writer import write_many, write_timedelta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+DELTAS = [
+    timedelta(0),
+    timedelta(microseconds=1),
+    timedelta(seconds=90, microseconds=500),
+    -timedelta(days=9, hours=3, minutes=2),
+    timedelta(days=371, hours=1, minutes=1),
+    timedelta(seconds=90, microseconds=500),
+]
+
+
+class TestWriteMany:
+    @pytest.mark.parametrize("style", list(Style))
+    def test_text(self, style: Style) -> None:
+        out = io.StringIO()
+        written = write_many(out, DELTAS, style, showzero=True)
+
+        expected = "".join(
+            from_timedelta(d, style, showzero=True) + "\n" for d in DELTAS
+        )
+        assert out.getvalue() == expected
+        assert written == len(expected)
+
+    @pytest.mark.parametrize("style", list(Style))
+    def test_binary(self, style: Style) -> None:
+        out = io.BytesIO()
+        written = write_many(out, DELTAS, style, (TDUnit.HOURS,))
+
+        expected = "".join(
+            from_timedelta(d, style, (TDUnit.HOURS,)) + "\n" for d in DELTAS
+        ).encode()
+        assert out.getvalue() == expected
+        assert written == len(expected)
+
+    def test_microseconds(self) -> None:
+        out = io.StringIO()
+        values = [0, -1500, 10**18, 1500]
+        write_many(out, values, Style.ABBREV, end=";")
+
+        assert out.getvalue() == "".join(
+            from_microseconds(v, Style.ABBREV) + ";" for v in values
+        )
+
+    def test_encoding(self) -> None:
+        out = io.BytesIO()
+        written = write_many(
+            out, [timedelta(hours=2)], locale="ru", encoding="utf-16-le", end=""
+        )
+
+        assert out.getvalue().decode("utf-16-le") == "2 часа"
+        assert written == len(out.getvalue())
+
+    def test_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.txt"
+        with path.open("wb", buffering=0) as out:
+            write_many(out, DELTAS, locale="de")
+        with path.open("w", encoding="utf-8") as out:
+            write_many(out, DELTAS, locale="de")
+
+        expected = "".join(from_timedelta(d, locale="de") + "\n" for d in DELTAS)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_batches_and_memo(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(writer, "BATCH_SIZE", 2)
+        monkeypatch.setattr(readabledelta, "MEMO_SIZE", 2)
+        writes: list[str] = []
+
+        class Out(io.StringIO):
+            def write(self, s: str) -> int:
+                writes.append(s)
+                return super().write(s)
+
+        out = Out()
+        written = write_many(out, DELTAS * 3)
+
+        expected = "".join(from_timedelta(d) + "\n" for d in DELTAS * 3)
+        assert out.getvalue() == expected
+        assert written == len(expected)
+        assert len(writes) == 9
+
+    def test_mode(self) -> None:
+        class Sink:
+            mode = "ab"
+
+            def __init__(self) -> None:
+                self.data: list[bytes] = []
+
+            def write(self, data: bytes) -> int:
+                self.data.append(data)
+                return len(data)
+
+        sink = Sink()
+        write_many(sink, [timedelta(seconds=1)])  # type: ignore[arg-type]
+
+        assert sink.data == [b"1 second\n"]
+
+    def test_error_keeps_earlier_records(self) -> None:
+        def deltas() -> Iterator[timedelta | int]:
+            yield timedelta(seconds=1)
+            yield 1.5  # type: ignore[misc]
+
+        out = io.StringIO()
+        with pytest.raises(TypeError):
+            write_many(out, deltas())
+
+        assert out.getvalue() == "1 second\n"
+
+    @pytest.mark.parametrize("out", [io.StringIO(), io.BytesIO()])
+    def test_write_error_not_repeated(
+        self, monkeypatch: pytest.MonkeyPatch, out: IO[Any]
+    ) -> None:
+        monkeypatch.setattr(writer, "BATCH_SIZE", 2)
+        writes: list[object] = []
+
+        def failing(data: object) -> int:
+            writes.append(data)
+            msg = "disk full"
+            raise OSError(msg)
+
+        monkeypatch.setattr(out, "write", failing)
+        with pytest.raises(OSError, match="disk full"):
+            write_many(out, DELTAS)
+
+        assert len(writes) == 1
+
+    def test_empty(self) -> None:
+        out = io.BytesIO()
+
+        assert write_many(out, []) == 0
+        assert out.getvalue() == b""
+
+
+class TestWriteTimedelta:
+    def test_text(self) -> None:
+        out = io.StringIO()
+        delta = timedelta(hours=1, minutes=2)
+
+        assert write_timedelta(out, delta, Style.SHORT, max_units=1) == 5
+        assert out.getvalue() == "1 hr\n"
+
+    def test_binary(self) -> None:
+        out = io.BytesIO()
+        delta = -timedelta(days=3, microseconds=5)
+
+        written = write_timedelta(out, delta, Style.ABBREV, end="")
+
+        assert out.getvalue() == from_timedelta(delta, Style.ABBREV).encode()
+        assert written == len(out.getvalue())
+
+    def test_invalid_units(self) -> None:
+        with pytest.raises(ValueError, match="units can only be the following"):
+            write_timedelta(io.StringIO(), timedelta(0), units=("months",))